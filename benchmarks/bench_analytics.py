@@ -0,0 +1,80 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from bench_export import _seed
+from sqlalchemy import func, select
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.analytics_rollups import BrewRollupService
+from coffee_backend.services.analytics_service import AnalyticsService
+
+
+def _scan(db, user_id) -> None:
+    db.execute(
+        select(Brew.method, func.max(Brew.score))
+        .where(Brew.user_id == user_id)
+        .group_by(Brew.method)
+    ).all()
+    db.execute(
+        select(func.date(Brew.brewed_at), func.avg(Brew.score))
+        .where(Brew.user_id == user_id, Brew.score.is_not(None))
+        .group_by(func.date(Brew.brewed_at))
+    ).all()
+
+
+def _rollups(db, user_id) -> None:
+    service = AnalyticsService(db)
+    service.best_per_method(user_id)
+    service.score_trend(user_id)
+
+
+def _timed(session_factory, user_id, read, repeat: int) -> float:
+    with session_factory() as db:
+        read(db, user_id)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            read(db, user_id)
+        return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dashboard analytics: brew scans vs daily rollups")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        session_factory = create_sessionmaker(engine)
+        print(
+            f"{'brews':>8} {'rollups':>8} {'rebuild s':>10} "
+            f"{'scan ms':>9} {'rollup ms':>10} {'speedup':>8}"
+        )
+        for rows in args.sizes:
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            user_id = _seed(session_factory, rows)
+            started = time.perf_counter()
+            with session_factory() as db:
+                rollups = BrewRollupService(db).rebuild(user_id)
+            rebuild = time.perf_counter() - started
+            scan = _timed(session_factory, user_id, _scan, args.repeat)
+            rollup = _timed(session_factory, user_id, _rollups, args.repeat)
+            print(
+                f"{rows:>8} {rollups:>8} {rebuild:>10.2f} "
+                f"{scan:>9.2f} {rollup:>10.2f} {scan / rollup:>7.1f}x"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
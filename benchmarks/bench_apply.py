@@ -0,0 +1,114 @@
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import optuna
+from fastapi.testclient import TestClient
+from optuna.trial import create_trial
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.session import create_engine_from_settings
+from coffee_backend.main import create_app
+from coffee_backend.services.optuna_bulk import bulk_add_trials
+
+STUDY_BODY = {"method_id": "aeropress", "variant_id": "aeropress_standard"}
+
+
+def _headers(client: TestClient, email: str) -> dict[str, str]:
+    client.post("/api/v1/auth/register", json={"email": email, "password": "pass123"})
+    token = client.post("/api/v1/auth/login", json={"email": email, "password": "pass123"}).json()[
+        "access_token"
+    ]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _grow_study(client: TestClient, study_key: str, size: int, seed: int) -> None:
+    storage = client.app.state.optuna_storage
+    study = optuna.load_study(study_name=study_key, storage=storage)
+    trial = study.trials[0]
+    rng = random.Random(seed)
+    trials = [
+        create_trial(
+            params=trial.params, distributions=trial.distributions, value=rng.uniform(0, 10)
+        )
+        for _ in range(size)
+    ]
+    bulk_add_trials(study, storage, trials)
+
+
+def _apply_once(client: TestClient, headers: dict[str, str], suggestion: dict) -> float:
+    brew = client.post(
+        "/api/v1/brews",
+        headers=headers,
+        json={
+            "method": "aeropress",
+            "variant_id": "aeropress_standard",
+            "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+            "brewed_at": datetime.now(timezone.utc).isoformat(),
+            "score": 8.0,
+            "status": "ok",
+        },
+    ).json()
+    started = time.perf_counter()
+    response = client.post(
+        f"/api/v1/optimisation/suggestions/{suggestion['id']}/apply",
+        headers=headers,
+        json={"brew_id": brew["id"], "score": 8.0, "failed": False},
+    )
+    elapsed = time.perf_counter() - started
+    response.raise_for_status()
+    return elapsed
+
+
+def run(settings: Settings, sizes: list[int], applies: int, seed: int) -> dict[int, float]:
+    results: dict[int, float] = {}
+    with TestClient(create_app(settings)) as client:
+        for size in sizes:
+            headers = _headers(client, f"bench-apply-{size}@example.com")
+            first = client.post("/api/v1/optimisation/suggest", headers=headers, json=STUDY_BODY)
+            first.raise_for_status()
+            _grow_study(client, first.json()["study_key"], size, seed)
+            suggestions = client.post(
+                "/api/v1/optimisation/suggest/batch",
+                headers=headers,
+                json=STUDY_BODY | {"count": applies + 1},
+            )
+            suggestions.raise_for_status()
+            timings = [
+                _apply_once(client, headers, suggestion) for suggestion in suggestions.json()
+            ]
+            results[size] = statistics.median(timings[1:]) * 1000
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply latency as the study grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--applies", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings = Settings(database_url=database_url, jwt_secret="bench-secret")
+        engine = create_engine_from_settings(settings)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        results = run(settings, sorted(args.sizes), args.applies, args.seed)
+
+    smallest = results[min(results)]
+    print(f"{'trials':>7} {'apply p50':>10} {'vs smallest':>12}")
+    for size, latency in results.items():
+        print(f"{size:>7} {latency:>8.1f}ms {latency / smallest:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import csv
+import io
+import json
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import orjson
+from bench_export import _seed
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.columnar_export import (
+    ARROW_FORMAT,
+    NDJSON_FORMAT,
+    PARQUET_FORMAT,
+)
+from coffee_backend.services.import_export_service import ImportExportService
+
+
+def _read_csv(payload: bytes) -> int:
+    rows = 0
+    for row in csv.DictReader(io.StringIO(payload.decode("utf-8"))):
+        json.loads(row["parameters"])
+        json.loads(row["extra_data"])
+        float(row["score"]) if row["score"] else None
+        rows += 1
+    return rows
+
+
+def _read_ndjson(payload: bytes) -> int:
+    return sum(1 for line in payload.splitlines() if orjson.loads(line))
+
+
+def _read_parquet(payload: bytes) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    return pq.read_table(pa.BufferReader(payload)).num_rows
+
+
+def _read_arrow(payload: bytes) -> int:
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(payload).read_all().num_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CSV vs columnar export size and write/read time")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = create_sessionmaker(engine)
+        user_id = _seed(session_factory, args.rows)
+
+        formats = {
+            "csv": (lambda service: service.stream_csv(user_id), _read_csv),
+            NDJSON_FORMAT: (
+                lambda service: service.stream_columnar(user_id, NDJSON_FORMAT),
+                _read_ndjson,
+            ),
+        }
+        if find_spec("pyarrow") is not None:
+            for name, reader in ((PARQUET_FORMAT, _read_parquet), (ARROW_FORMAT, _read_arrow)):
+                formats[name] = (
+                    lambda service, name=name: service.stream_columnar(user_id, name),
+                    reader,
+                )
+        else:
+            print("pyarrow not installed: parquet/arrow skipped (pip install -e .[columnar])")
+
+        print(f"{args.rows} brews")
+        print(f"{'format':<8} {'MiB':>7} {'write s':>8} {'read s':>8} {'rows read':>10}")
+        for name, (stream, reader) in formats.items():
+            started = time.perf_counter()
+            with session_factory() as db:
+                payload = b"".join(stream(ImportExportService(db)))
+            written = time.perf_counter() - started
+            started = time.perf_counter()
+            rows = reader(payload)
+            read = time.perf_counter() - started
+            print(f"{name:<8} {len(payload) / 2**20:>7.2f} {written:>8.2f} {read:>8.2f} {rows:>10}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.session import create_engine_from_settings
+from coffee_backend.main import create_app
+
+PATHS = (
+    "/api/v1/methods",
+    "/api/v1/methods/aeropress/aeropress_standard",
+    "/api/v1/brews?limit=50",
+    "/api/v1/analytics/dashboard",
+)
+
+
+def _rate(client: TestClient, path: str, headers: dict[str, str], requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full GETs vs If-None-Match revalidation")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--brews", type=int, default=500)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings = Settings(database_url=database_url, jwt_secret="bench-secret")
+        engine = create_engine_from_settings(settings)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        with TestClient(create_app(settings)) as client:
+            credentials = {"email": "bench@example.com", "password": "pass123"}
+            client.post("/api/v1/auth/register", json=credentials)
+            token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            for index in range(args.brews):
+                client.post(
+                    "/api/v1/brews",
+                    headers=headers,
+                    json={
+                        "method": "aeropress",
+                        "variant_id": "aeropress_standard",
+                        "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+                        "brewed_at": f"2024-01-{index % 28 + 1:02d}T08:00:00+00:00",
+                        "score": index % 10,
+                    },
+                )
+
+            print(f"{'path':<46} {'200 req/s':>10} {'304 req/s':>10} {'speedup':>8}")
+            for path in PATHS:
+                etag = client.get(path, headers=headers).headers["etag"]
+                full = _rate(client, path, headers, args.requests)
+                revalidated = _rate(client, path, {**headers, "If-None-Match": etag}, args.requests)
+                print(f"{path:<46} {full:>10.0f} {revalidated:>10.0f} {revalidated / full:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from functools import partial
+from pathlib import Path
+
+from bench_export import _seed
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.analytics_engine import compute_dashboard, load_brew_arrays
+
+
+def _loops(arrays) -> None:
+    by_method = defaultdict(list)
+    by_day = defaultdict(list)
+    by_grind = defaultdict(list)
+    grind = arrays.numeric["grind_size"]
+    for index in range(arrays.size):
+        score = float(arrays.score[index])
+        if score != score:
+            continue
+        by_method[int(arrays.method[index])].append(score)
+        by_day[int(arrays.day[index])].append(score)
+        by_grind[int(grind[index])].append(score)
+    for groups in (by_method, by_day, by_grind):
+        for scores in groups.values():
+            statistics.fmean(scores)
+            max(scores)
+            if len(scores) > 1:
+                statistics.quantiles(scores, n=10, method="inclusive")
+
+
+def _timed(action, repeat: int) -> float:
+    action()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vectorised analytics dashboard cost")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        session_factory = create_sessionmaker(engine)
+        print(
+            f"{'brews':>8} {'load ms':>9} {'numpy ms':>9} {'loops ms':>9} "
+            f"{'cold ms':>9} {'cached ms':>10}"
+        )
+        for rows in args.sizes:
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            user_id = _seed(session_factory, rows)
+            with session_factory() as db:
+                load = _timed(partial(load_brew_arrays, db, user_id), args.repeat)
+                arrays = load_brew_arrays(db, user_id)
+            vectorised = _timed(partial(compute_dashboard, arrays), args.repeat)
+            loops = _timed(partial(_loops, arrays), args.repeat)
+            print(
+                f"{rows:>8} {load:>9.1f} {vectorised:>9.1f} {loops:>9.1f} "
+                f"{load + vectorised:>9.1f} {vectorised:>10.1f}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
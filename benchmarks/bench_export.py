@@ -0,0 +1,99 @@
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import insert
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.enums import BrewStatus
+from coffee_backend.db.models.user import User
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.import_export_service import ImportExportService
+
+
+def _seed(session_factory, rows: int) -> object:
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with session_factory() as db:
+        user = User(email=f"bench-{uuid4()}@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        for offset in range(0, rows, 5000):
+            db.execute(
+                insert(Brew),
+                [
+                    {
+                        "user_id": user.id,
+                        "method": "aeropress",
+                        "variant_id": "aeropress_standard",
+                        "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+                        "brewed_at": started + timedelta(minutes=index),
+                        "score": index % 10,
+                        "status": BrewStatus.OK,
+                        "comments": "Bright and sweet.",
+                    }
+                    for index in range(offset, min(rows, offset + 5000))
+                ],
+            )
+        db.commit()
+        return user.id
+
+
+def _stream(session_factory, user_id, compress: bool) -> tuple[float, float, int]:
+    size = 0
+    first = None
+    started = time.perf_counter()
+    with session_factory() as db:
+        for chunk in ImportExportService(db).stream_csv(user_id, compress):
+            first = first if first is not None else time.perf_counter() - started
+            size += len(chunk)
+    return first * 1000, time.perf_counter() - started, size
+
+
+def _peak(session_factory, user_id, compress: bool) -> float:
+    tracemalloc.start()
+    with session_factory() as db:
+        for _ in ImportExportService(db).stream_csv(user_id, compress):
+            pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming CSV export latency and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        session_factory = create_sessionmaker(engine)
+        print(
+            f"{'brews':>8} {'gzip':>5} {'first byte':>11} {'seconds':>8} "
+            f"{'rows/s':>9} {'MiB out':>8} {'peak heap MiB':>14}"
+        )
+        for rows in args.sizes:
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            user_id = _seed(session_factory, rows)
+            for compress in (False, True):
+                first, elapsed, size = _stream(session_factory, user_id, compress)
+                peak = _peak(session_factory, user_id, compress)
+                print(
+                    f"{rows:>8} {str(compress).lower():>5} {first:>9.1f}ms {elapsed:>8.2f} "
+                    f"{rows / elapsed:>9.0f} {size / 2**20:>8.1f} {peak:>14.2f}"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import csv
+import random
+import resource
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.user import User
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.schemas.import_export import CSVImportRequest
+from coffee_backend.services.import_export_service import ImportExportService
+
+LEGACY_HEADER = [
+    "date",
+    "brand",
+    "coffee amount",
+    "grinder setting",
+    "anti-static water",
+    "temperature",
+    "brewing time",
+    "pressing time",
+    "comments",
+    "failed",
+    "Raafat",
+    "David",
+    "Richard",
+    "Moh",
+]
+
+
+def write_legacy_csv(path: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    started = datetime(2024, 1, 9, 8, 0, tzinfo=timezone.utc)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(LEGACY_HEADER)
+        for index in range(rows):
+            reviewers = [
+                round(rng.uniform(2.0, 9.0), 1) if rng.random() < 0.5 else "" for _ in range(4)
+            ]
+            writer.writerow(
+                [
+                    (started + timedelta(minutes=index)).isoformat(),
+                    rng.choice(["Vogel Brazil", "Kenya AA", "Ethiopia Guji"]),
+                    rng.randint(10, 22),
+                    rng.randint(4, 60),
+                    rng.choice([50, 100, 150, 200, 300]),
+                    rng.choice([85, 90, 95, 100]),
+                    rng.randint(35, 280),
+                    rng.randint(6, 120),
+                    rng.choice(["", "", "Bright and sweet.", "Too bitter, grind coarser."]),
+                    "",
+                    *reviewers,
+                ]
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming CSV import throughput and memory")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "aeropress.data.csv"
+        write_legacy_csv(data_path, args.rows, args.seed)
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = create_sessionmaker(engine)
+        request = CSVImportRequest(
+            method="aeropress", variant_id="aeropress_standard", data_path=str(data_path)
+        )
+
+        with session_factory() as db:
+            user = User(email=f"bench-{uuid4()}@example.com", hashed_password="x")
+            db.add(user)
+            db.commit()
+            user_id = user.id
+
+        print(
+            f"{'run':<10} {'rows':>8} {'inserted':>9} {'skipped':>8} "
+            f"{'seconds':>8} {'rows/s':>9} {'peak RSS MiB':>13}"
+        )
+        for label in ("fresh", "re-import"):
+            started = time.perf_counter()
+            with session_factory() as db:
+                result = ImportExportService(db).import_csv(user_id, request)
+            elapsed = time.perf_counter() - started
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+            print(
+                f"{label:<10} {result.processed:>8} {result.inserted:>9} {result.skipped:>8} "
+                f"{elapsed:>8.2f} {result.processed / elapsed:>9.0f} {peak / 2**20:>13.1f}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
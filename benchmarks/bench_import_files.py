@@ -0,0 +1,75 @@
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from bench_import import write_legacy_csv
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.user import User
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.schemas.import_export import CSVImportRequest
+from coffee_backend.services.import_export_service import ImportExportService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Multi-file CSV import throughput per worker count"
+    )
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        data_dir.mkdir()
+        for index in range(args.files):
+            write_legacy_csv(
+                data_dir / f"aeropress.{index:03d}.csv", args.rows, args.seed + index * 7919
+            )
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        session_factory = create_sessionmaker(engine)
+
+        print(f"{args.files} files x {args.rows} rows, {os.cpu_count()} CPUs")
+        print(
+            f"{'workers':>7} {'rows':>8} {'inserted':>9} {'seconds':>8} "
+            f"{'rows/s':>9} {'speed-up':>9}"
+        )
+        baseline = None
+        for workers in args.workers:
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            with session_factory() as db:
+                user = User(email=f"bench-{uuid4()}@example.com", hashed_password="x")
+                db.add(user)
+                db.commit()
+                user_id = user.id
+            request = CSVImportRequest(
+                method="aeropress",
+                variant_id="aeropress_standard",
+                data_path=str(data_dir),
+                workers=workers,
+            )
+            started = time.perf_counter()
+            with session_factory() as db:
+                result = ImportExportService(db).import_csv(user_id, request)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>7} {result.processed:>8} {result.inserted:>9} {elapsed:>8.2f} "
+                f"{result.processed / elapsed:>9.0f} {baseline / elapsed:>8.2f}x"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import argparse
+import cProfile
+import pstats
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from bench_import import write_legacy_csv
+
+from coffee_backend.services.import_export_service import parse_csv_chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-row CSV parse and hash cost, profiled")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "aeropress.data.csv"
+        write_legacy_csv(data_path, args.rows, args.seed)
+        job = (str(data_path), uuid4(), "aeropress", "aeropress_standard", None, 1, args.rows)
+
+        started = time.perf_counter()
+        parsed = parse_csv_chunk(*job)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{parsed.processed} rows parsed, {len(parsed.errors)} errors: {elapsed:.2f}s, "
+            f"{elapsed / parsed.processed * 1e6:.1f}us/row, {parsed.processed / elapsed:.0f} rows/s"
+        )
+
+        profiler = cProfile.Profile()
+        profiler.runcall(parse_csv_chunk, *job)
+        stats = pstats.Stats(profiler)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from bench_export import _seed
+from sqlalchemy import select
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.brew_service import BREW_KEYSET_ORDERS, BrewService
+from coffee_backend.services.pagination import encode_cursor
+
+
+def _median_ms(call, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offset vs keyset page latency by depth")
+    parser.add_argument("--brews", type=int, default=200_000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1_000, 10_000, 100_000])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = create_sessionmaker(engine)
+        user_id = _seed(session_factory, args.brews)
+        order = BREW_KEYSET_ORDERS[("date", "desc")]
+
+        print(f"{args.brews} brews, page size {args.page_size}, sort by date desc")
+        print(f"{'depth':>8} {'offset p50':>11} {'cursor p50':>11} {'speed-up':>9}")
+        with session_factory() as db:
+            service = BrewService(db)
+            for depth in args.depths:
+                page = depth // args.page_size + 1
+                cursor = None
+                if depth:
+                    anchor = db.scalar(
+                        select(Brew)
+                        .where(Brew.user_id == user_id)
+                        .order_by(*order.order_by())
+                        .offset(depth - 1)
+                        .limit(1)
+                    )
+                    cursor = encode_cursor(order, anchor.brewed_at, anchor.id)
+                offset_ms = _median_ms(
+                    lambda page=page: service.list_brews(
+                        user_id, page=page, page_size=args.page_size
+                    ),
+                    args.repeats,
+                )
+                cursor_ms = _median_ms(
+                    lambda cursor=cursor: service.list_brews_page(
+                        user_id, cursor=cursor, limit=args.page_size
+                    ),
+                    args.repeats,
+                )
+                db.expunge_all()
+                print(
+                    f"{depth:>8} {offset_ms:>9.2f}ms {cursor_ms:>9.2f}ms "
+                    f"{offset_ms / cursor_ms:>8.1f}x"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
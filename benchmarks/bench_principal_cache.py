@@ -0,0 +1,83 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.user import User
+from coffee_backend.db.session import create_engine_from_settings
+from coffee_backend.main import create_app
+from coffee_backend.services.principal_cache import PrincipalCache, get_principal_cache
+
+
+def _per_call_us(callable_, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        callable_()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def _rate(client: TestClient, path: str, headers: dict[str, str], requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request user lookup vs principal cache")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings = Settings(database_url=database_url, jwt_secret="bench-secret")
+        engine = create_engine_from_settings(settings)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        with TestClient(create_app(settings)) as client:
+            credentials = {"email": "bench@example.com", "password": "pass123"}
+            client.post("/api/v1/auth/register", json=credentials)
+            token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+
+            with client.app.state.db_sessionmaker() as db:
+                user_id = db.scalars(select(User.id)).one()
+                uncached, warm = PrincipalCache(0, 60.0), PrincipalCache(16, 60.0)
+
+                def orm_lookup() -> None:
+                    db.scalar(select(User).where(User.id == user_id))
+                    db.expunge_all()
+
+                print(f"{'lookup':<24} {'us/call':>10}")
+                for name, lookup in (
+                    ("orm row", orm_lookup),
+                    ("principal, uncached", lambda: uncached.get(db, user_id)),
+                    ("principal, cached", lambda: warm.get(db, user_id)),
+                ):
+                    print(f"{name:<24} {_per_call_us(lookup, args.lookups):>10.2f}")
+
+            cache = get_principal_cache()
+            max_entries = cache.max_entries
+            print(f"\n{'path':<24} {'uncached':>10} {'cached':>10} {'speedup':>8}")
+            for path in ("/api/v1/auth/me", "/api/v1/beans"):
+                cache.max_entries = 0
+                uncached_rate = _rate(client, path, headers, args.requests)
+                cache.max_entries = max_entries
+                cached_rate = _rate(client, path, headers, args.requests)
+                print(
+                    f"{path:<24} {uncached_rate:>10.0f} {cached_rate:>10.0f} "
+                    f"{cached_rate / uncached_rate:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.method_profile_registry import load_method_profile_registry
+from coffee_backend.services.method_profile_service import seed_method_profiles
+
+
+def _query_lookup(db) -> None:
+    profiles = list(
+        db.scalars(
+            select(MethodProfile)
+            .where(MethodProfile.method_id == "aeropress")
+            .order_by(MethodProfile.variant_id.asc(), MethodProfile.schema_version.desc())
+        )
+    )
+    variant_id = profiles[0].variant_id
+    db.scalar(
+        select(MethodProfile)
+        .where(MethodProfile.method_id == "aeropress")
+        .where(MethodProfile.variant_id == variant_id)
+        .order_by(MethodProfile.schema_version.desc())
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Method profile lookups: queries vs registry")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine_from_settings(
+            Settings(database_url=database_url, jwt_secret="bench-secret")
+        )
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = create_sessionmaker(engine)
+        with session_factory() as db:
+            seed_method_profiles(db)
+            started = time.perf_counter()
+            registry = load_method_profile_registry(db)
+            load = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for _ in range(args.lookups):
+                _query_lookup(db)
+            queried = (time.perf_counter() - started) / args.lookups * 1e6
+
+        started = time.perf_counter()
+        for _ in range(args.lookups):
+            registry.get("aeropress", registry.default_variant("aeropress"))
+        indexed = (time.perf_counter() - started) / args.lookups * 1e6
+        engine.dispose()
+
+    print(f"registry load:        {load:10.2f} ms")
+    print(f"query lookup:         {queried:10.2f} us")
+    print(f"registry lookup:      {indexed:10.2f} us")
+    print(f"speed-up:             {queried / indexed:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
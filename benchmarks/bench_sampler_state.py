@@ -0,0 +1,123 @@
+import argparse
+import random
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from uuid import uuid4
+
+import optuna
+from optuna.trial import create_trial
+
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.compiled_profile import build_compiled_profile
+from coffee_backend.services.method_profile_service import INITIAL_METHOD_PROFILES
+from coffee_backend.services.optuna_bulk import bulk_add_trials
+from coffee_backend.services.sampler_state import SamplerStateStore, StatefulTPESampler
+
+
+def _profile(variant_id: str):
+    payload = next(p for p in INITIAL_METHOD_PROFILES if p["variant_id"] == variant_id)
+    return build_compiled_profile(MethodProfile(**payload))
+
+
+def _seed_study(storage: optuna.storages.RDBStorage, profile, count: int, seed: int) -> str:
+    study_name = f"bench-{uuid4()}"
+    study = optuna.create_study(study_name=study_name, storage=storage, direction="maximize")
+    sampler_study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=seed))
+    rng = random.Random(seed)
+    trials = [
+        create_trial(
+            params=profile.suggest(sampler_study.ask()),
+            distributions=profile.distributions,
+            value=rng.uniform(0.0, 10.0),
+        )
+        for _ in range(count)
+    ]
+    bulk_add_trials(study, storage, trials)
+    return study_name
+
+
+def _timed(method, spent: list[float]):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            spent.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+def run(
+    storage: optuna.storages.RDBStorage,
+    study_name: str,
+    profile,
+    sampler: optuna.samplers.BaseSampler,
+    cycles: int,
+) -> tuple[float, float, float]:
+    sampling: list[float] = []
+    sampler.sample_relative = _timed(sampler.sample_relative, sampling)
+    sampler.sample_independent = _timed(sampler.sample_independent, sampling)
+    study = optuna.load_study(study_name=study_name, storage=storage, sampler=sampler)
+    rng = random.Random(0)
+    timings = []
+    for cycle in range(cycles + 1):
+        if cycle == 1:
+            sampling.clear()
+        started = time.perf_counter()
+        trial = study.ask()
+        profile.suggest(trial)
+        timings.append(time.perf_counter() - started)
+        study.tell(trial, rng.uniform(0.0, 10.0))
+    return timings[0] * 1000, sum(timings[1:]) / cycles * 1000, sum(sampling) / cycles * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Suggest latency: full TPE refit vs cached state")
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--variant", default="aeropress_standard")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    profile = _profile(args.variant)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        storage = optuna.storages.RDBStorage(url=url)
+        print(f"{args.trials} completed trials, {args.cycles} suggest/apply cycles per mode")
+        print(f"{'mode':<34} {'first ask':>10} {'mean ask':>10} {'sampler':>10}")
+        for multivariate in (False, True):
+            options = {"seed": args.seed, "multivariate": multivariate, "constant_liar": True}
+            label = "multivariate" if multivariate else "independent"
+            study_name = _seed_study(storage, profile, args.trials, args.seed)
+            snapshot_dir = Path(tmp) / f"snapshots-{label}"
+            store = SamplerStateStore(max_entries=16, snapshot_dir=str(snapshot_dir))
+            modes = {
+                "refit": optuna.samplers.TPESampler(**options),
+                "cached": StatefulTPESampler(**options, store=store),
+            }
+            results = {}
+            for mode, sampler in modes.items():
+                results[mode] = run(storage, study_name, profile, sampler, args.cycles)
+            store.save(study_name)
+            store.clear()
+            restored = StatefulTPESampler(**options, store=store)
+            results["cached (from snapshot)"] = run(
+                storage, study_name, profile, restored, args.cycles
+            )
+            for mode, (first, mean, sampling) in results.items():
+                print(f"{label + ' ' + mode:<34} {first:>8.1f}ms {mean:>8.1f}ms {sampling:>8.1f}ms")
+            refit, cached = results["refit"], results["cached"]
+            print(
+                f"{label + ' speed-up':<34} {'':>10} {refit[1] / cached[1]:>9.1f}x "
+                f"{refit[2] / cached[2]:>9.1f}x"
+            )
+        storage.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import math
+import time
+import warnings
+
+import optuna
+
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.compiled_profile import build_compiled_profile
+from coffee_backend.services.method_profile_service import INITIAL_METHOD_PROFILES
+from coffee_backend.services.sampler_registry import (
+    SAMPLER_BUILDERS,
+    SamplerConfig,
+    available_samplers,
+    build_sampler,
+)
+
+VARIANTS = {
+    "tpe-multivariate": {"name": "tpe", "multivariate": True},
+    "tpe-group": {"name": "tpe", "group": True},
+}
+
+
+def _profile(variant_id: str):
+    payload = next(p for p in INITIAL_METHOD_PROFILES if p["variant_id"] == variant_id)
+    return build_compiled_profile(MethodProfile(**payload))
+
+
+def _objective(profile, params: dict[str, object]) -> float:
+    penalty = 0.0
+    for name, distribution in profile.distributions.items():
+        if not hasattr(distribution, "low"):
+            continue
+        span = float(distribution.high - distribution.low) or 1.0
+        optimum = distribution.low + 0.62 * span
+        penalty += ((float(params[name]) - optimum) / span) ** 2
+    return 10.0 * math.exp(-3.0 * penalty)
+
+
+def run(profile, config: SamplerConfig, trials: int) -> tuple[float, list[float]]:
+    study = optuna.create_study(direction="maximize", sampler=build_sampler(config))
+    ask_seconds = 0.0
+    checkpoints: list[float] = []
+    for number in range(1, trials + 1):
+        started = time.perf_counter()
+        trial = study.ask()
+        params = profile.suggest(trial)
+        ask_seconds += time.perf_counter() - started
+        study.tell(trial, _objective(profile, params))
+        if number in {trials // 4, trials // 2, trials}:
+            checkpoints.append(study.best_value)
+    return ask_seconds / trials * 1000, checkpoints
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Suggest latency and convergence per sampler")
+    parser.add_argument("--trials", type=int, default=100)
+    parser.add_argument("--variant", default="v60_default")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    profile = _profile(args.variant)
+    configs = {name: {"name": name} for name in SAMPLER_BUILDERS} | VARIANTS
+    available = set(available_samplers())
+
+    quarter, half = args.trials // 4, args.trials // 2
+    print(
+        f"{'sampler':<18} {'ask ms':>8} {'best@' + str(quarter):>9} "
+        f"{'best@' + str(half):>9} {'best@' + str(args.trials):>9}"
+    )
+    for label, options in configs.items():
+        if options["name"] not in available:
+            print(f"{label:<18} skipped (optional dependencies missing)")
+            continue
+        config = SamplerConfig(seed=args.seed, **options)
+        ask_ms, checkpoints = run(profile, config, args.trials)
+        print(f"{label:<18} {ask_ms:>8.2f} " + " ".join(f"{value:>9.3f}" for value in checkpoints))
+
+
+if __name__ == "__main__":
+    main()
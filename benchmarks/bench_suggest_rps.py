@@ -0,0 +1,73 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import optuna
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from coffee_backend.core.config import Settings
+from coffee_backend.db.base import Base
+from coffee_backend.db.session import (
+    create_engine_from_settings,
+    create_optuna_storage,
+    get_optuna_storage,
+)
+from coffee_backend.main import create_app
+
+
+def _per_request_storage(settings: Settings):
+    def dependency(_: Request) -> optuna.storages.RDBStorage:
+        return create_optuna_storage(settings)
+
+    return dependency
+
+
+def run(settings: Settings, requests: int, per_request_storage: bool) -> float:
+    app = create_app(settings)
+    if per_request_storage:
+        app.dependency_overrides[get_optuna_storage] = _per_request_storage(settings)
+
+    with TestClient(app) as client:
+        email = f"bench-{per_request_storage}@example.com"
+        client.post("/api/v1/auth/register", json={"email": email, "password": "pass123"})
+        token = client.post(
+            "/api/v1/auth/login", json={"email": email, "password": "pass123"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        body = {"method_id": "aeropress", "variant_id": "aeropress_standard"}
+        client.post("/api/v1/optimisation/suggest", headers=headers, json=body)
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = client.post("/api/v1/optimisation/suggest", headers=headers, json=body)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Requests per second on /optimisation/suggest")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        settings = Settings(database_url=database_url, jwt_secret="bench-secret")
+        engine = create_engine_from_settings(settings)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        before = run(settings, args.requests, per_request_storage=True)
+        after = run(settings, args.requests, per_request_storage=False)
+
+    print(f"per-request RDBStorage: {before:8.1f} req/s")
+    print(f"shared RDBStorage:      {after:8.1f} req/s")
+    print(f"speed-up:               {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import random
+import time
+
+import numpy as np
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.services.parameter_validation import validate_method_parameters
+from coffee_backend.services.validation_engine import get_registry_validator
+
+
+def _rows(count: int, seed: int) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "grind_size": rng.randint(0, 16),
+            "water_temp": rng.uniform(70.0, 101.0),
+            "brew_time_sec": rng.randint(30, 300),
+            "agitation": rng.choice(["low", "medium", "high"]),
+        }
+        for _ in range(count)
+    ]
+
+
+def per_row(rows: list[dict[str, object]]) -> int:
+    invalid = 0
+    for params in rows:
+        try:
+            validate_method_parameters("aeropress", params)
+        except ValidationError:
+            invalid += 1
+    return invalid
+
+
+def columnar(columns: dict[str, np.ndarray], count: int) -> int:
+    validator = get_registry_validator("aeropress")
+    return int(validator.validate_columns(columns, count).row_errors.sum())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-row vs columnar parameter validation")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows, args.seed)
+    columns = {
+        "grind_size": np.array([row["grind_size"] for row in rows], dtype=np.int64),
+        "water_temp": np.array([row["water_temp"] for row in rows], dtype=np.float64),
+        "brew_time_sec": np.array([row["brew_time_sec"] for row in rows], dtype=np.int64),
+        "agitation": np.array([row["agitation"] for row in rows], dtype=object),
+    }
+
+    started = time.perf_counter()
+    row_invalid = per_row(rows)
+    row_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    column_invalid = columnar(columns, args.rows)
+    column_elapsed = time.perf_counter() - started
+
+    assert row_invalid == column_invalid, (row_invalid, column_invalid)
+    print(f"rows: {args.rows}  invalid: {row_invalid}")
+    print(f"per-row:  {row_elapsed * 1000:9.1f} ms")
+    print(f"columnar: {column_elapsed * 1000:9.1f} ms")
+    print(f"speed-up: {row_elapsed / column_elapsed:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
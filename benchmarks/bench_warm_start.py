@@ -0,0 +1,75 @@
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import optuna
+from optuna.trial import create_trial
+
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.compiled_profile import build_compiled_profile
+from coffee_backend.services.method_profile_service import INITIAL_METHOD_PROFILES
+from coffee_backend.services.optuna_bulk import bulk_add_trials
+
+
+def _trials(count: int, seed: int) -> list[optuna.trial.FrozenTrial]:
+    payload = next(p for p in INITIAL_METHOD_PROFILES if p["variant_id"] == "aeropress_standard")
+    profile = build_compiled_profile(MethodProfile(**payload))
+    sampler_study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=seed))
+    rng = random.Random(seed)
+    trials = []
+    for _ in range(count):
+        params = profile.suggest(sampler_study.ask())
+        key = f"brew:{uuid4()}"
+        trials.append(
+            create_trial(
+                params=params,
+                distributions=profile.distributions,
+                value=rng.uniform(0.0, 10.0),
+                user_attrs={"warm_start": True, "warm_start_key": key},
+            )
+        )
+    return trials
+
+
+def run(storage: optuna.storages.RDBStorage, trials: list, bulk: bool) -> float:
+    study = optuna.create_study(
+        study_name=f"bench-{uuid4()}", storage=storage, direction="maximize"
+    )
+    started = time.perf_counter()
+    if bulk:
+        bulk_add_trials(study, storage, trials)
+    else:
+        for trial in trials:
+            study.add_trial(trial)
+    elapsed = time.perf_counter() - started
+    assert len(study.get_trials(deepcopy=False)) == len(trials)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm-start trial insertion: per-trial vs bulk")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        storage = optuna.storages.RDBStorage(url=url)
+        print(f"{'brews':>6} {'add_trial':>12} {'bulk':>12} {'speed-up':>9}")
+        for size in args.sizes:
+            trials = _trials(size, args.seed)
+            single = run(storage, trials, bulk=False)
+            bulk = run(storage, trials, bulk=True)
+            print(
+                f"{size:>6} {single * 1000:>10.1f}ms {bulk * 1000:>10.1f}ms {single / bulk:>8.1f}x"
+            )
+        storage.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
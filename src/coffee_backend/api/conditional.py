@@ -0,0 +1,46 @@
+import hashlib
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from coffee_backend import __version__
+from coffee_backend.services.user_service import UserService
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.blake2b(repr((__version__, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str, cache_control: str
+) -> Response | None:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if cache_control == PRIVATE_CACHE_CONTROL:
+        headers["Vary"] = "Authorization"
+    response.headers.update(headers)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def user_conditional_response(
+    request: Request, response: Response, db: Session, user_id: UUID
+) -> Response | None:
+    etag = make_etag(
+        request.url.path,
+        str(user_id),
+        UserService(db).get_brew_version(user_id),
+        sorted(request.query_params.multi_items()),
+    )
+    return conditional_response(request, response, etag, PRIVATE_CACHE_CONTROL)
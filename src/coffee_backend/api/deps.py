@@ -1,27 +1,68 @@
+from concurrent.futures import Executor
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from coffee_backend.core.security import decode_access_token
 from coffee_backend.db.models.user import User
 from coffee_backend.db.session import get_db
+from coffee_backend.services.method_profile_registry import (
+    MethodProfileRegistry,
+    get_method_profile_registry,
+)
+from coffee_backend.services.principal_cache import Principal, get_principal_cache
+from coffee_backend.services.warm_start_jobs import WarmStartJobManager
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(
+def _user_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+
+def get_current_principal(
     db: Annotated[Session, Depends(get_db)],
     token: Annotated[str, Depends(oauth2_scheme)],
-) -> User:
+) -> Principal:
     try:
         user_id: UUID = decode_access_token(token)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
-    user = db.scalar(select(User).where(User.id == user_id))
+    principal = get_principal_cache().get(db, user_id)
+    if principal is None:
+        raise _user_not_found()
+    return principal
+
+
+def get_current_user_id(principal: Annotated[Principal, Depends(get_current_principal)]) -> UUID:
+    return principal.id
+
+
+def get_current_user(
+    db: Annotated[Session, Depends(get_db)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
+) -> User:
+    user = db.get(User, principal.id)
     if user is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        get_principal_cache().invalidate(principal.id)
+        raise _user_not_found()
     return user
+
+
+def get_warm_start_jobs(request: Request) -> WarmStartJobManager:
+    jobs: WarmStartJobManager | None = getattr(request.app.state, "warm_start_jobs", None)
+    if jobs is None:
+        raise RuntimeError("Warm start job manager is not initialised on app.state")
+    return jobs
+
+
+def get_import_executor(request: Request) -> Executor | None:
+    executor: Executor | None = getattr(request.app.state, "import_executor", None)
+    return executor
+
+
+def get_profile_registry(db: Annotated[Session, Depends(get_db)]) -> MethodProfileRegistry:
+    return get_method_profile_registry(db)
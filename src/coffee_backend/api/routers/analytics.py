@@ -1,25 +1,53 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
-from coffee_backend.db.models.user import User
+from coffee_backend.api.conditional import user_conditional_response
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.db.session import get_db
 from coffee_backend.services.analytics_service import AnalyticsService
+from coffee_backend.services.principal_cache import Principal
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
-@router.get("/best")
+@router.get("/best", response_model=dict[str, dict[str, float | str]])
 def best(
-    user: Annotated[User, Depends(get_current_user)], db: Annotated[Session, Depends(get_db)]
-) -> dict[str, dict[str, float | str]]:
+    request: Request,
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+) -> dict[str, dict[str, float | str]] | Response:
+    not_modified = user_conditional_response(request, response, db, user.id)
+    if not_modified is not None:
+        return not_modified
     return AnalyticsService(db).best_per_method(user.id)
 
 
-@router.get("/trend")
+@router.get("/trend", response_model=list[dict[str, float | str]])
 def trend(
-    user: Annotated[User, Depends(get_current_user)], db: Annotated[Session, Depends(get_db)]
-) -> list[dict[str, float | str]]:
+    request: Request,
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+) -> list[dict[str, float | str]] | Response:
+    not_modified = user_conditional_response(request, response, db, user.id)
+    if not_modified is not None:
+        return not_modified
     return AnalyticsService(db).score_trend(user.id)
+
+
+@router.get("/dashboard", response_model=dict[str, object])
+def dashboard(
+    request: Request,
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    window: Annotated[int, Query(ge=1, le=365)] = 7,
+    bins: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> dict[str, object] | Response:
+    not_modified = user_conditional_response(request, response, db, user.id)
+    if not_modified is not None:
+        return not_modified
+    return AnalyticsService(db).dashboard(user.id, window=window, bins=bins)
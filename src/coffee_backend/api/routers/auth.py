@@ -4,11 +4,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.core.security import create_access_token
 from coffee_backend.db.models.user import User
 from coffee_backend.db.session import get_db
 from coffee_backend.schemas.user import TokenResponse, UserCreate, UserLogin, UserRead
+from coffee_backend.services.principal_cache import Principal
 from coffee_backend.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -35,5 +36,5 @@ def login(payload: UserLogin, db: Annotated[Session, Depends(get_db)]) -> TokenR
 
 
 @router.get("/me", response_model=UserRead)
-def me(user: Annotated[User, Depends(get_current_user)]) -> User:
+def me(user: Annotated[Principal, Depends(get_current_principal)]) -> Principal:
     return user
@@ -1,14 +1,16 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.db.models.bean import Bean
-from coffee_backend.db.models.user import User
 from coffee_backend.db.session import get_db
 from coffee_backend.schemas.bean import BeanCreate, BeanRead
+from coffee_backend.schemas.common import CursorPage
+from coffee_backend.services.pagination import cursor_limit, get_count_cache, owned_cursor_page
+from coffee_backend.services.principal_cache import Principal
 
 router = APIRouter(prefix="/beans", tags=["beans"])
 
@@ -16,39 +18,44 @@ router = APIRouter(prefix="/beans", tags=["beans"])
 @router.post("", response_model=BeanRead)
 def create_bean(
     payload: BeanCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
 ) -> Bean:
     bean = Bean(user_id=user.id, **payload.model_dump())
     db.add(bean)
     db.commit()
     db.refresh(bean)
+    get_count_cache().invalidate(Bean, user.id)
     return bean
 
 
-@router.get("", response_model=list[BeanRead] | dict[str, object])
+@router.get("", response_model=list[BeanRead] | CursorPage[BeanRead] | dict[str, object])
 def list_beans(
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
     page: Annotated[int | None, Query(ge=1)] = None,
     page_size: Annotated[int | None, Query(ge=1, le=100)] = None,
     include_total: bool = False,
-) -> list[Bean] | dict[str, object]:
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=100)] = None,
+) -> list[Bean] | CursorPage[BeanRead] | dict[str, object]:
     query = select(Bean).where(Bean.user_id == user.id)
 
+    limit = cursor_limit(cursor, limit, page, page_size)
+    if limit is not None:
+        return owned_cursor_page(db, Bean, BeanRead, user.id, cursor, limit, include_total)
+
     if (page is None) != (page_size is None):
         page = page or 1
         page_size = page_size or 20
 
     total = None
     if include_total:
-        total = (
-            db.scalar(select(func.count()).select_from(Bean).where(Bean.user_id == user.id)) or 0
-        )
+        total = get_count_cache().count(db, Bean, user.id, [Bean.user_id == user.id])
 
     if page is not None and page_size is not None:
         query = query.offset((page - 1) * page_size).limit(page_size)
-        items = list(db.scalars(query))
+        items = [BeanRead.model_validate(item) for item in db.scalars(query)]
         return {"items": items, "page": page, "page_size": page_size, "total": total}
 
     return list(db.scalars(query))
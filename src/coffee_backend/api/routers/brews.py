@@ -2,14 +2,16 @@ from datetime import datetime
 from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
-from coffee_backend.db.models.user import User
+from coffee_backend.api.conditional import user_conditional_response
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.db.session import get_db
-from coffee_backend.schemas.brew import BrewCreate, BrewListResponse, BrewRead
+from coffee_backend.schemas.brew import BrewCreate, BrewCursorPage, BrewListResponse, BrewRead
 from coffee_backend.services.brew_service import BrewService
+from coffee_backend.services.pagination import cursor_limit
+from coffee_backend.services.principal_cache import Principal
 
 router = APIRouter(prefix="/brews", tags=["brews"])
 
@@ -17,15 +19,17 @@ router = APIRouter(prefix="/brews", tags=["brews"])
 @router.post("", response_model=BrewRead, status_code=status.HTTP_201_CREATED)
 def create_brew(
     payload: BrewCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
 ):
     return BrewService(db).create_brew(user.id, payload)
 
 
-@router.get("", response_model=list[BrewRead] | BrewListResponse)
+@router.get("", response_model=list[BrewRead] | BrewListResponse | BrewCursorPage)
 def list_brews(
-    user: Annotated[User, Depends(get_current_user)],
+    request: Request,
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
     page: Annotated[int | None, Query(ge=1)] = None,
     page_size: Annotated[int | None, Query(ge=1, le=100)] = None,
@@ -35,9 +39,32 @@ def list_brews(
     brewed_to: datetime | None = None,
     sort_by: Literal["date", "score"] = "date",
     sort_order: Literal["asc", "desc"] = "desc",
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=100)] = None,
 ):
+    not_modified = user_conditional_response(request, response, db, user.id)
+    if not_modified is not None:
+        return not_modified
+
     service = BrewService(db)
 
+    limit = cursor_limit(cursor, limit, page, page_size)
+    if limit is not None:
+        result, total = service.list_brews_page(
+            user.id,
+            cursor=cursor,
+            limit=limit,
+            include_total=include_total,
+            method=method,
+            brewed_from=brewed_from,
+            brewed_to=brewed_to,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        return BrewCursorPage(
+            items=result.items, next_cursor=result.next_cursor, limit=limit, total=total
+        )
+
     if (page is None) != (page_size is None):
         page = page or 1
         page_size = page_size or 20
@@ -63,7 +90,7 @@ def list_brews(
 @router.get("/{brew_id}", response_model=BrewRead)
 def get_brew(
     brew_id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
 ):
     return BrewService(db).get_brew(user.id, brew_id)
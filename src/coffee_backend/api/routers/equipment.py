@@ -1,14 +1,16 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.db.models.equipment import Equipment
-from coffee_backend.db.models.user import User
 from coffee_backend.db.session import get_db
+from coffee_backend.schemas.common import CursorPage
 from coffee_backend.schemas.equipment import EquipmentCreate, EquipmentRead
+from coffee_backend.services.pagination import cursor_limit, get_count_cache, owned_cursor_page
+from coffee_backend.services.principal_cache import Principal
 
 router = APIRouter(prefix="/equipment", tags=["equipment"])
 
@@ -16,42 +18,46 @@ router = APIRouter(prefix="/equipment", tags=["equipment"])
 @router.post("", response_model=EquipmentRead)
 def create_equipment(
     payload: EquipmentCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
 ) -> Equipment:
     row = Equipment(user_id=user.id, **payload.model_dump())
     db.add(row)
     db.commit()
     db.refresh(row)
+    get_count_cache().invalidate(Equipment, user.id)
     return row
 
 
-@router.get("", response_model=list[EquipmentRead] | dict[str, object])
+@router.get("", response_model=list[EquipmentRead] | CursorPage[EquipmentRead] | dict[str, object])
 def list_equipment(
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
     page: Annotated[int | None, Query(ge=1)] = None,
     page_size: Annotated[int | None, Query(ge=1, le=100)] = None,
     include_total: bool = False,
-) -> list[Equipment] | dict[str, object]:
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=100)] = None,
+) -> list[Equipment] | CursorPage[EquipmentRead] | dict[str, object]:
     query = select(Equipment).where(Equipment.user_id == user.id)
 
+    limit = cursor_limit(cursor, limit, page, page_size)
+    if limit is not None:
+        return owned_cursor_page(
+            db, Equipment, EquipmentRead, user.id, cursor, limit, include_total
+        )
+
     if (page is None) != (page_size is None):
         page = page or 1
         page_size = page_size or 20
 
     total = None
     if include_total:
-        total = (
-            db.scalar(
-                select(func.count()).select_from(Equipment).where(Equipment.user_id == user.id)
-            )
-            or 0
-        )
+        total = get_count_cache().count(db, Equipment, user.id, [Equipment.user_id == user.id])
 
     if page is not None and page_size is not None:
         query = query.offset((page - 1) * page_size).limit(page_size)
-        items = list(db.scalars(query))
+        items = [EquipmentRead.model_validate(item) for item in db.scalars(query)]
         return {"items": items, "page": page, "page_size": page_size, "total": total}
 
     return list(db.scalars(query))
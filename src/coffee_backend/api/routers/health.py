@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
@@ -5,6 +6,13 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from coffee_backend.db.session import get_db
+from coffee_backend.services.analytics_engine import get_brew_array_cache
+from coffee_backend.services.insights_cache import get_insights_cache
+from coffee_backend.services.method_profile_registry import get_method_profile_registry_store
+from coffee_backend.services.pagination import get_count_cache
+from coffee_backend.services.principal_cache import get_principal_cache
+from coffee_backend.services.sampler_state import get_sampler_state_store
+from coffee_backend.services.study_cache import get_study_cache
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -19,3 +27,16 @@ def health(db: Annotated[Session, Depends(get_db)]) -> dict[str, str]:
 def readiness(db: Annotated[Session, Depends(get_db)]) -> dict[str, str]:
     db.execute(text("SELECT 1"))
     return {"status": "ready", "db": "ok"}
+
+
+@router.get("/metrics")
+def metrics() -> dict[str, dict[str, int]]:
+    return {
+        "study_cache": asdict(get_study_cache().stats()),
+        "insights_cache": asdict(get_insights_cache().stats()),
+        "sampler_state": asdict(get_sampler_state_store().stats()),
+        "list_count_cache": asdict(get_count_cache().stats()),
+        "analytics_cache": asdict(get_brew_array_cache().stats()),
+        "method_profile_registry": asdict(get_method_profile_registry_store().stats()),
+        "principal_cache": asdict(get_principal_cache().stats()),
+    }
@@ -1,14 +1,22 @@
 import logging
+from concurrent.futures import Executor
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
-from coffee_backend.db.models.user import User
+from coffee_backend.api.deps import get_current_principal, get_import_executor
 from coffee_backend.db.session import get_db
 from coffee_backend.schemas.import_export import CSVImportRequest, CSVImportResult
+from coffee_backend.services.columnar_export import (
+    COLUMNAR_EXTENSIONS,
+    COLUMNAR_MEDIA_TYPES,
+    PARQUET_FORMAT,
+    resolve_columnar_format,
+)
 from coffee_backend.services.import_export_service import ImportExportService
+from coffee_backend.services.principal_cache import Principal
 
 router = APIRouter(prefix="", tags=["import-export"])
 logger = logging.getLogger(__name__)
@@ -17,14 +25,15 @@ logger = logging.getLogger(__name__)
 @router.post("/import/csv", response_model=CSVImportResult)
 def import_csv(
     payload: CSVImportRequest,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
+    executor: Annotated[Executor | None, Depends(get_import_executor)],
 ) -> CSVImportResult:
     logger.info(
         "import.csv.requested",
         extra={"user_id": str(user.id), "data_path": payload.data_path},
     )
-    result = ImportExportService(db).import_csv(user.id, payload)
+    result = ImportExportService(db, executor).import_csv(user.id, payload, restrict_paths=True)
     logger.info(
         "import.csv.completed",
         extra={
@@ -40,10 +49,39 @@ def import_csv(
 
 @router.get("/export/csv")
 def export_csv(
-    out_dir: Annotated[str, Query()],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
-) -> dict[str, list[str]]:
-    logger.info("export.csv.requested", extra={"user_id": str(user.id), "out_dir": out_dir})
-    result = ImportExportService(db).export_csv(user.id, out_dir)
-    return {"output_files": result.output_files}
+    gzip: Annotated[bool, Query()] = False,
+) -> StreamingResponse:
+    logger.info("export.csv.requested", extra={"user_id": str(user.id), "gzip": gzip})
+    filename = "brews.export.csv.gz" if gzip else "brews.export.csv"
+    return StreamingResponse(
+        ImportExportService(db).stream_csv(user.id, compress=gzip),
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export/columnar")
+def export_columnar(
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    export_format: Annotated[str, Query(alias="format")] = PARQUET_FORMAT,
+    method: Annotated[str | None, Query()] = None,
+) -> StreamingResponse:
+    resolved = resolve_columnar_format(export_format)
+    logger.info(
+        "export.columnar.requested",
+        extra={
+            "user_id": str(user.id),
+            "format": export_format,
+            "resolved_format": resolved,
+            "method": method,
+        },
+    )
+    filename = f"brews.export.{COLUMNAR_EXTENSIONS[resolved]}"
+    return StreamingResponse(
+        ImportExportService(db).stream_columnar(user.id, resolved, method),
+        media_type=COLUMNAR_MEDIA_TYPES[resolved],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
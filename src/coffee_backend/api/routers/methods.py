@@ -1,9 +1,12 @@
 from collections import defaultdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
+from coffee_backend.api.conditional import conditional_response, make_etag
+from coffee_backend.api.deps import get_profile_registry
+from coffee_backend.core.config import get_settings
 from coffee_backend.db.session import get_db
 from coffee_backend.schemas.method_profile import (
     MethodProfileListResponse,
@@ -12,14 +15,33 @@ from coffee_backend.schemas.method_profile import (
     MethodSummaryListResponse,
     MethodVariantSummary,
 )
+from coffee_backend.services.method_profile_registry import MethodProfileRegistry
 from coffee_backend.services.method_profile_service import MethodProfileService
 
 router = APIRouter(prefix="/methods", tags=["methods"])
 
 
+def _profile_conditional_response(
+    request: Request, response: Response, *parts: object
+) -> Response | None:
+    max_age = get_settings().method_profile_cache_max_age_seconds
+    return conditional_response(
+        request, response, make_etag("methods", *parts), f"public, max-age={max_age}"
+    )
+
+
 @router.get("", response_model=MethodSummaryListResponse)
-def list_methods(db: Annotated[Session, Depends(get_db)]) -> MethodSummaryListResponse:
-    profiles = MethodProfileService(db).list_profiles()
+def list_methods(
+    request: Request,
+    response: Response,
+    registry: Annotated[MethodProfileRegistry, Depends(get_profile_registry)],
+    db: Annotated[Session, Depends(get_db)],
+) -> MethodSummaryListResponse | Response:
+    not_modified = _profile_conditional_response(request, response, registry.version)
+    if not_modified is not None:
+        return not_modified
+
+    profiles = MethodProfileService(db, registry).list_profiles()
     grouped: dict[str, list[MethodVariantSummary]] = defaultdict(list)
 
     for profile in profiles:
@@ -40,9 +62,17 @@ def list_methods(db: Annotated[Session, Depends(get_db)]) -> MethodSummaryListRe
 @router.get("/{method_id}", response_model=MethodProfileListResponse)
 def get_method_profiles(
     method_id: str,
+    request: Request,
+    response: Response,
+    registry: Annotated[MethodProfileRegistry, Depends(get_profile_registry)],
     db: Annotated[Session, Depends(get_db)],
-) -> MethodProfileListResponse:
-    profiles = MethodProfileService(db).list_profiles_for_method(method_id)
+) -> MethodProfileListResponse | Response:
+    if registry.for_method(method_id):
+        not_modified = _profile_conditional_response(request, response, method_id, registry.version)
+        if not_modified is not None:
+            return not_modified
+
+    profiles = MethodProfileService(db, registry).list_profiles_for_method(method_id)
     return MethodProfileListResponse(
         method_id=method_id,
         profiles=[
@@ -61,9 +91,19 @@ def get_method_profiles(
 def get_method_profile_variant(
     method_id: str,
     variant_id: str,
+    request: Request,
+    response: Response,
+    registry: Annotated[MethodProfileRegistry, Depends(get_profile_registry)],
     db: Annotated[Session, Depends(get_db)],
-) -> MethodProfileSchema:
-    profile = MethodProfileService(db).get_profile(method_id, variant_id)
+) -> MethodProfileSchema | Response:
+    if registry.get(method_id, variant_id) is not None:
+        not_modified = _profile_conditional_response(
+            request, response, method_id, variant_id, registry.version
+        )
+        if not_modified is not None:
+            return not_modified
+
+    profile = MethodProfileService(db, registry).get_profile(method_id, variant_id)
     return MethodProfileSchema(
         method_id=profile.method_id,
         variant_id=profile.variant_id,
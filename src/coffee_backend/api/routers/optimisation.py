@@ -2,22 +2,29 @@ import logging
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, Query
-from sqlalchemy.orm import Session
+import optuna
+from fastapi import APIRouter, Body, Depends, Query, status
+from sqlalchemy.orm import Session, sessionmaker
 
-from coffee_backend.api.deps import get_current_user
-from coffee_backend.db.models.user import User
-from coffee_backend.db.session import get_db
+from coffee_backend.api.deps import get_current_principal, get_warm_start_jobs
+from coffee_backend.db.models.optuna_study import Suggestion
+from coffee_backend.db.session import get_db, get_db_sessionmaker, get_optuna_storage
 from coffee_backend.schemas.optimisation import (
     ApplySuggestionRequest,
+    BatchSuggestRequest,
+    BulkApplyRequest,
+    BulkApplyResponse,
     OptimisationInsight,
     StudyContextRead,
     StudyRequest,
     SuggestionRead,
+    WarmStartJobRead,
     WarmStartRequest,
     WarmStartResponse,
 )
 from coffee_backend.services.optimisation_service import OptimisationService
+from coffee_backend.services.principal_cache import Principal
+from coffee_backend.services.warm_start_jobs import WarmStartJob, WarmStartJobManager
 
 router = APIRouter(prefix="/optimisation", tags=["optimisation"])
 logger = logging.getLogger(__name__)
@@ -38,10 +45,11 @@ def create_study(
             ]
         ),
     ],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
 ) -> StudyContextRead:
-    service = OptimisationService(db)
+    service = OptimisationService(db, storage)
     study_context = service.ensure_study_context(user.id, payload)
     logger.info(
         "optimisation.study.requested",
@@ -53,6 +61,7 @@ def create_study(
         variant_id=study_context.variant_id,
         bean_id=study_context.bean_id,
         equipment_id=study_context.equipment_id,
+        sampler=study_context.sampler,
     )
 
 
@@ -72,14 +81,48 @@ def warm_start(
             ]
         ),
     ],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
 ) -> WarmStartResponse:
     logger.info(
         "optimisation.warm_start.requested",
         extra={"user_id": str(user.id), "method_id": payload.method_id},
     )
-    return OptimisationService(db).warm_start(user.id, payload)
+    return OptimisationService(db, storage).warm_start(user.id, payload)
+
+
+@router.post(
+    "/warm_start/jobs",
+    response_model=WarmStartJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_warm_start_job(
+    payload: WarmStartRequest,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    session_factory: Annotated[sessionmaker[Session], Depends(get_db_sessionmaker)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+    jobs: Annotated[WarmStartJobManager, Depends(get_warm_start_jobs)],
+) -> WarmStartJob:
+    logger.info(
+        "optimisation.warm_start_job.requested",
+        extra={"user_id": str(user.id), "method_id": payload.method_id},
+    )
+    return OptimisationService(db, storage).submit_warm_start_job(
+        user.id, payload, jobs, session_factory
+    )
+
+
+@router.get("/warm_start/jobs/{job_id}", response_model=WarmStartJobRead)
+def get_warm_start_job(
+    job_id: UUID,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+    jobs: Annotated[WarmStartJobManager, Depends(get_warm_start_jobs)],
+) -> WarmStartJob:
+    return OptimisationService(db, storage).get_warm_start_job(user.id, job_id, jobs)
 
 
 @router.post("/suggest", response_model=SuggestionRead)
@@ -88,23 +131,56 @@ def suggest(
         StudyRequest,
         Body(examples=[{"method_id": "aeropress", "variant_id": "aeropress_standard"}]),
     ],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
-):
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+) -> Suggestion:
     logger.info(
         "optimisation.suggest.requested",
         extra={"user_id": str(user.id), "method_id": payload.method_id},
     )
-    return OptimisationService(db).suggest(user.id, payload)
+    return OptimisationService(db, storage).suggest(user.id, payload)
+
+
+@router.post("/suggest/batch", response_model=list[SuggestionRead])
+def suggest_batch(
+    payload: Annotated[
+        BatchSuggestRequest,
+        Body(examples=[{"method_id": "aeropress", "variant_id": "aeropress_standard", "count": 8}]),
+    ],
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+) -> list[Suggestion]:
+    logger.info(
+        "optimisation.suggest_batch.requested",
+        extra={"user_id": str(user.id), "method_id": payload.method_id, "count": payload.count},
+    )
+    return OptimisationService(db, storage).suggest_batch(user.id, payload, payload.count)
+
+
+@router.post("/suggestions/apply", response_model=BulkApplyResponse)
+def apply_suggestions(
+    payload: BulkApplyRequest,
+    user: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+) -> BulkApplyResponse:
+    logger.info(
+        "optimisation.apply_many.requested",
+        extra={"user_id": str(user.id), "items": len(payload.items)},
+    )
+    return OptimisationService(db, storage).apply_many(user.id, payload.items)
 
 
 @router.post("/suggestions/{suggestion_id}/apply", response_model=SuggestionRead)
 def apply_suggestion(
     suggestion_id: UUID,
     payload: ApplySuggestionRequest,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
-):
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
+) -> Suggestion:
     logger.info(
         "optimisation.apply.requested",
         extra={
@@ -113,7 +189,7 @@ def apply_suggestion(
             "brew_id": str(payload.brew_id),
         },
     )
-    return OptimisationService(db).apply(
+    return OptimisationService(db, storage).apply(
         user.id,
         suggestion_id,
         payload.brew_id,
@@ -125,7 +201,8 @@ def apply_suggestion(
 @router.get("/insights", response_model=OptimisationInsight)
 def insights(
     study_key: Annotated[str, Query()],
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
+    storage: Annotated[optuna.storages.RDBStorage, Depends(get_optuna_storage)],
 ) -> OptimisationInsight:
-    return OptimisationService(db).insights(study_key)
+    return OptimisationService(db, storage).insights(study_key)
@@ -3,10 +3,11 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from coffee_backend.api.deps import get_current_user
+from coffee_backend.api.deps import get_current_principal
 from coffee_backend.db.models.user import User
 from coffee_backend.db.session import get_db
 from coffee_backend.schemas.user import UserRead
+from coffee_backend.services.principal_cache import Principal
 from coffee_backend.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("", response_model=list[UserRead] | dict[str, object])
 def list_users(
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_principal)],
     db: Annotated[Session, Depends(get_db)],
     page: Annotated[int | None, Query(ge=1)] = None,
     page_size: Annotated[int | None, Query(ge=1, le=100)] = None,
@@ -1,6 +1,6 @@
 import typer
 
-from coffee_backend.cli.commands import brews, db, import_export, optimise, run, users
+from coffee_backend.cli.commands import analytics, brews, db, import_export, optimise, run, users
 
 app = typer.Typer(help="Coffee Optimiser CLI")
 app.add_typer(run.app, name="api")
@@ -10,6 +10,7 @@ app.add_typer(brews.app, name="brew")
 app.add_typer(optimise.app, name="optimise")
 app.add_typer(import_export.app, name="import")
 app.add_typer(import_export.export_app, name="export")
+app.add_typer(analytics.app, name="analytics")
 
 if __name__ == "__main__":
     app()
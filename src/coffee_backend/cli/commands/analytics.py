@@ -0,0 +1,17 @@
+from uuid import UUID
+
+import typer
+
+from coffee_backend.cli.db import get_cli_db_session
+from coffee_backend.services.analytics_rollups import BrewRollupService
+
+app = typer.Typer(help="Analytics commands")
+
+
+@app.command("rebuild-rollups")
+def rebuild_rollups(
+    user_id: UUID | None = typer.Option(None, "--user-id", help="Only rebuild this user"),
+) -> None:
+    with get_cli_db_session() as db:
+        rows = BrewRollupService(db).rebuild(user_id)
+        typer.echo(f"Rebuilt {rows} daily rollup rows")
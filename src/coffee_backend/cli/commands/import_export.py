@@ -4,6 +4,7 @@ import typer
 
 from coffee_backend.cli.db import get_cli_db_session
 from coffee_backend.schemas.import_export import CSVImportRequest
+from coffee_backend.services.columnar_export import PARQUET_FORMAT
 from coffee_backend.services.import_export_service import ImportExportService
 
 app = typer.Typer(help="Import commands")
@@ -12,17 +13,48 @@ export_app = typer.Typer(help="Export commands")
 
 @app.command("csv")
 def import_csv(
-    user_id: UUID, data: str, method: str | None = None, meta: str | None = None
+    user_id: UUID,
+    data: str,
+    method: str | None = None,
+    variant: str | None = None,
+    meta: str | None = None,
+    workers: int | None = None,
 ) -> None:
     with get_cli_db_session() as db:
         result = ImportExportService(db).import_csv(
-            user_id, CSVImportRequest(method=method, data_path=data, meta_path=meta)
+            user_id,
+            CSVImportRequest(
+                method=method,
+                variant_id=variant,
+                data_path=data,
+                meta_path=meta,
+                workers=workers,
+            ),
         )
+        for file in result.files:
+            typer.echo(
+                f"{file.data_path}: inserted={file.inserted} skipped={file.skipped} "
+                f"errors={file.error_count}"
+            )
         typer.echo(f"Imported={result.imported} skipped={result.skipped}")
 
 
 @export_app.command("csv")
-def export_csv(user_id: UUID, out: str) -> None:
+def export_csv(user_id: UUID, out: str, gzip: bool = False) -> None:
     with get_cli_db_session() as db:
-        result = ImportExportService(db).export_csv(user_id, out)
+        result = ImportExportService(db).export_csv(user_id, out, compress=gzip)
+        typer.echo("\n".join(result.output_files))
+
+
+@export_app.command("columnar")
+def export_columnar(
+    user_id: UUID,
+    out: str,
+    export_format: str = typer.Option(
+        PARQUET_FORMAT, "--format", help="parquet, arrow or ndjson (used when pyarrow is missing)"
+    ),
+    method: str | None = None,
+) -> None:
+    with get_cli_db_session() as db:
+        result = ImportExportService(db).export_columnar(user_id, out, export_format, method)
         typer.echo("\n".join(result.output_files))
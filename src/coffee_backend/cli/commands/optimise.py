@@ -2,7 +2,7 @@ from uuid import UUID
 
 import typer
 
-from coffee_backend.cli.db import get_cli_db_session
+from coffee_backend.cli.db import get_cli_db_session, get_cli_optuna_storage
 from coffee_backend.schemas.optimisation import StudyRequest
 from coffee_backend.services.optimisation_service import OptimisationService
 
@@ -16,6 +16,7 @@ def suggest(
     variant_id: str | None = None,
     bean_id: UUID | None = None,
     equipment_id: UUID | None = None,
+    count: int = typer.Option(1, "--count", min=1, max=100, help="Number of suggestions"),
 ) -> None:
     req = StudyRequest(
         method_id=method_id,
@@ -23,9 +24,9 @@ def suggest(
         bean_id=bean_id,
         equipment_id=equipment_id,
     )
-    with get_cli_db_session() as db:
-        s = OptimisationService(db).suggest(user_id, req)
-        typer.echo(f"{s.id} {s.suggested_params}")
+    with get_cli_db_session() as db, get_cli_optuna_storage() as storage:
+        for s in OptimisationService(db, storage).suggest_batch(user_id, req, count):
+            typer.echo(f"{s.id} {s.suggested_params}")
 
 
 @app.command("apply")
@@ -36,6 +37,6 @@ def apply(
     score: float | None = None,
     failed: bool = False,
 ) -> None:
-    with get_cli_db_session() as db:
-        s = OptimisationService(db).apply(user_id, suggestion_id, brew_id, score, failed)
+    with get_cli_db_session() as db, get_cli_optuna_storage() as storage:
+        s = OptimisationService(db, storage).apply(user_id, suggestion_id, brew_id, score, failed)
         typer.echo(f"Applied suggestion {s.id}")
@@ -1,10 +1,15 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 
+import optuna
 from sqlalchemy.orm import Session
 
 from coffee_backend.core.config import get_settings
-from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.db.session import (
+    create_engine_from_settings,
+    create_optuna_storage,
+    create_sessionmaker,
+)
 
 
 @contextmanager
@@ -17,3 +22,13 @@ def get_cli_db_session() -> Generator[Session, None, None]:
     finally:
         session.close()
         engine.dispose()
+
+
+@contextmanager
+def get_cli_optuna_storage() -> Generator[optuna.storages.RDBStorage, None, None]:
+    storage = create_optuna_storage(get_settings())
+    try:
+        yield storage
+    finally:
+        storage.remove_session()
+        storage.engine.dispose()
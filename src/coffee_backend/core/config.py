@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,34 @@ class Settings(BaseSettings):
     demo_mode: bool = False
     failed_brew_score: float = 0.0
     optuna_skip_compatibility_check: bool = True
+    optuna_pool_size: int = 5
+    optuna_max_overflow: int = 10
+    optuna_pool_timeout: int = 30
+    optuna_sampler: Literal["tpe", "random", "qmc", "gp"] = "tpe"
+    optuna_sampler_seed: int | None = None
+    optuna_sampler_startup_trials: int = 10
+    optuna_tpe_multivariate: bool = False
+    optuna_tpe_group: bool = False
+    optuna_tpe_constant_liar: bool = True
+    optuna_tpe_prior_weight: float = 1.0
+    study_cache_max_bytes: int = 64 * 1024 * 1024
+    insights_cache_max_entries: int = 1024
+    insights_background_recompute: bool = True
+    sampler_state_max_entries: int = 256
+    sampler_state_dir: str | None = None
+    warm_start_job_workers: int = 2
+    warm_start_job_history: int = 1000
+    warm_start_batch_size: int = 500
+    warm_start_watermark_overlap_seconds: float = 300.0
+    import_workers: int = 4
+    import_root: str | None = None
+    list_count_cache_max_entries: int = 4096
+    list_count_cache_ttl_seconds: float = 30.0
+    analytics_cache_max_entries: int = 256
+    analytics_cache_ttl_seconds: float = 300.0
+    method_profile_cache_max_age_seconds: int = 300
+    principal_cache_max_entries: int = 4096
+    principal_cache_ttl_seconds: float = 60.0
     log_level: str = "INFO"
     cors_allowed_origins: list[str] = Field(default_factory=list)
     enable_request_id_middleware: bool = True
@@ -18,6 +18,7 @@ from coffee_backend.db.base import Base
 for module in (
     "coffee_backend.db.models.bean",
     "coffee_backend.db.models.brew",
+    "coffee_backend.db.models.brew_rollup",
     "coffee_backend.db.models.equipment",
     "coffee_backend.db.models.method_profile",
     "coffee_backend.db.models.optuna_study",
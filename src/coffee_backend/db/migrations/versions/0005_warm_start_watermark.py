@@ -0,0 +1,63 @@
+"""add warm start watermark and ingested entry index
+
+Revision ID: 0005_warm_start_watermark
+Revises: 0004_method_aware_suggestions
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005_warm_start_watermark"
+down_revision = "0004_method_aware_suggestions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "study_contexts",
+        sa.Column("warm_start_created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.create_table(
+        "warm_start_entries",
+        sa.Column("study_context_id", sa.Uuid(), nullable=False),
+        sa.Column("dedupe_key", sa.String(length=100), nullable=False),
+        sa.Column("brew_id", sa.Uuid(), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["study_context_id"], ["study_contexts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "study_context_id", "dedupe_key", name="uq_warm_start_entry_context_key"
+        ),
+    )
+    op.create_index(
+        op.f("ix_warm_start_entries_study_context_id"),
+        "warm_start_entries",
+        ["study_context_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_warm_start_entries_context_brew",
+        "warm_start_entries",
+        ["study_context_id", "brew_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_brews_user_created_at_id", "brews", ["user_id", "created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_brews_user_created_at_id", table_name="brews")
+    op.drop_index("ix_warm_start_entries_context_brew", table_name="warm_start_entries")
+    op.drop_index(op.f("ix_warm_start_entries_study_context_id"), table_name="warm_start_entries")
+    op.drop_table("warm_start_entries")
+    op.drop_column("study_contexts", "warm_start_created_at")
@@ -0,0 +1,29 @@
+"""record sampler choice on study contexts and method profiles
+
+Revision ID: 0006_study_samplers
+Revises: 0005_warm_start_watermark
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_study_samplers"
+down_revision = "0005_warm_start_watermark"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "study_contexts",
+        sa.Column("sampler", sa.String(length=50), server_default="tpe", nullable=False),
+    )
+    op.add_column("study_contexts", sa.Column("sampler_config", sa.JSON(), nullable=True))
+    op.add_column("method_profiles", sa.Column("sampler", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("method_profiles", "sampler")
+    op.drop_column("study_contexts", "sampler_config")
+    op.drop_column("study_contexts", "sampler")
@@ -0,0 +1,22 @@
+"""store the optuna trial id on suggestions
+
+Revision ID: 0007_suggestion_trial_id
+Revises: 0006_study_samplers
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007_suggestion_trial_id"
+down_revision = "0006_study_samplers"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("suggestions", sa.Column("trial_id", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("suggestions", "trial_id")
@@ -0,0 +1,31 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: 0008_keyset_pagination_indexes
+Revises: 0007_suggestion_trial_id
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0008_keyset_pagination_indexes"
+down_revision = "0007_suggestion_trial_id"
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEXES = (
+    ("ix_brews_user_brewed_at_id", "brews", ["user_id", "brewed_at", "id"]),
+    ("ix_brews_user_score_id", "brews", ["user_id", "score", "id"]),
+    ("ix_beans_user_created_at_id", "beans", ["user_id", "created_at", "id"]),
+    ("ix_recipes_user_created_at_id", "recipes", ["user_id", "created_at", "id"]),
+    ("ix_equipment_user_created_at_id", "equipment", ["user_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
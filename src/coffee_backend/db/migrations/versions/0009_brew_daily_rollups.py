@@ -0,0 +1,63 @@
+"""add daily per-user, per-method brew score rollups
+
+Revision ID: 0009_brew_daily_rollups
+Revises: 0008_keyset_pagination_indexes
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0009_brew_daily_rollups"
+down_revision = "0008_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "brew_daily_rollups",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("method", sa.String(length=50), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("brew_count", sa.Integer(), nullable=False),
+        sa.Column("score_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("score_min", sa.Float(), nullable=True),
+        sa.Column("score_max", sa.Float(), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "method", "day", name="uq_brew_daily_rollup_scope"),
+    )
+    op.create_index(
+        op.f("ix_brew_daily_rollups_user_id"), "brew_daily_rollups", ["user_id"], unique=False
+    )
+    op.execute("""
+        INSERT INTO brew_daily_rollups (
+            id, user_id, method, day, brew_count, score_count, score_sum, score_min, score_max
+        )
+        SELECT
+            gen_random_uuid(),
+            user_id,
+            method,
+            (brewed_at AT TIME ZONE 'UTC')::date,
+            count(*),
+            count(score),
+            coalesce(sum(score), 0),
+            min(score),
+            max(score)
+        FROM brews
+        GROUP BY user_id, method, (brewed_at AT TIME ZONE 'UTC')::date
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_brew_daily_rollups_user_id"), table_name="brew_daily_rollups")
+    op.drop_table("brew_daily_rollups")
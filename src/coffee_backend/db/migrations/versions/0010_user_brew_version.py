@@ -0,0 +1,25 @@
+"""add per-user brew version for conditional GETs
+
+Revision ID: 0010_user_brew_version
+Revises: 0009_brew_daily_rollups
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0010_user_brew_version"
+down_revision = "0009_brew_daily_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("brew_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "brew_version")
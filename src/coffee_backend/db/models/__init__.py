@@ -1,18 +1,21 @@
 from coffee_backend.db.models.bean import Bean
 from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.brew_rollup import BrewDailyRollup
 from coffee_backend.db.models.equipment import Equipment
 from coffee_backend.db.models.method_profile import MethodProfile
-from coffee_backend.db.models.optuna_study import StudyContext, Suggestion
+from coffee_backend.db.models.optuna_study import StudyContext, Suggestion, WarmStartEntry
 from coffee_backend.db.models.recipe import Recipe
 from coffee_backend.db.models.user import User
 
 __all__ = [
     "Bean",
     "Brew",
+    "BrewDailyRollup",
     "Equipment",
     "MethodProfile",
     "Recipe",
     "StudyContext",
     "Suggestion",
     "User",
+    "WarmStartEntry",
 ]
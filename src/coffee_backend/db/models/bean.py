@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import Date, ForeignKey, String, Text, Uuid
+from sqlalchemy import Date, ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from coffee_backend.db.base import Base
@@ -10,6 +10,7 @@ from coffee_backend.db.models.common import TimestampMixin, UUIDMixin
 
 class Bean(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "beans"
+    __table_args__ = (Index("ix_beans_user_created_at_id", "user_id", "created_at", "id"),)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, String, Text, Uuid
+from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from coffee_backend.db.base import Base
@@ -11,6 +11,11 @@ from coffee_backend.db.models.enums import BrewMethod, BrewStatus
 
 class Brew(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "brews"
+    __table_args__ = (
+        Index("ix_brews_user_brewed_at_id", "user_id", "brewed_at", "id"),
+        Index("ix_brews_user_score_id", "user_id", "score", "id"),
+        Index("ix_brews_user_created_at_id", "user_id", "created_at", "id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True
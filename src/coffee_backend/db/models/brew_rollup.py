@@ -0,0 +1,26 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Integer, String, UniqueConstraint, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from coffee_backend.db.base import Base
+from coffee_backend.db.models.common import TimestampMixin, UUIDMixin
+
+
+class BrewDailyRollup(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "brew_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "method", "day", name="uq_brew_daily_rollup_scope"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    method: Mapped[str] = mapped_column(String(50))
+    day: Mapped[date] = mapped_column(Date)
+    brew_count: Mapped[int] = mapped_column(Integer, default=0)
+    score_count: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    score_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    score_max: Mapped[float | None] = mapped_column(Float, nullable=True)
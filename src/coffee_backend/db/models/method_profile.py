@@ -10,3 +10,4 @@ class MethodProfile(Base):
     variant_id: Mapped[str] = mapped_column(String(100), primary_key=True, index=True)
     schema_version: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
     parameters: Mapped[list[dict[str, object]]] = mapped_column(JSON)
+    sampler: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
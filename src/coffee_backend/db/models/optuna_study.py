@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import JSON, ForeignKey, String, UniqueConstraint, Uuid
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from coffee_backend.db.base import Base
@@ -31,9 +32,35 @@ class StudyContext(Base, UUIDMixin, TimestampMixin):
         Uuid, ForeignKey("equipment.id"), nullable=True
     )
     study_key: Mapped[str] = mapped_column(String(255), index=True)
+    sampler: Mapped[str] = mapped_column(String(50), default="tpe", server_default="tpe")
+    sampler_config: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    warm_start_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     user = relationship("User", back_populates="study_contexts")
     suggestions = relationship("Suggestion", back_populates="study_context")
+    warm_start_entries = relationship(
+        "WarmStartEntry", back_populates="study_context", cascade="all, delete-orphan"
+    )
+
+
+class WarmStartEntry(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "warm_start_entries"
+    __table_args__ = (
+        UniqueConstraint("study_context_id", "dedupe_key", name="uq_warm_start_entry_context_key"),
+        Index("ix_warm_start_entries_context_brew", "study_context_id", "brew_id"),
+    )
+
+    study_context_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("study_contexts.id", ondelete="CASCADE"),
+        index=True,
+    )
+    dedupe_key: Mapped[str] = mapped_column(String(100))
+    brew_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, nullable=True)
+
+    study_context = relationship("StudyContext", back_populates="warm_start_entries")
 
 
 class Suggestion(Base, UUIDMixin, TimestampMixin):
@@ -50,6 +77,7 @@ class Suggestion(Base, UUIDMixin, TimestampMixin):
     brew_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, ForeignKey("brews.id"), nullable=True)
     study_key: Mapped[str] = mapped_column(String(255), index=True)
     trial_number: Mapped[int] = mapped_column()
+    trial_id: Mapped[int | None] = mapped_column(nullable=True)
     suggested_params: Mapped[dict[str, object]] = mapped_column(JSON)
     actual_params: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
     status: Mapped[str] = mapped_column(String(20), default="issued", index=True)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import JSON, ForeignKey, String, Text, Uuid
+from sqlalchemy import JSON, ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from coffee_backend.db.base import Base
@@ -10,6 +10,7 @@ from coffee_backend.db.models.enums import BrewMethod
 
 class Recipe(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "recipes"
+    __table_args__ = (Index("ix_recipes_user_created_at_id", "user_id", "created_at", "id"),)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True
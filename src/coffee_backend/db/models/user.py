@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from coffee_backend.db.base import Base
@@ -11,6 +11,7 @@ class User(Base, UUIDMixin, TimestampMixin):
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     hashed_password: Mapped[str] = mapped_column(String(255))
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    brew_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     beans = relationship("Bean", back_populates="user", cascade="all, delete-orphan")
     equipment = relationship("Equipment", back_populates="user", cascade="all, delete-orphan")
@@ -1,6 +1,7 @@
 from collections.abc import Generator
 from typing import Any
 
+import optuna
 from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -16,6 +17,22 @@ def create_engine_from_settings(settings: Settings) -> Engine:
     return create_engine(settings.database_url, echo=False, future=True, connect_args=connect_args)
 
 
+def create_optuna_storage(settings: Settings) -> optuna.storages.RDBStorage:
+    engine_kwargs: dict[str, Any] = {}
+    if not settings.database_url.startswith("sqlite"):
+        engine_kwargs = {
+            "pool_size": settings.optuna_pool_size,
+            "max_overflow": settings.optuna_max_overflow,
+            "pool_timeout": settings.optuna_pool_timeout,
+            "pool_pre_ping": True,
+        }
+    return optuna.storages.RDBStorage(
+        url=settings.database_url,
+        engine_kwargs=engine_kwargs,
+        skip_compatibility_check=settings.optuna_skip_compatibility_check,
+    )
+
+
 def create_sessionmaker(engine: Engine) -> sessionmaker[Session]:
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
@@ -25,21 +42,38 @@ def init_db_state(state: Any, settings: Settings | None = None) -> None:
     engine = create_engine_from_settings(resolved_settings)
     state.db_engine = engine
     state.db_sessionmaker = create_sessionmaker(engine)
+    state.optuna_storage = create_optuna_storage(resolved_settings)
 
 
 def dispose_db_state(state: Any) -> None:
     engine: Engine | None = getattr(state, "db_engine", None)
     if engine is not None:
         engine.dispose()
+    storage: optuna.storages.RDBStorage | None = getattr(state, "optuna_storage", None)
+    if storage is not None:
+        storage.remove_session()
+        storage.engine.dispose()
 
 
-def get_db(request: Request) -> Generator[Session, None, None]:
-    session_factory = getattr(request.app.state, "db_sessionmaker", None)
+def get_db_sessionmaker(request: Request) -> sessionmaker[Session]:
+    session_factory: sessionmaker[Session] | None = getattr(
+        request.app.state, "db_sessionmaker", None
+    )
     if session_factory is None:
         raise RuntimeError("Database sessionmaker is not initialised on app.state")
+    return session_factory
 
-    db = session_factory()
+
+def get_db(request: Request) -> Generator[Session, None, None]:
+    db = get_db_sessionmaker(request)()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_optuna_storage(request: Request) -> optuna.storages.RDBStorage:
+    storage: optuna.storages.RDBStorage | None = getattr(request.app.state, "optuna_storage", None)
+    if storage is None:
+        raise RuntimeError("Optuna storage is not initialised on app.state")
+    return storage
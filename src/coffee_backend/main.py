@@ -25,7 +25,10 @@ from coffee_backend.core.config import Settings, get_settings
 from coffee_backend.core.exceptions import APIError, ConflictError
 from coffee_backend.core.logging import configure_logging, request_id_ctx_var
 from coffee_backend.db.session import dispose_db_state, init_db_state
+from coffee_backend.services.import_export_service import create_import_executor
+from coffee_backend.services.method_profile_registry import get_method_profile_registry_store
 from coffee_backend.services.method_profile_service import seed_method_profiles
+from coffee_backend.services.warm_start_jobs import WarmStartJobManager
 
 configure_logging()
 logger = logging.getLogger(__name__)
@@ -64,11 +67,27 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         logger.info("app.startup", extra={"app_env": resolved_settings.app_env})
         init_db_state(app.state, settings=resolved_settings)
         session_factory = app.state.db_sessionmaker
+        profile_registry = get_method_profile_registry_store()
         with session_factory() as db:
             seed_method_profiles(db)
+            profile_registry.load(db)
+        restore_reload_signal = profile_registry.reload_on_signal()
+        app.state.warm_start_jobs = WarmStartJobManager(
+            resolved_settings.warm_start_job_workers,
+            history=resolved_settings.warm_start_job_history,
+        )
+        app.state.import_executor = (
+            create_import_executor(resolved_settings.import_workers)
+            if resolved_settings.import_workers > 1
+            else None
+        )
         try:
             yield
         finally:
+            restore_reload_signal()
+            app.state.warm_start_jobs.shutdown()
+            if app.state.import_executor is not None:
+                app.state.import_executor.shutdown(cancel_futures=True)
             dispose_db_state(app.state)
             logger.info("app.shutdown")
 
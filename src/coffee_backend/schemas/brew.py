@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from coffee_backend.schemas.common import TimestampedSchema
+from coffee_backend.schemas.common import CursorPage, TimestampedSchema
 
 
 class BrewCreate(BaseModel):
@@ -31,3 +31,6 @@ class BrewListResponse(BaseModel):
     page: int
     page_size: int
     total: int | None = None
+
+
+BrewCursorPage = CursorPage[BrewRead]
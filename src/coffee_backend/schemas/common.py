@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
 
+ItemT = TypeVar("ItemT")
+
 
 class BaseSchema(BaseModel):
     model_config = {"from_attributes": True}
@@ -12,3 +15,10 @@ class TimestampedSchema(BaseSchema):
     id: UUID
     created_at: datetime
     updated_at: datetime
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    items: list[ItemT]
+    next_cursor: str | None = None
+    limit: int
+    total: int | None = None
@@ -3,8 +3,10 @@ from pydantic import BaseModel, Field
 
 class CSVImportRequest(BaseModel):
     method: str | None = None
+    variant_id: str | None = None
     data_path: str
     meta_path: str | None = None
+    workers: int | None = Field(default=None, ge=1, le=64)
 
 
 class CSVImportError(BaseModel):
@@ -14,6 +16,16 @@ class CSVImportError(BaseModel):
     fields: dict[str, str] | None = None
 
 
+class CSVFileImportResult(BaseModel):
+    data_path: str
+    method: str
+    processed: int
+    inserted: int
+    skipped: int
+    error_count: int
+    errors: list[CSVImportError] = Field(default_factory=list)
+
+
 class CSVImportResult(BaseModel):
     processed: int
     inserted: int
@@ -21,6 +33,7 @@ class CSVImportResult(BaseModel):
     skipped: int
     error_count: int
     errors: list[CSVImportError] = Field(default_factory=list)
+    files: list[CSVFileImportResult] = Field(default_factory=list)
 
 
 class CSVExportResult(BaseModel):
@@ -1,9 +1,10 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from coffee_backend.schemas.common import TimestampedSchema
+from coffee_backend.schemas.common import BaseSchema, TimestampedSchema
 
 
 class StudyRequest(BaseModel):
@@ -19,6 +20,7 @@ class StudyContextRead(BaseModel):
     variant_id: str
     bean_id: UUID | None = None
     equipment_id: UUID | None = None
+    sampler: str = "tpe"
 
 
 class SuggestionRead(TimestampedSchema):
@@ -35,21 +37,51 @@ class SuggestRequest(StudyRequest):
     pass
 
 
+class BatchSuggestRequest(StudyRequest):
+    count: int = Field(default=1, ge=1, le=100)
+
+
 class ApplySuggestionRequest(BaseModel):
     brew_id: UUID
     score: float | None = None
     failed: bool = False
 
 
+class BulkApplyItem(ApplySuggestionRequest):
+    suggestion_id: UUID
+
+
+class BulkApplyRequest(BaseModel):
+    items: list[BulkApplyItem] = Field(min_length=1, max_length=500)
+
+
+class BulkApplyItemResult(BaseModel):
+    suggestion_id: UUID
+    status: Literal["applied", "error"]
+    code: str | None = None
+    detail: str | None = None
+    suggestion: SuggestionRead | None = None
+
+
+class BulkApplyResponse(BaseModel):
+    applied: int
+    failed: int
+    results: list[BulkApplyItemResult]
+
+
 class OptimisationInsight(BaseModel):
     study_key: str
     trial_count: int
     parameter_importance: dict[str, float]
     generated_at: datetime
+    computed_at: datetime
+    computed_trial_count: int
+    stale: bool
 
 
 class WarmStartRequest(StudyRequest):
     limit: int | None = Field(default=None, ge=1, le=500)
+    full: bool = False
 
 
 class WarmStartResponse(BaseModel):
@@ -57,3 +89,16 @@ class WarmStartResponse(BaseModel):
     scanned: int
     added: int
     skipped: int
+
+
+class WarmStartJobRead(BaseSchema):
+    id: UUID
+    study_key: str
+    status: Literal["queued", "running", "completed", "failed"]
+    scanned: int
+    added: int
+    skipped: int
+    error_code: str | None = None
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
@@ -0,0 +1,409 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from coffee_backend.core.config import get_settings
+from coffee_backend.db.models.bean import Bean
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.equipment import Equipment
+from coffee_backend.schemas.parameter_registry import METHOD_PARAMETER_REGISTRY
+from coffee_backend.services.analytics_rollups import method_name
+
+DASHBOARD_PERCENTILES = (10.0, 25.0, 50.0, 75.0, 90.0)
+NUMERIC_PARAMETER_TYPES = ("int", "float", "bool")
+
+
+@dataclass(frozen=True)
+class BrewArrays:
+    day: np.ndarray
+    score: np.ndarray
+    method: np.ndarray
+    methods: tuple[str, ...]
+    bean: np.ndarray
+    beans: tuple[tuple[str | None, str | None], ...]
+    equipment: np.ndarray
+    equipment_labels: tuple[tuple[str | None, str | None], ...]
+    numeric: dict[str, np.ndarray]
+    categorical: dict[str, np.ndarray]
+    choices: dict[str, tuple[str, ...]]
+
+    @property
+    def size(self) -> int:
+        return len(self.score)
+
+
+def _day_ordinals(values: Sequence[datetime]) -> np.ndarray:
+    return np.fromiter(
+        (
+            (value if value.tzinfo is None else value.astimezone(timezone.utc)).toordinal()
+            for value in values
+        ),
+        dtype=np.int64,
+        count=len(values),
+    )
+
+
+def _as_float(value: object) -> float:
+    if isinstance(value, bool | int | float):
+        return float(value)
+    return math.nan
+
+
+def _numeric_column(parameters: Sequence[dict[str, object]], name: str) -> np.ndarray:
+    values = [values.get(name) for values in parameters]
+    try:
+        return np.array(values, dtype=np.float64).reshape(len(values))
+    except (TypeError, ValueError):
+        return np.fromiter((_as_float(value) for value in values), np.float64, len(values))
+
+
+def _encode_groups(
+    keys: Sequence[UUID | None], labels: Sequence[str | None]
+) -> tuple[np.ndarray, tuple[tuple[str | None, str | None], ...]]:
+    index: dict[UUID | None, int] = {None: 0}
+    groups: list[tuple[str | None, str | None]] = [(None, None)]
+    codes = np.empty(len(keys), dtype=np.int64)
+    for position, (key, label) in enumerate(zip(keys, labels, strict=True)):
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(groups)
+            groups.append((str(key), label))
+        codes[position] = code
+    return codes, tuple(groups)
+
+
+def _parameter_kinds(methods: Sequence[str]) -> dict[str, dict[str, Any]]:
+    kinds: dict[str, dict[str, Any]] = {}
+    for method in methods:
+        for name, spec in METHOD_PARAMETER_REGISTRY.get(method, {}).items():
+            current = kinds.get(name)
+            if current is None:
+                kinds[name] = dict(spec)
+            elif current.get("type") != spec.get("type"):
+                current["type"] = "string"
+            elif "choices" in spec:
+                current["choices"] = list(
+                    dict.fromkeys([*current.get("choices", []), *spec["choices"]])
+                )
+    return kinds
+
+
+def _encode_categorical(
+    parameters: Sequence[dict[str, object]], name: str, choices: Sequence[str]
+) -> tuple[np.ndarray, tuple[str, ...]]:
+    index = {choice: code for code, choice in enumerate(choices)}
+    codes = np.full(len(parameters), -1, dtype=np.int64)
+    for position, values in enumerate(parameters):
+        value = values.get(name)
+        if value is None:
+            continue
+        value = str(value)
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(index)
+        codes[position] = code
+    return codes, tuple(index)
+
+
+def load_brew_arrays(db: Session, user_id: UUID) -> BrewArrays:
+    rows = db.execute(
+        select(
+            Brew.method,
+            Brew.brewed_at,
+            Brew.score,
+            Brew.bean_id,
+            Bean.name,
+            Brew.equipment_id,
+            Equipment.grinder_model,
+            Brew.parameters,
+        )
+        .outerjoin(Bean, Bean.id == Brew.bean_id)
+        .outerjoin(Equipment, Equipment.id == Brew.equipment_id)
+        .where(Brew.user_id == user_id)
+        .order_by(Brew.brewed_at)
+    ).all()
+    size = len(rows)
+    methods_column, brewed_at, scores, bean_ids, bean_names, equipment_ids, grinders, params = (
+        zip(*rows, strict=True) if rows else ((),) * 8
+    )
+
+    methods, method_codes = np.unique(
+        np.array([method_name(method) for method in methods_column], dtype=object),
+        return_inverse=True,
+    )
+    parameters = [values or {} for values in params]
+    bean_codes, beans = _encode_groups(bean_ids, bean_names)
+    equipment_codes, equipment_labels = _encode_groups(equipment_ids, grinders)
+
+    numeric: dict[str, np.ndarray] = {}
+    categorical: dict[str, np.ndarray] = {}
+    choices: dict[str, tuple[str, ...]] = {}
+    for name, spec in _parameter_kinds(methods.tolist()).items():
+        if spec.get("type") in NUMERIC_PARAMETER_TYPES:
+            numeric[name] = _numeric_column(parameters, name)
+        else:
+            categorical[name], choices[name] = _encode_categorical(
+                parameters, name, spec.get("choices", [])
+            )
+
+    return BrewArrays(
+        day=_day_ordinals(brewed_at),
+        score=np.fromiter(
+            (math.nan if score is None else score for score in scores),
+            dtype=np.float64,
+            count=size,
+        ),
+        method=method_codes.astype(np.int64, copy=False).reshape(size),
+        methods=tuple(methods.tolist()),
+        bean=bean_codes,
+        beans=beans,
+        equipment=equipment_codes,
+        equipment_labels=equipment_labels,
+        numeric=numeric,
+        categorical=categorical,
+        choices=choices,
+    )
+
+
+def _optional(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
+
+
+@dataclass(frozen=True)
+class GroupStats:
+    brews: np.ndarray
+    scored: np.ndarray
+    avg_score: np.ndarray
+    best_score: np.ndarray
+    percentiles: np.ndarray
+
+    def row(self, group: int) -> dict[str, object]:
+        return {
+            "brews": int(self.brews[group]),
+            "scored": int(self.scored[group]),
+            "avg_score": _optional(self.avg_score[group]),
+            "best_score": _optional(self.best_score[group]),
+            "percentiles": {
+                f"p{quantile:g}": _optional(value)
+                for quantile, value in zip(
+                    DASHBOARD_PERCENTILES, self.percentiles[group], strict=True
+                )
+            },
+        }
+
+
+def group_stats(codes: np.ndarray, groups: int, score: np.ndarray) -> GroupStats:
+    brews = np.bincount(codes, minlength=groups)
+    scored = ~np.isnan(score)
+    order = np.lexsort((score[scored], codes[scored]))
+    codes, values = codes[scored][order], score[scored][order]
+    counts = np.bincount(codes, minlength=groups)
+    sums = np.bincount(codes, weights=values, minlength=groups)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    present = counts > 0
+
+    avg_score = np.full(groups, np.nan)
+    np.divide(sums, counts, out=avg_score, where=present)
+    best_score = np.full(groups, np.nan)
+    best_score[present] = values[ends[present] - 1]
+
+    percentiles = np.full((groups, len(DASHBOARD_PERCENTILES)), np.nan)
+    if present.any():
+        positions = (counts[present, None] - 1) * (np.array(DASHBOARD_PERCENTILES) / 100.0)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.ceil(positions).astype(np.int64)
+        offsets = starts[present, None]
+        below, above = values[offsets + lower], values[offsets + upper]
+        percentiles[present] = below + (above - below) * (positions - lower)
+
+    return GroupStats(
+        brews=brews,
+        scored=counts,
+        avg_score=avg_score,
+        best_score=best_score,
+        percentiles=percentiles,
+    )
+
+
+def _day_label(day: int) -> str:
+    return date.fromordinal(day).isoformat()
+
+
+def score_trend(arrays: BrewArrays, window: int) -> list[dict[str, object]]:
+    days, inverse = np.unique(arrays.day, return_inverse=True)
+    scored = ~np.isnan(arrays.score)
+    brews = np.bincount(inverse, minlength=len(days))
+    counts = np.bincount(inverse[scored], minlength=len(days))
+    sums = np.bincount(inverse[scored], weights=arrays.score[scored], minlength=len(days))
+
+    running_counts = np.concatenate(([0], np.cumsum(counts)))
+    running_sums = np.concatenate(([0.0], np.cumsum(sums)))
+    starts = np.searchsorted(days, days - window + 1)
+    window_counts = running_counts[1:] - running_counts[starts]
+    window_sums = running_sums[1:] - running_sums[starts]
+
+    avg_score = np.full(len(days), np.nan)
+    np.divide(sums, counts, out=avg_score, where=counts > 0)
+    rolling_avg = np.full(len(days), np.nan)
+    np.divide(window_sums, window_counts, out=rolling_avg, where=window_counts > 0)
+    return [
+        {
+            "date": _day_label(day),
+            "brews": int(total),
+            "avg_score": _optional(average),
+            "rolling_avg": _optional(rolling),
+        }
+        for day, total, average, rolling in zip(
+            days.tolist(), brews, avg_score, rolling_avg, strict=True
+        )
+    ]
+
+
+def _bin_edges(spec: dict[str, Any], values: np.ndarray, bins: int) -> np.ndarray:
+    lower = min(float(spec.get("min", values.min())), float(values.min()))
+    upper = max(float(spec.get("max", values.max())), float(values.max()))
+    if spec.get("type") in ("int", "bool") and upper - lower + 1 <= bins:
+        return np.arange(lower, upper + 2)
+    if lower == upper:
+        return np.array([lower, lower + 1])
+    return np.linspace(lower, upper, bins + 1)
+
+
+def parameter_curves(
+    arrays: BrewArrays, method_code: int, bins: int
+) -> dict[str, list[dict[str, object]]]:
+    in_method = arrays.method == method_code
+    curves: dict[str, list[dict[str, object]]] = {}
+    for name, spec in METHOD_PARAMETER_REGISTRY.get(arrays.methods[method_code], {}).items():
+        if name in arrays.numeric:
+            column = arrays.numeric[name]
+            mask = in_method & ~np.isnan(column)
+            if not mask.any():
+                continue
+            values = column[mask]
+            edges = _bin_edges(spec, values, bins)
+            codes = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 2)
+            stats = group_stats(codes, len(edges) - 1, arrays.score[mask])
+            curves[name] = [
+                {"lower": float(edges[group]), "upper": float(edges[group + 1]), **stats.row(group)}
+                for group in np.flatnonzero(stats.brews).tolist()
+            ]
+        elif name in arrays.categorical:
+            column = arrays.categorical[name]
+            mask = in_method & (column >= 0)
+            if not mask.any():
+                continue
+            choices = arrays.choices[name]
+            stats = group_stats(column[mask], len(choices), arrays.score[mask])
+            curves[name] = [
+                {"value": choices[group], **stats.row(group)}
+                for group in np.flatnonzero(stats.brews).tolist()
+            ]
+    return curves
+
+
+def _breakdown(
+    codes: np.ndarray, groups: Sequence[tuple[str | None, str | None]], score: np.ndarray
+) -> list[dict[str, object]]:
+    stats = group_stats(codes, len(groups), score)
+    return [
+        {"id": groups[group][0], "name": groups[group][1], **stats.row(group)}
+        for group in np.flatnonzero(stats.brews).tolist()
+    ]
+
+
+def compute_dashboard(arrays: BrewArrays, window: int = 7, bins: int = 10) -> dict[str, object]:
+    overall = group_stats(np.zeros(arrays.size, dtype=np.int64), 1, arrays.score)
+    methods = group_stats(arrays.method, len(arrays.methods), arrays.score)
+    return {
+        "summary": overall.row(0),
+        "methods": {name: methods.row(code) for code, name in enumerate(arrays.methods)},
+        "trend": score_trend(arrays, window),
+        "parameters": {
+            name: parameter_curves(arrays, code, bins) for code, name in enumerate(arrays.methods)
+        },
+        "beans": _breakdown(arrays.bean, arrays.beans, arrays.score),
+        "equipment": _breakdown(arrays.equipment, arrays.equipment_labels, arrays.score),
+    }
+
+
+@dataclass(frozen=True)
+class BrewArrayCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    max_entries: int
+
+
+class BrewArrayCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[BrewArrays, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, user_id: UUID, load: Callable[[], BrewArrays]) -> BrewArrays:
+        if self.max_entries <= 0:
+            return load()
+
+        key = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+
+        arrays = load()
+        with self._lock:
+            self._entries[key] = (arrays, now + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return arrays
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> BrewArrayCacheStats:
+        with self._lock:
+            return BrewArrayCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+@lru_cache(maxsize=1)
+def get_brew_array_cache() -> BrewArrayCache:
+    settings = get_settings()
+    return BrewArrayCache(
+        max_entries=settings.analytics_cache_max_entries,
+        ttl_seconds=settings.analytics_cache_ttl_seconds,
+    )
@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.brew_rollup import BrewDailyRollup
+
+RollupKey = tuple[UUID, str, date]
+
+
+def rollup_day(brewed_at: datetime) -> date:
+    if brewed_at.tzinfo is not None:
+        brewed_at = brewed_at.astimezone(timezone.utc)
+    return brewed_at.date()
+
+
+def method_name(method: object) -> str:
+    return str(method.value) if hasattr(method, "value") else str(method)
+
+
+def rollup_key(brew: Any) -> RollupKey:
+    return (brew.user_id, method_name(brew.method), rollup_day(brew.brewed_at))
+
+
+@dataclass
+class RollupDelta:
+    brew_count: int = 0
+    score_count: int = 0
+    score_sum: float = 0.0
+    score_min: float | None = None
+    score_max: float | None = None
+
+    def add(self, score: float | None) -> None:
+        self.brew_count += 1
+        if score is None:
+            return
+        self.score_count += 1
+        self.score_sum += score
+        self.score_min = score if self.score_min is None else min(self.score_min, score)
+        self.score_max = score if self.score_max is None else max(self.score_max, score)
+
+
+def aggregate_brews(brews: Iterable[Any]) -> dict[RollupKey, RollupDelta]:
+    deltas: dict[RollupKey, RollupDelta] = {}
+    for brew in brews:
+        if isinstance(brew, Mapping):
+            user_id, method = brew["user_id"], brew["method"]
+            brewed_at, score = brew["brewed_at"], brew["score"]
+        else:
+            user_id, method, brewed_at, score = (
+                brew.user_id,
+                brew.method,
+                brew.brewed_at,
+                brew.score,
+            )
+        key = (user_id, method_name(method), rollup_day(brewed_at))
+        deltas.setdefault(key, RollupDelta()).add(None if score is None else float(score))
+    return deltas
+
+
+class BrewRollupService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _values(self, key: RollupKey, delta: RollupDelta) -> dict[str, object]:
+        user_id, method, day = key
+        return {
+            "user_id": user_id,
+            "method": method,
+            "day": day,
+            "brew_count": delta.brew_count,
+            "score_count": delta.score_count,
+            "score_sum": delta.score_sum,
+            "score_min": delta.score_min,
+            "score_max": delta.score_max,
+        }
+
+    def add_brews(self, brews: Iterable[Any]) -> None:
+        deltas = aggregate_brews(brews)
+        if not deltas:
+            return
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement: Any = pg_insert(BrewDailyRollup)
+            least: Callable[..., Any] = func.least
+            greatest: Callable[..., Any] = func.greatest
+        elif dialect == "sqlite":
+            statement = sqlite_insert(BrewDailyRollup)
+            least, greatest = func.min, func.max
+        else:
+            self.db.flush()
+            self.refresh(deltas)
+            return
+
+        statement = statement.values([self._values(key, delta) for key, delta in deltas.items()])
+        current, excluded = BrewDailyRollup.__table__.c, statement.excluded
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["user_id", "method", "day"],
+                set_={
+                    "brew_count": current.brew_count + excluded.brew_count,
+                    "score_count": current.score_count + excluded.score_count,
+                    "score_sum": current.score_sum + excluded.score_sum,
+                    "score_min": least(
+                        func.coalesce(current.score_min, excluded.score_min),
+                        func.coalesce(excluded.score_min, current.score_min),
+                    ),
+                    "score_max": greatest(
+                        func.coalesce(current.score_max, excluded.score_max),
+                        func.coalesce(excluded.score_max, current.score_max),
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def refresh(self, keys: Iterable[RollupKey]) -> None:
+        for user_id, method, day in set(keys):
+            start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+            brew_count, score_count, score_sum, score_min, score_max = self.db.execute(
+                select(
+                    func.count(),
+                    func.count(Brew.score),
+                    func.sum(Brew.score),
+                    func.min(Brew.score),
+                    func.max(Brew.score),
+                ).where(
+                    Brew.user_id == user_id,
+                    Brew.method == method,
+                    Brew.brewed_at >= start,
+                    Brew.brewed_at < start + timedelta(days=1),
+                )
+            ).one()
+            self.db.execute(
+                delete(BrewDailyRollup).where(
+                    BrewDailyRollup.user_id == user_id,
+                    BrewDailyRollup.method == method,
+                    BrewDailyRollup.day == day,
+                )
+            )
+            if brew_count:
+                self.db.execute(
+                    insert(BrewDailyRollup).values(
+                        user_id=user_id,
+                        method=method,
+                        day=day,
+                        brew_count=brew_count,
+                        score_count=score_count,
+                        score_sum=score_sum or 0.0,
+                        score_min=score_min,
+                        score_max=score_max,
+                    )
+                )
+
+    def rebuild(self, user_id: UUID | None = None, batch_size: int = 1000) -> int:
+        rollups = delete(BrewDailyRollup)
+        brews = select(Brew.user_id, Brew.method, Brew.brewed_at, Brew.score)
+        if user_id is not None:
+            rollups = rollups.where(BrewDailyRollup.user_id == user_id)
+            brews = brews.where(Brew.user_id == user_id)
+        self.db.execute(rollups)
+        deltas = aggregate_brews(
+            self.db.execute(brews.execution_options(yield_per=batch_size)).yield_per(batch_size)
+        )
+        rows = [self._values(key, delta) for key, delta in deltas.items()]
+        for offset in range(0, len(rows), batch_size):
+            self.db.execute(insert(BrewDailyRollup), rows[offset : offset + batch_size])
+        self.db.commit()
+        return len(rows)
@@ -3,26 +3,41 @@ from uuid import UUID
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.brew_rollup import BrewDailyRollup
+from coffee_backend.services.analytics_engine import (
+    BrewArrayCache,
+    compute_dashboard,
+    get_brew_array_cache,
+    load_brew_arrays,
+)
 
 
 class AnalyticsService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, array_cache: BrewArrayCache | None = None):
         self.db = db
+        self.array_cache = array_cache or get_brew_array_cache()
 
     def best_per_method(self, user_id: UUID) -> dict[str, dict[str, float | str]]:
         rows = self.db.execute(
-            select(Brew.method, func.max(Brew.score))
-            .where(Brew.user_id == user_id)
-            .group_by(Brew.method)
+            select(BrewDailyRollup.method, func.max(BrewDailyRollup.score_max))
+            .where(BrewDailyRollup.user_id == user_id)
+            .group_by(BrewDailyRollup.method)
         ).all()
         return {method: {"best_score": score} for method, score in rows if score is not None}
 
     def score_trend(self, user_id: UUID) -> list[dict[str, float | str]]:
         rows = self.db.execute(
-            select(func.date(Brew.brewed_at), func.avg(Brew.score))
-            .where(Brew.user_id == user_id, Brew.score.is_not(None))
-            .group_by(func.date(Brew.brewed_at))
-            .order_by(func.date(Brew.brewed_at))
+            select(
+                BrewDailyRollup.day,
+                func.sum(BrewDailyRollup.score_sum),
+                func.sum(BrewDailyRollup.score_count),
+            )
+            .where(BrewDailyRollup.user_id == user_id, BrewDailyRollup.score_count > 0)
+            .group_by(BrewDailyRollup.day)
+            .order_by(BrewDailyRollup.day)
         ).all()
-        return [{"date": str(day), "avg_score": float(avg)} for day, avg in rows if day is not None]
+        return [{"date": str(day), "avg_score": float(total) / count} for day, total, count in rows]
+
+    def dashboard(self, user_id: UUID, window: int = 7, bins: int = 10) -> dict[str, object]:
+        arrays = self.array_cache.get(user_id, lambda: load_brew_arrays(self.db, user_id))
+        return compute_dashboard(arrays, window=window, bins=bins)
@@ -1,14 +1,36 @@
 from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.orm import Session
 
 from coffee_backend.core.exceptions import NotFoundError
 from coffee_backend.db.models.brew import Brew
 from coffee_backend.db.models.enums import BrewStatus
-from coffee_backend.db.models.method_profile import MethodProfile
 from coffee_backend.schemas.brew import BrewCreate
+from coffee_backend.services.analytics_engine import get_brew_array_cache
+from coffee_backend.services.analytics_rollups import BrewRollupService
+from coffee_backend.services.method_profile_registry import get_method_profile_registry
+from coffee_backend.services.pagination import (
+    KeysetOrder,
+    KeysetPage,
+    get_count_cache,
+    keyset_paginate,
+)
 from coffee_backend.services.parameter_validation import validate_method_parameters
+from coffee_backend.services.user_service import UserService
+
+BREW_KEYSET_ORDERS = {
+    (sort_by, sort_order): KeysetOrder(
+        name=f"{sort_by}:{sort_order}",
+        column=Brew.brewed_at if sort_by == "date" else Brew.score,
+        id_column=Brew.id,
+        descending=sort_order == "desc",
+        nullable=sort_by == "score",
+    )
+    for sort_by in ("date", "score")
+    for sort_order in ("asc", "desc")
+}
 
 
 class BrewService:
@@ -18,22 +40,11 @@ class BrewService:
     def _resolve_variant_id(self, method_id: str, variant_id: str | None) -> str:
         if variant_id is not None:
             return variant_id
-
-        profiles = list(
-            self.db.scalars(
-                select(MethodProfile)
-                .where(MethodProfile.method_id == method_id)
-                .order_by(MethodProfile.variant_id.asc(), MethodProfile.schema_version.desc())
-            )
-        )
-        if not profiles:
-            return f"{method_id}_default"
-
-        default_variant = next((p.variant_id for p in profiles if "default" in p.variant_id), None)
-        return default_variant or profiles[0].variant_id
+        default_variant = get_method_profile_registry(self.db).default_variant(method_id)
+        return default_variant or f"{method_id}_default"
 
     def create_brew(
-        self, user_id: str, payload: BrewCreate, import_hash: str | None = None
+        self, user_id: UUID, payload: BrewCreate, import_hash: str | None = None
     ) -> Brew:
         validate_method_parameters(payload.method, payload.parameters)
         brew_payload = payload.model_dump()
@@ -41,13 +52,44 @@ class BrewService:
         brew_payload["status"] = BrewStatus(payload.status)
         brew = Brew(user_id=user_id, **brew_payload, import_hash=import_hash)
         self.db.add(brew)
+        BrewRollupService(self.db).add_brews([brew])
         self.db.commit()
+        UserService(self.db).bump_brew_version(user_id)
         self.db.refresh(brew)
+        get_count_cache().invalidate(Brew, user_id)
+        get_brew_array_cache().invalidate(user_id)
         return brew
 
+    def _list_filters(
+        self,
+        user_id: UUID,
+        method: str | None,
+        brewed_from: datetime | None,
+        brewed_to: datetime | None,
+    ) -> list[ColumnElement[bool]]:
+        filters = [Brew.user_id == user_id]
+        if method is not None:
+            filters.append(Brew.method == method)
+        if brewed_from is not None:
+            filters.append(Brew.brewed_at >= brewed_from)
+        if brewed_to is not None:
+            filters.append(Brew.brewed_at <= brewed_to)
+        return filters
+
+    def _count(
+        self,
+        user_id: UUID,
+        filters: list[ColumnElement[bool]],
+        method: str | None,
+        brewed_from: datetime | None,
+        brewed_to: datetime | None,
+    ) -> int:
+        filter_key = (method, brewed_from, brewed_to)
+        return get_count_cache().count(self.db, Brew, user_id, filters, filter_key)
+
     def list_brews(
         self,
-        user_id: str,
+        user_id: UUID,
         page: int | None = None,
         page_size: int | None = None,
         include_total: bool = False,
@@ -57,14 +99,7 @@ class BrewService:
         sort_by: str = "date",
         sort_order: str = "desc",
     ) -> tuple[list[Brew], int | None]:
-        filters = [Brew.user_id == user_id]
-        if method is not None:
-            filters.append(Brew.method == method)
-        if brewed_from is not None:
-            filters.append(Brew.brewed_at >= brewed_from)
-        if brewed_to is not None:
-            filters.append(Brew.brewed_at <= brewed_to)
-
+        filters = self._list_filters(user_id, method, brewed_from, brewed_to)
         sort_column = Brew.brewed_at if sort_by == "date" else Brew.score
         order_clause = sort_column.asc() if sort_order == "asc" else sort_column.desc()
 
@@ -72,7 +107,7 @@ class BrewService:
 
         total: int | None = None
         if include_total:
-            total = self.db.scalar(select(func.count()).select_from(Brew).where(*filters)) or 0
+            total = self._count(user_id, filters, method, brewed_from, brewed_to)
 
         if page is not None and page_size is not None:
             offset = (page - 1) * page_size
@@ -80,8 +115,28 @@ class BrewService:
 
         return list(self.db.scalars(query)), total
 
-    def get_brew(self, user_id: str, brew_id: str) -> Brew:
+    def get_brew(self, user_id: UUID, brew_id: UUID) -> Brew:
         brew = self.db.scalar(select(Brew).where(Brew.id == brew_id, Brew.user_id == user_id))
         if brew is None:
             raise NotFoundError("Brew not found", code="brew_not_found")
         return brew
+
+    def list_brews_page(
+        self,
+        user_id: UUID,
+        cursor: str | None = None,
+        limit: int = 20,
+        include_total: bool = False,
+        method: str | None = None,
+        brewed_from: datetime | None = None,
+        brewed_to: datetime | None = None,
+        sort_by: str = "date",
+        sort_order: str = "desc",
+    ) -> tuple[KeysetPage, int | None]:
+        filters = self._list_filters(user_id, method, brewed_from, brewed_to)
+        order = BREW_KEYSET_ORDERS[(sort_by, sort_order)]
+        page = keyset_paginate(self.db, select(Brew).where(*filters), order, cursor, limit)
+        total = (
+            self._count(user_id, filters, method, brewed_from, brewed_to) if include_total else None
+        )
+        return page, total
@@ -0,0 +1,187 @@
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any
+
+import orjson
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.schemas.parameter_registry import METHOD_PARAMETER_REGISTRY
+
+PARQUET_FORMAT = "parquet"
+ARROW_FORMAT = "arrow"
+NDJSON_FORMAT = "ndjson"
+
+COLUMNAR_FORMATS = (PARQUET_FORMAT, ARROW_FORMAT, NDJSON_FORMAT)
+COLUMNAR_REQUIREMENTS: dict[str, tuple[str, ...]] = {
+    PARQUET_FORMAT: ("pyarrow",),
+    ARROW_FORMAT: ("pyarrow",),
+}
+COLUMNAR_MEDIA_TYPES = {
+    PARQUET_FORMAT: "application/vnd.apache.parquet",
+    ARROW_FORMAT: "application/vnd.apache.arrow.stream",
+    NDJSON_FORMAT: "application/x-ndjson",
+}
+COLUMNAR_EXTENSIONS = {
+    PARQUET_FORMAT: "parquet",
+    ARROW_FORMAT: "arrows",
+    NDJSON_FORMAT: "ndjson",
+}
+PARAMETER_COLUMN_PREFIX = "param_"
+
+BASE_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "string"),
+    ("method", "string"),
+    ("variant_id", "string"),
+    ("brewed_at", "timestamp"),
+    ("score", "float"),
+    ("status", "string"),
+    ("comments", "string"),
+)
+
+_CASTS: dict[str, Callable[[Any], object]] = {
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "categorical": str,
+    "string": str,
+}
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    name: str
+    kind: str
+    parameter: str | None = None
+
+    def cast(self, value: object) -> object:
+        if value is None:
+            return None
+        return _CASTS.get(self.kind, str)(value)
+
+
+def resolve_columnar_format(requested: str) -> str:
+    if requested not in COLUMNAR_FORMATS:
+        raise ValidationError(
+            f"Unsupported export format '{requested}'",
+            code="invalid_export_format",
+            fields={"format": f"one of {list(COLUMNAR_FORMATS)}"},
+        )
+    if any(find_spec(module) is None for module in COLUMNAR_REQUIREMENTS.get(requested, ())):
+        return NDJSON_FORMAT
+    return requested
+
+
+def build_column_specs(methods: Sequence[str]) -> list[ColumnSpec]:
+    parameters: dict[str, str] = {}
+    for method in methods:
+        for name, spec in METHOD_PARAMETER_REGISTRY.get(method, {}).items():
+            kind = spec.get("type", "string")
+            parameters[name] = kind if parameters.get(name, kind) == kind else "string"
+    return [
+        *(ColumnSpec(name, kind) for name, kind in BASE_COLUMNS),
+        *(
+            ColumnSpec(f"{PARAMETER_COLUMN_PREFIX}{name}", kind, parameter=name)
+            for name, kind in parameters.items()
+        ),
+        ColumnSpec("extra_data", "json"),
+    ]
+
+
+def flatten_brew(columns: Sequence[ColumnSpec], row: Any) -> dict[str, object]:
+    parameters = row.parameters or {}
+    record: dict[str, object] = {}
+    for column in columns:
+        if column.parameter is not None:
+            record[column.name] = column.cast(parameters.get(column.parameter))
+        elif column.name == "id":
+            record["id"] = str(row.id)
+        elif column.name == "status":
+            record["status"] = row.status.value if hasattr(row.status, "value") else row.status
+        elif column.name == "extra_data":
+            record["extra_data"] = row.extra_data
+        elif column.kind == "timestamp":
+            record[column.name] = getattr(row, column.name)
+        else:
+            record[column.name] = column.cast(getattr(row, column.name))
+    return record
+
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self.chunks)
+        self.chunks.clear()
+        return chunk
+
+
+def _arrow_schema(columns: Sequence[ColumnSpec]) -> Any:
+    import pyarrow as pa
+
+    types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(column.name, types.get(column.kind, pa.string())) for column in columns])
+
+
+def _arrow_batch(schema: Any, columns: Sequence[ColumnSpec], records: list[dict]) -> Any:
+    import pyarrow as pa
+
+    arrays = []
+    for column in columns:
+        values = [record[column.name] for record in records]
+        if column.kind == "json":
+            values = [None if value is None else json.dumps(value) for value in values]
+        arrays.append(pa.array(values, type=schema.field(column.name).type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def encode_columnar(
+    export_format: str, columns: Sequence[ColumnSpec], batches: Iterable[list[dict]]
+) -> Iterator[bytes]:
+    if export_format == NDJSON_FORMAT:
+        for records in batches:
+            yield b"".join(orjson.dumps(record) + b"\n" for record in records)
+        return
+
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+
+    sink = _ChunkSink()
+    schema = _arrow_schema(columns)
+    writer = (
+        pq.ParquetWriter(sink, schema, compression="zstd")
+        if export_format == PARQUET_FORMAT
+        else ipc.new_stream(sink, schema)
+    )
+    try:
+        for records in batches:
+            writer.write_batch(_arrow_batch(schema, columns, records))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
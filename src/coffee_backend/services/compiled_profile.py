@@ -0,0 +1,173 @@
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import optuna
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.method_profile_registry import MethodProfileRecord
+from coffee_backend.services.validation_engine import (
+    CATEGORICAL_KIND,
+    FLOAT_KIND,
+    INT_KIND,
+    Choice,
+    CompiledValidator,
+    ParameterRule,
+    compile_profile_validator,
+    rows_to_columns,
+)
+
+ParamSuggester = Callable[[optuna.Trial], object]
+ProfileKey = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class CompiledParameter:
+    name: str
+    distribution: optuna.distributions.BaseDistribution
+    suggest: ParamSuggester
+
+
+@dataclass(frozen=True)
+class CompiledMethodProfile:
+    method_id: str
+    variant_id: str
+    schema_version: int
+    source: tuple[dict[str, object], ...]
+    parameters: tuple[CompiledParameter, ...]
+    distributions: dict[str, optuna.distributions.BaseDistribution]
+    validator: CompiledValidator
+    hard_caps: tuple[Callable[[dict[str, object]], None], ...]
+
+    @property
+    def key(self) -> ProfileKey:
+        return (self.method_id, self.variant_id, self.schema_version)
+
+    def suggest(self, trial: optuna.Trial) -> dict[str, object]:
+        return {parameter.name: parameter.suggest(trial) for parameter in self.parameters}
+
+    def validate(self, params: dict[str, object]) -> None:
+        self.validator.validate(params)
+        for check in self.hard_caps:
+            check(params)
+
+    def validate_many(self, rows: Sequence[dict[str, object]]) -> None:
+        columns = rows_to_columns(rows, list(self.distributions))
+        result = self.validator.validate_columns(columns, len(rows))
+        invalid = np.flatnonzero(result.row_errors)
+        stop = int(invalid[0]) if len(invalid) else len(rows)
+        for params in rows[:stop]:
+            for check in self.hard_caps:
+                check(params)
+        if stop == len(rows):
+            return
+        self.validator.validate(rows[stop])
+        name = next(name for name, mask in result.masks.items() if mask[stop])
+        raise _invalid(name, f"rejected in row {stop}", "invalid value")
+
+
+def _invalid(name: str, detail: str, field: str) -> ValidationError:
+    return ValidationError(
+        f"Invalid value for '{name}': {detail}",
+        code="invalid_suggested_params",
+        fields={name: field},
+    )
+
+
+def _compile_parameter(rule: ParameterRule) -> CompiledParameter:
+    name = rule.name
+    if rule.kind == INT_KIND:
+        bounds = rule.bounds
+        low, high, step = int(bounds[0]), int(bounds[1]), int(rule.step or 1)
+        return CompiledParameter(
+            name=name,
+            distribution=optuna.distributions.IntDistribution(low=low, high=high, step=step),
+            suggest=lambda trial: trial.suggest_int(name, low, high, step=step),
+        )
+    if rule.kind == FLOAT_KIND:
+        f_low, f_high = (float(bound) for bound in rule.bounds)
+        f_step = float(rule.step) if rule.step is not None else None
+        return CompiledParameter(
+            name=name,
+            distribution=optuna.distributions.FloatDistribution(
+                low=f_low, high=f_high, step=f_step
+            ),
+            suggest=lambda trial: trial.suggest_float(name, f_low, f_high, step=f_step),
+        )
+    choices: list[Choice] = (
+        list(rule.choices or ()) if rule.kind == CATEGORICAL_KIND else [True, False]
+    )
+    return CompiledParameter(
+        name=name,
+        distribution=optuna.distributions.CategoricalDistribution(choices=choices),
+        suggest=lambda trial: trial.suggest_categorical(name, choices),
+    )
+
+
+def _v60_total_time_cap(params: dict[str, object]) -> None:
+    if "total_time_s" not in params:
+        return
+    value = params["total_time_s"]
+    if not isinstance(value, int):
+        raise _invalid("total_time_s", "expected int", "expected int")
+    if not (120 <= value <= 300):
+        raise _invalid(
+            "total_time_s",
+            "must be within hard cap 120-300 seconds",
+            "hard cap 120-300",
+        )
+
+
+def _aeropress_plunge_cap(params: dict[str, object]) -> None:
+    if "plunge_s" not in params:
+        return
+    value = params["plunge_s"]
+    if not isinstance(value, int):
+        raise _invalid("plunge_s", "expected int", "expected int")
+    if value > 60:
+        raise _invalid("plunge_s", "must be <= 60 seconds hard cap", "hard cap <= 60")
+
+
+METHOD_HARD_CAPS: dict[str, tuple[Callable[[dict[str, object]], None], ...]] = {
+    "v60": (_v60_total_time_cap,),
+    "aeropress": (_aeropress_plunge_cap,),
+}
+
+
+def build_compiled_profile(profile: MethodProfile | MethodProfileRecord) -> CompiledMethodProfile:
+    validator = compile_profile_validator(profile.parameters)
+    parameters = tuple(_compile_parameter(rule) for rule in validator.rules)
+    return CompiledMethodProfile(
+        method_id=profile.method_id,
+        variant_id=profile.variant_id,
+        schema_version=profile.schema_version,
+        source=tuple(dict(spec) for spec in profile.parameters),
+        parameters=parameters,
+        distributions={parameter.name: parameter.distribution for parameter in parameters},
+        validator=validator,
+        hard_caps=METHOD_HARD_CAPS.get(profile.method_id, ()),
+    )
+
+
+_compiled_profiles: dict[ProfileKey, CompiledMethodProfile] = {}
+_compiled_profiles_lock = threading.Lock()
+
+
+def compile_method_profile(profile: MethodProfile | MethodProfileRecord) -> CompiledMethodProfile:
+    key = (profile.method_id, profile.variant_id, profile.schema_version)
+    with _compiled_profiles_lock:
+        compiled = _compiled_profiles.get(key)
+    if compiled is not None and list(compiled.source) == list(profile.parameters):
+        return compiled
+
+    compiled = build_compiled_profile(profile)
+    with _compiled_profiles_lock:
+        _compiled_profiles[key] = compiled
+    return compiled
+
+
+def invalidate_compiled_profiles() -> None:
+    with _compiled_profiles_lock:
+        _compiled_profiles.clear()
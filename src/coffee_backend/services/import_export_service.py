@@ -1,24 +1,48 @@
 import csv
+import glob
 import hashlib
+import io
 import json
+import math
+import multiprocessing
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, select
 from sqlalchemy.orm import Session
 
+from coffee_backend.core.config import get_settings
 from coffee_backend.core.exceptions import ValidationError
 from coffee_backend.db.models.brew import Brew
 from coffee_backend.db.models.enums import BrewStatus
 from coffee_backend.schemas.import_export import (
     CSVExportResult,
+    CSVFileImportResult,
     CSVImportError,
     CSVImportRequest,
     CSVImportResult,
 )
 from coffee_backend.schemas.parameter_registry import METHOD_PARAMETER_REGISTRY
+from coffee_backend.services.analytics_engine import get_brew_array_cache
+from coffee_backend.services.analytics_rollups import BrewRollupService
+from coffee_backend.services.brew_service import BrewService
+from coffee_backend.services.columnar_export import (
+    COLUMNAR_EXTENSIONS,
+    build_column_specs,
+    encode_columnar,
+    flatten_brew,
+    resolve_columnar_format,
+)
+from coffee_backend.services.pagination import get_count_cache
 from coffee_backend.services.parameter_validation import validate_method_parameters
+from coffee_backend.services.user_service import UserService
+from coffee_backend.services.validation_engine import get_registry_validator
 
 LEGACY_IMPORT_ALIASES: dict[str, dict[str, str]] = {
     "aeropress": {
@@ -32,146 +56,364 @@ LEGACY_IMPORT_ALIASES: dict[str, dict[str, str]] = {
 
 LEGACY_EXTRA_DATA_KEYS: dict[str, set[str]] = {"aeropress": {"brand", "pressing time"}}
 
+KNOWN_IMPORT_COLUMNS = {"date", "score", "failed", "comments", "method"}
 
-class ImportExportService:
-    BATCH_SIZE = 250
+EXPORT_COLUMNS = [
+    "id",
+    "method",
+    "brewed_at",
+    "score",
+    "status",
+    "comments",
+    "parameters",
+    "extra_data",
+]
 
-    def __init__(self, db: Session):
-        self.db = db
 
-    def _hash_brew(
-        self, user_id: UUID, brewed_at: datetime, params: dict[str, object], score: object
-    ) -> str:
-        payload = json.dumps(
-            {
-                "user_id": str(user_id),
-                "brewed_at": brewed_at.isoformat(),
-                "parameters": params,
-                "score": score,
-            },
-            sort_keys=True,
-        )
-        return hashlib.sha256(payload.encode()).hexdigest()
+def _encode_json_value(value: object) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    if type(value) is float and math.isfinite(value):
+        return float.__repr__(value)
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return json.dumps(value, sort_keys=True)
+
+
+def _parse_param_value(value: str) -> object:
+    if value.replace(".", "", 1).isdigit():
+        if "." in value:
+            return float(value)
+        return int(value)
+    return value
+
+
+def _scale_legacy_grind_size(value: object) -> object:
+    if isinstance(value, int) and value > 15:
+        return max(1, min(15, round(value / 4)))
+    return value
+
+
+LEGACY_PARAM_NORMALISERS: dict[tuple[str, str], Callable[[object], object]] = {
+    ("aeropress", "grind_size"): _scale_legacy_grind_size,
+}
+
 
-    def _parse_param_value(self, value: str) -> object:
-        if value.replace(".", "", 1).isdigit():
-            if "." in value:
-                return float(value)
-            return int(value)
-        return value
+class CompiledRowTransformer:
+    def __init__(self, parser: "CSVRowParser", header: Sequence[str]):
+        self.parser = parser
+        positions: dict[str, int] = {}
+        for index, name in enumerate(header):
+            positions[name] = index
+        self.width = len(header)
+        self.date_index = positions.get("date")
+        self.score_index = positions.get("score")
+        self.failed_index = positions.get("failed")
+        self.comments_index = positions.get("comments")
+        self.params: list[tuple[int, str, Callable[[object], object] | None]] = []
+        self.extra: list[tuple[int, str]] = []
+        self.unknown: list[tuple[int, str]] = []
+        for raw_key, index in positions.items():
+            if raw_key in KNOWN_IMPORT_COLUMNS:
+                continue
+            key = parser.aliases.get(raw_key, raw_key)
+            if parser.schema is not None and key in parser.schema:
+                normaliser = LEGACY_PARAM_NORMALISERS.get((parser.method, key))
+                self.params.append((index, key, normaliser))
+            elif raw_key in parser.extra_keys or parser._is_legacy_reviewer_column(raw_key):
+                self.extra.append((index, raw_key))
+            else:
+                self.unknown.append((index, raw_key))
 
-    def _normalise_legacy_param(self, method: str, key: str, value: object) -> object:
-        if method == "aeropress" and key == "grind_size" and isinstance(value, int) and value > 15:
-            return max(1, min(15, round(value / 4)))
-        return value
+    def _cell(self, values: Sequence[str], index: int | None) -> str | None:
+        if index is None or index >= len(values):
+            return None
+        return values[index]
+
+    def transform(self, values: Sequence[str]) -> dict[str, object]:
+        if len(values) > self.width:
+            raise ValidationError(
+                "Row has more values than the header",
+                code="unexpected_row_values",
+                fields={"row": f"expected {self.width} values, got {len(values)}"},
+            )
+        date_value = self._cell(values, self.date_index)
+        brewed_at = datetime.fromisoformat(date_value or datetime.now(timezone.utc).isoformat())
+        score_value = self._cell(values, self.score_index)
+        score = float(score_value) if score_value not in (None, "") else None
+        failed = (self._cell(values, self.failed_index) or "false").lower() == "true"
+        width = len(values)
+        for index, raw_key in self.unknown:
+            if index < width and values[index] != "":
+                raise ValidationError(
+                    "Unknown parameter keys",
+                    code="unknown_parameter_keys",
+                    fields={raw_key: "unknown parameter"},
+                )
+
+        params: dict[str, object] = {}
+        for index, key, normaliser in self.params:
+            if index >= width or values[index] == "":
+                continue
+            value = _parse_param_value(values[index])
+            params[key] = value if normaliser is None else normaliser(value)
+        extra_data: dict[str, object] = {}
+        for index, raw_key in self.extra:
+            if index < width and values[index] != "":
+                extra_data[raw_key] = _parse_param_value(values[index])
+
+        self.parser.validate(params)
+        return {
+            "user_id": self.parser.user_id,
+            "method": self.parser.method,
+            "variant_id": self.parser.variant_id,
+            "parameters": params,
+            "extra_data": extra_data or None,
+            "brewed_at": brewed_at,
+            "score": score,
+            "status": BrewStatus.FAILED if failed else BrewStatus.OK,
+            "comments": self._cell(values, self.comments_index),
+            "import_hash": self.parser.hash_brew(brewed_at, params, score),
+        }
+
+
+@dataclass
+class ParsedCSVChunk:
+    last_row: int
+    processed: int = 0
+    next_offset: int | None = None
+    rows: list[dict[str, object]] = field(default_factory=list)
+    errors: list[CSVImportError] = field(default_factory=list)
+
+
+class CSVRowParser:
+    def __init__(self, user_id: UUID, method: str, variant_id: str):
+        self.user_id = user_id
+        self.method = method
+        self.variant_id = variant_id
+        self.schema = METHOD_PARAMETER_REGISTRY.get(method)
+        self.aliases = LEGACY_IMPORT_ALIASES.get(method, {})
+        self.extra_keys = LEGACY_EXTRA_DATA_KEYS.get(method, set())
+        self.validator = get_registry_validator(method)
+        self._hash_suffix = f', "user_id": {encode_basestring_ascii(str(user_id))}}}'
+        self._param_prefixes: dict[str, str] = {}
+
+    def validate(self, params: dict[str, object]) -> None:
+        if self.validator is None:
+            validate_method_parameters(self.method, params)
+        else:
+            self.validator.validate(params, allow_unknown=True)
+
+    def canonical_hash_payload(
+        self, brewed_at: datetime, params: dict[str, object], score: object
+    ) -> bytes:
+        prefixes = self._param_prefixes
+        encoded_params = []
+        for key in sorted(params):
+            prefix = prefixes.get(key)
+            if prefix is None:
+                prefix = prefixes[key] = f"{encode_basestring_ascii(key)}: "
+            encoded_params.append(prefix + _encode_json_value(params[key]))
+        return (
+            f'{{"brewed_at": "{brewed_at.isoformat()}", '
+            f'"parameters": {{{", ".join(encoded_params)}}}, '
+            f'"score": {_encode_json_value(score)}{self._hash_suffix}'
+        ).encode()
+
+    def hash_brew(self, brewed_at: datetime, params: dict[str, object], score: object) -> str:
+        return hashlib.sha256(self.canonical_hash_payload(brewed_at, params, score)).hexdigest()
 
     def _is_legacy_reviewer_column(self, key: str) -> bool:
         return key.isalpha() and key[:1].isupper()
 
-    def import_csv(self, user_id: UUID, request: CSVImportRequest) -> CSVImportResult:
-        data_path = Path(request.data_path)
-        if not data_path.exists():
-            raise ValidationError("Data file not found", code="data_file_not_found")
+    def compile(self, header: Sequence[str]) -> CompiledRowTransformer:
+        return CompiledRowTransformer(self, header)
 
-        method = request.method or data_path.name.split(".")[0]
-        schema = METHOD_PARAMETER_REGISTRY.get(method)
+    def parse_row(self, row: dict[str, str | None]) -> dict[str, object]:
+        keys = list(row)
+        return self.compile(keys).transform([row[key] or "" for key in keys])
+
+    def _row_error(self, row_index: int, exc: ValidationError) -> CSVImportError:
+        return CSVImportError(row=row_index, detail=exc.detail, code=exc.code, fields=exc.fields)
+
+    def iter_file(
+        self, data_path: Path
+    ) -> Iterator[tuple[int, dict[str, object] | CSVImportError]]:
+        with data_path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return
+            transformer = self.compile(header)
+            row_index = 1
+            for values in reader:
+                if not values:
+                    continue
+                row_index += 1
+                try:
+                    yield row_index, transformer.transform(values)
+                except ValidationError as exc:
+                    yield row_index, self._row_error(row_index, exc)
+
+    def read_chunk(
+        self, data_path: Path, offset: int | None, row_index: int, max_rows: int
+    ) -> ParsedCSVChunk:
+        chunk = ParsedCSVChunk(last_row=row_index)
+        with data_path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(iter(handle.readline, ""))
+            header = next(reader, None)
+            if header is None:
+                return chunk
+            if offset is not None:
+                handle.seek(offset)
+            transformer = self.compile(header)
+            for values in reader:
+                if not values:
+                    continue
+                chunk.last_row += 1
+                chunk.processed += 1
+                try:
+                    chunk.rows.append(transformer.transform(values))
+                except ValidationError as exc:
+                    chunk.errors.append(self._row_error(chunk.last_row, exc))
+                if chunk.processed >= max_rows:
+                    chunk.next_offset = handle.tell()
+                    break
+        return chunk
+
+
+ImportJob = tuple[str, UUID, str, str]
+
+
+def parse_csv_chunk(
+    data_path: str,
+    user_id: UUID,
+    method: str,
+    variant_id: str,
+    offset: int | None,
+    row_index: int,
+    max_rows: int,
+) -> ParsedCSVChunk:
+    parser = CSVRowParser(user_id, method, variant_id)
+    return parser.read_chunk(Path(data_path), offset, row_index, max_rows)
+
+
+def create_import_executor(max_workers: int) -> ProcessPoolExecutor:
+    start_methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in start_methods else "spawn"
+    )
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+class ImportExportService:
+    BATCH_SIZE = 1000
+
+    def __init__(self, db: Session, executor: Executor | None = None):
+        self.db = db
+        self.executor = executor
+        self.settings = get_settings()
+
+    def _write_batch(self, user_id: UUID, rows: list[dict[str, object]]) -> int:
+        existing = set(
+            self.db.scalars(
+                select(Brew.import_hash).where(
+                    Brew.import_hash.in_([row["import_hash"] for row in rows])
+                )
+            )
+        )
+        fresh = [row for row in rows if row["import_hash"] not in existing]
+        if fresh:
+            self.db.execute(insert(Brew), fresh)
+            BrewRollupService(self.db).add_brews(fresh)
+        self.db.commit()
+        if fresh:
+            UserService(self.db).bump_brew_version(user_id)
+            get_count_cache().invalidate(Brew, user_id)
+            get_brew_array_cache().invalidate(user_id)
+        return len(fresh)
+
+    def _write_rows(
+        self, user_id: UUID, rows: Iterable[dict[str, object]], seen_import_hashes: set[str]
+    ) -> tuple[int, int]:
         inserted = 0
         skipped = 0
+        batch: list[dict[str, object]] = []
+        for brew in rows:
+            import_hash = str(brew["import_hash"])
+            if import_hash in seen_import_hashes:
+                skipped += 1
+                continue
+            seen_import_hashes.add(import_hash)
+            batch.append(brew)
+            if len(batch) >= self.BATCH_SIZE:
+                written = self._write_batch(user_id, batch)
+                inserted += written
+                skipped += len(batch) - written
+                batch = []
+        if batch:
+            written = self._write_batch(user_id, batch)
+            inserted += written
+            skipped += len(batch) - written
+        return inserted, skipped
+
+    def _resolve_data_files(self, data_path: str, restrict_paths: bool) -> list[Path]:
+        path = Path(data_path)
+        pattern = any(char in data_path for char in "*?[")
+        root = Path(self.settings.import_root).resolve() if self.settings.import_root else None
+        if restrict_paths and root is None and (pattern or path.is_dir()):
+            raise ValidationError(
+                "Directory and glob imports require IMPORT_ROOT to be configured",
+                code="data_path_not_allowed",
+            )
+        if pattern:
+            files = sorted(Path(match) for match in glob.glob(data_path))
+        elif path.is_dir():
+            files = sorted(path.glob("*.csv"))
+        else:
+            files = [path] if path.exists() else []
+        files = [file for file in files if file.is_file()]
+        if (
+            restrict_paths
+            and root is not None
+            and any(not file.resolve().is_relative_to(root) for file in [path, *files])
+        ):
+            raise ValidationError("Data path is outside IMPORT_ROOT", code="data_path_not_allowed")
+        if not files:
+            raise ValidationError("Data file not found", code="data_file_not_found")
+        return files
+
+    def import_csv(
+        self, user_id: UUID, request: CSVImportRequest, restrict_paths: bool = False
+    ) -> CSVImportResult:
+        files = self._resolve_data_files(request.data_path, restrict_paths)
+        if len(files) > 1 or Path(request.data_path) != files[0]:
+            return self._import_files(user_id, request, files)
+
+        data_path = files[0]
+        method = request.method or data_path.name.split(".")[0]
+        variant_id = BrewService(self.db)._resolve_variant_id(method, request.variant_id)
+        parser = CSVRowParser(user_id, method, variant_id)
         processed = 0
         errors: list[CSVImportError] = []
-        seen_import_hashes: set[str] = set()
-        pending_inserts = 0
 
-        with data_path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row_index, row in enumerate(reader, start=2):
+        def rows() -> Iterator[dict[str, object]]:
+            nonlocal processed
+            for _, item in parser.iter_file(data_path):
                 processed += 1
-                try:
-                    brewed_at = datetime.fromisoformat(
-                        row.get("date", datetime.now(timezone.utc).isoformat())
-                    )
-                    score_value = row.get("score")
-                    score = float(score_value) if score_value not in (None, "") else None
-                    failed = row.get("failed", "false").lower() == "true"
-                    status = BrewStatus.FAILED if failed else BrewStatus.OK
-                    comments = row.get("comments")
-                    known = {"date", "score", "failed", "comments", "method"}
-                    aliases = LEGACY_IMPORT_ALIASES.get(method, {})
-                    extra_keys = LEGACY_EXTRA_DATA_KEYS.get(method, set())
-                    params: dict[str, object] = {}
-                    extra_data: dict[str, object] = {}
-
-                    for raw_key, raw_value in row.items():
-                        if raw_key in known or raw_value in (None, ""):
-                            continue
-
-                        parsed_value = self._parse_param_value(raw_value)
-                        key = aliases.get(raw_key, raw_key)
-
-                        if schema is not None and key in schema:
-                            params[key] = self._normalise_legacy_param(method, key, parsed_value)
-                            continue
-
-                        if raw_key in extra_keys or self._is_legacy_reviewer_column(raw_key):
-                            extra_data[raw_key] = parsed_value
-                            continue
-
-                        raise ValidationError(
-                            "Unknown parameter keys",
-                            code="unknown_parameter_keys",
-                            fields={raw_key: "unknown parameter"},
-                        )
-
-                    validate_method_parameters(method, params)
-
-                    import_hash = self._hash_brew(user_id, brewed_at, params, score)
-                    if import_hash in seen_import_hashes:
-                        skipped += 1
-                        continue
-
-                    existing = self.db.scalar(
-                        select(Brew.id).where(Brew.import_hash == import_hash)
-                    )
-                    if existing:
-                        skipped += 1
-                        seen_import_hashes.add(import_hash)
-                        continue
-
-                    seen_import_hashes.add(import_hash)
-
-                    brew = Brew(
-                        user_id=user_id,
-                        method=method,
-                        parameters=params,
-                        extra_data=extra_data or None,
-                        brewed_at=brewed_at,
-                        score=score,
-                        status=status,
-                        comments=comments,
-                        import_hash=import_hash,
-                    )
-                    self.db.add(brew)
-                    inserted += 1
-                    pending_inserts += 1
-
-                    if pending_inserts >= self.BATCH_SIZE:
-                        self.db.flush()
-                        self.db.commit()
-                        pending_inserts = 0
-                except ValidationError as exc:
-                    skipped += 1
-                    errors.append(
-                        CSVImportError(
-                            row=row_index,
-                            detail=exc.detail,
-                            code=exc.code,
-                            fields=exc.fields,
-                        )
-                    )
+                if isinstance(item, CSVImportError):
+                    errors.append(item)
+                else:
+                    yield item
 
-        if pending_inserts:
-            self.db.flush()
-        self.db.commit()
+        inserted, skipped = self._write_rows(user_id, rows(), set())
+        skipped += len(errors)
         return CSVImportResult(
             processed=processed,
             inserted=inserted,
@@ -181,39 +423,186 @@ class ImportExportService:
             errors=errors,
         )
 
-    def export_csv(self, user_id: UUID, out_dir: str) -> CSVExportResult:
+    def _import_files(
+        self, user_id: UUID, request: CSVImportRequest, files: list[Path]
+    ) -> CSVImportResult:
+        brew_service = BrewService(self.db)
+        jobs: list[ImportJob] = []
+        variants: dict[str, str] = {}
+        for data_path in files:
+            method = request.method or data_path.name.split(".")[0]
+            if method not in variants:
+                variants[method] = brew_service._resolve_variant_id(method, request.variant_id)
+            jobs.append((str(data_path), user_id, method, variants[method]))
+
+        workers = min(request.workers or self.settings.import_workers, len(jobs))
+        seen_import_hashes: set[str] = set()
+        if workers <= 1:
+            summaries = [
+                self._write_file_chunks(job, self._iter_chunks(job), seen_import_hashes)
+                for job in jobs
+            ]
+        elif self.executor is not None:
+            summaries = self._import_pooled(self.executor, jobs, workers, seen_import_hashes)
+        else:
+            with create_import_executor(workers) as executor:
+                summaries = self._import_pooled(executor, jobs, workers, seen_import_hashes)
+
+        inserted = sum(summary.inserted for summary in summaries)
+        return CSVImportResult(
+            processed=sum(summary.processed for summary in summaries),
+            inserted=inserted,
+            imported=inserted,
+            skipped=sum(summary.skipped for summary in summaries),
+            error_count=sum(summary.error_count for summary in summaries),
+            files=summaries,
+        )
+
+    def _import_pooled(
+        self,
+        executor: Executor,
+        jobs: list[ImportJob],
+        workers: int,
+        seen_import_hashes: set[str],
+    ) -> list[CSVFileImportResult]:
+        first_chunks: dict[int, Future[ParsedCSVChunk]] = {}
+        summaries: list[CSVFileImportResult] = []
+        for index, job in enumerate(jobs):
+            for ahead in range(index, min(index + workers, len(jobs))):
+                if ahead not in first_chunks:
+                    first_chunks[ahead] = executor.submit(
+                        parse_csv_chunk, *jobs[ahead], None, 1, self.BATCH_SIZE
+                    )
+            chunks = self._iter_chunks(job, executor, first_chunks.pop(index))
+            summaries.append(self._write_file_chunks(job, chunks, seen_import_hashes))
+        return summaries
+
+    def _iter_chunks(
+        self,
+        job: ImportJob,
+        executor: Executor | None = None,
+        first: Future[ParsedCSVChunk] | None = None,
+    ) -> Iterator[ParsedCSVChunk]:
+        if first is not None:
+            chunk = first.result()
+        else:
+            chunk = parse_csv_chunk(*job, None, 1, self.BATCH_SIZE)
+        while True:
+            upcoming = None
+            if executor is not None and chunk.next_offset is not None:
+                upcoming = executor.submit(
+                    parse_csv_chunk, *job, chunk.next_offset, chunk.last_row, self.BATCH_SIZE
+                )
+            yield chunk
+            if chunk.next_offset is None:
+                return
+            if upcoming is not None:
+                chunk = upcoming.result()
+            else:
+                chunk = parse_csv_chunk(*job, chunk.next_offset, chunk.last_row, self.BATCH_SIZE)
+
+    def _write_file_chunks(
+        self, job: ImportJob, chunks: Iterable[ParsedCSVChunk], seen_import_hashes: set[str]
+    ) -> CSVFileImportResult:
+        processed = inserted = skipped = 0
+        errors: list[CSVImportError] = []
+        for chunk in chunks:
+            written, duplicates = self._write_rows(job[1], chunk.rows, seen_import_hashes)
+            processed += chunk.processed
+            inserted += written
+            skipped += duplicates
+            errors.extend(chunk.errors)
+        return CSVFileImportResult(
+            data_path=job[0],
+            method=job[2],
+            processed=processed,
+            inserted=inserted,
+            skipped=skipped + len(errors),
+            error_count=len(errors),
+            errors=errors,
+        )
+
+    def _export_query(self, user_id: UUID, method: str | None = None) -> Select:
+        query = select(
+            Brew.id,
+            Brew.method,
+            Brew.variant_id,
+            Brew.brewed_at,
+            Brew.score,
+            Brew.status,
+            Brew.comments,
+            Brew.parameters,
+            Brew.extra_data,
+        ).where(Brew.user_id == user_id)
+        if method is not None:
+            query = query.where(Brew.method == method)
+        return query.order_by(Brew.brewed_at).execution_options(yield_per=self.BATCH_SIZE)
+
+    def stream_csv(self, user_id: UUID, compress: bool = False) -> Iterator[bytes]:
+        compressor = zlib.compressobj(wbits=31) if compress else None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def drain(flush: int | None = None) -> bytes:
+            chunk = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            if compressor is None:
+                return chunk
+            compressed = compressor.compress(chunk)
+            return compressed + compressor.flush(flush) if flush is not None else compressed
+
+        writer.writerow(EXPORT_COLUMNS)
+        yield drain(zlib.Z_SYNC_FLUSH)
+        result = self.db.execute(self._export_query(user_id))
+        for partition in result.partitions():
+            writer.writerows(
+                (
+                    row.id,
+                    row.method,
+                    row.brewed_at.isoformat(),
+                    row.score,
+                    row.status.value if hasattr(row.status, "value") else row.status,
+                    row.comments,
+                    json.dumps(row.parameters),
+                    json.dumps(row.extra_data),
+                )
+                for row in partition
+            )
+            chunk = drain()
+            if chunk:
+                yield chunk
+        final = drain(zlib.Z_FINISH)
+        if final:
+            yield final
+
+    def export_csv(self, user_id: UUID, out_dir: str, compress: bool = False) -> CSVExportResult:
         output = Path(out_dir)
         output.mkdir(parents=True, exist_ok=True)
-        brews = list(
-            self.db.scalars(select(Brew).where(Brew.user_id == user_id).order_by(Brew.brewed_at))
+        path = output / ("brews.export.csv.gz" if compress else "brews.export.csv")
+        with path.open("wb") as handle:
+            for chunk in self.stream_csv(user_id, compress):
+                handle.write(chunk)
+        return CSVExportResult(output_files=[str(path)])
+
+    def stream_columnar(
+        self, user_id: UUID, export_format: str, method: str | None = None
+    ) -> Iterator[bytes]:
+        columns = build_column_specs([method] if method else list(METHOD_PARAMETER_REGISTRY))
+        result = self.db.execute(self._export_query(user_id, method))
+        batches = (
+            [flatten_brew(columns, row) for row in partition] for partition in result.partitions()
         )
-        path = output / "brews.export.csv"
-        with path.open("w", encoding="utf-8", newline="") as handle:
-            fieldnames = [
-                "id",
-                "method",
-                "brewed_at",
-                "score",
-                "status",
-                "comments",
-                "parameters",
-                "extra_data",
-            ]
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            for brew in brews:
-                writer.writerow(
-                    {
-                        "id": brew.id,
-                        "method": brew.method,
-                        "brewed_at": brew.brewed_at.isoformat(),
-                        "score": brew.score,
-                        "status": (
-                            brew.status.value if hasattr(brew.status, "value") else brew.status
-                        ),
-                        "comments": brew.comments,
-                        "parameters": json.dumps(brew.parameters),
-                        "extra_data": json.dumps(brew.extra_data),
-                    }
-                )
+        yield from encode_columnar(export_format, columns, batches)
+
+    def export_columnar(
+        self, user_id: UUID, out_dir: str, export_format: str, method: str | None = None
+    ) -> CSVExportResult:
+        resolved = resolve_columnar_format(export_format)
+        output = Path(out_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        path = output / f"brews.export.{COLUMNAR_EXTENSIONS[resolved]}"
+        with path.open("wb") as handle:
+            for chunk in self.stream_columnar(user_id, resolved, method):
+                handle.write(chunk)
         return CSVExportResult(output_files=[str(path)])
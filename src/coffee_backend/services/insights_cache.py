@@ -0,0 +1,177 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import optuna
+from optuna.importance import get_param_importances
+
+from coffee_backend.core.config import get_settings
+
+MIN_TRIALS_FOR_IMPORTANCE = 3
+
+
+@dataclass(frozen=True)
+class InsightsCacheEntry:
+    study_key: str
+    trial_count: int
+    parameter_importance: dict[str, float]
+    computed_at: datetime
+
+
+ComputeInsights = Callable[[str, optuna.Study, int], InsightsCacheEntry]
+
+
+@dataclass(frozen=True)
+class InsightsCacheStats:
+    hits: int
+    stale_hits: int
+    misses: int
+    recomputes: int
+    entries: int
+    max_entries: int
+
+
+def completed_trial_count(study: optuna.Study) -> int:
+    return sum(1 for trial in study.get_trials(deepcopy=False) if trial.value is not None)
+
+
+def compute_insights(study_key: str, study: optuna.Study, trial_count: int) -> InsightsCacheEntry:
+    importance = get_param_importances(study) if trial_count >= MIN_TRIALS_FOR_IMPORTANCE else {}
+    return InsightsCacheEntry(
+        study_key=study_key,
+        trial_count=trial_count,
+        parameter_importance=dict(importance),
+        computed_at=datetime.now(timezone.utc),
+    )
+
+
+class InsightsCache:
+    def __init__(self, max_entries: int, background: bool = True):
+        self.max_entries = max_entries
+        self.background = background
+        self._entries: OrderedDict[str, InsightsCacheEntry] = OrderedDict()
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._recomputes = 0
+        self.logger = logging.getLogger(__name__)
+
+    def get(
+        self,
+        study_key: str,
+        study: optuna.Study,
+        trial_count: int,
+        compute: ComputeInsights = compute_insights,
+    ) -> InsightsCacheEntry:
+        if self.max_entries <= 0:
+            return compute(study_key, study, trial_count)
+
+        with self._lock:
+            entry = self._entries.get(study_key)
+            if entry is not None:
+                self._entries.move_to_end(study_key)
+                if entry.trial_count == trial_count:
+                    self._hits += 1
+                    return entry
+                if self.background:
+                    self._stale_hits += 1
+                    self._schedule(study_key, study, trial_count, compute)
+                    return entry
+            self._misses += 1
+
+        return self._recompute(study_key, study, trial_count, compute)
+
+    def invalidate(self, study_key: str) -> None:
+        with self._lock:
+            self._entries.pop(study_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> InsightsCacheStats:
+        with self._lock:
+            return InsightsCacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                recomputes=self._recomputes,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def wait(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _schedule(
+        self,
+        study_key: str,
+        study: optuna.Study,
+        trial_count: int,
+        compute: ComputeInsights,
+    ) -> None:
+        if study_key in self._pending:
+            return
+        self._pending.add(study_key)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="insights")
+        self._executor.submit(self._recompute_in_background, study_key, study, trial_count, compute)
+
+    def _recompute_in_background(
+        self,
+        study_key: str,
+        study: optuna.Study,
+        trial_count: int,
+        compute: ComputeInsights,
+    ) -> None:
+        try:
+            self._recompute(study_key, study, trial_count, compute)
+        except Exception:
+            self.logger.exception(
+                "optimisation.insights_cache.recompute_failed", extra={"study_key": study_key}
+            )
+        finally:
+            with self._lock:
+                self._pending.discard(study_key)
+
+    def _recompute(
+        self,
+        study_key: str,
+        study: optuna.Study,
+        trial_count: int,
+        compute: ComputeInsights,
+    ) -> InsightsCacheEntry:
+        entry = compute(study_key, study, trial_count)
+        with self._lock:
+            current = self._entries.get(study_key)
+            if current is None or current.computed_at <= entry.computed_at:
+                self._entries[study_key] = entry
+                self._entries.move_to_end(study_key)
+            self._recomputes += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self.logger.info(
+            "optimisation.insights_cache.recomputed",
+            extra={"study_key": study_key, "trial_count": entry.trial_count},
+        )
+        return entry
+
+
+@lru_cache(maxsize=1)
+def get_insights_cache() -> InsightsCache:
+    settings = get_settings()
+    return InsightsCache(
+        max_entries=settings.insights_cache_max_entries,
+        background=settings.insights_background_recompute,
+    )
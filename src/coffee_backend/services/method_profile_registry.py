@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import signal
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from coffee_backend.db.models.method_profile import MethodProfile
+
+logger = logging.getLogger(__name__)
+
+RELOAD_SIGNAL: int | None = getattr(signal, "SIGHUP", None)
+
+
+@dataclass(frozen=True)
+class MethodProfileRecord:
+    method_id: str
+    variant_id: str
+    schema_version: int
+    parameters: tuple[dict[str, object], ...]
+    sampler: Mapping[str, object] | None
+
+    @classmethod
+    def from_model(cls, profile: Any) -> "MethodProfileRecord":
+        return cls(
+            method_id=profile.method_id,
+            variant_id=profile.variant_id,
+            schema_version=profile.schema_version,
+            parameters=tuple(dict(spec) for spec in profile.parameters),
+            sampler=MappingProxyType(dict(profile.sampler)) if profile.sampler else None,
+        )
+
+
+@dataclass(frozen=True)
+class MethodProfileRegistry:
+    version: str
+    profiles: tuple[MethodProfileRecord, ...]
+    by_method: Mapping[str, tuple[MethodProfileRecord, ...]]
+    by_variant: Mapping[tuple[str, str], MethodProfileRecord]
+
+    @classmethod
+    def build(cls, profiles: Iterable[Any]) -> "MethodProfileRegistry":
+        records = tuple(
+            sorted(
+                (MethodProfileRecord.from_model(profile) for profile in profiles),
+                key=lambda record: (record.method_id, record.variant_id, -record.schema_version),
+            )
+        )
+        by_method: dict[str, list[MethodProfileRecord]] = {}
+        by_variant: dict[tuple[str, str], MethodProfileRecord] = {}
+        for record in records:
+            by_method.setdefault(record.method_id, []).append(record)
+            by_variant.setdefault((record.method_id, record.variant_id), record)
+        fingerprint = json.dumps(
+            [
+                [
+                    record.method_id,
+                    record.variant_id,
+                    record.schema_version,
+                    record.parameters,
+                    dict(record.sampler) if record.sampler else None,
+                ]
+                for record in records
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return cls(
+            version=hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest(),
+            profiles=records,
+            by_method=MappingProxyType(
+                {method_id: tuple(group) for method_id, group in by_method.items()}
+            ),
+            by_variant=MappingProxyType(by_variant),
+        )
+
+    def for_method(self, method_id: str) -> tuple[MethodProfileRecord, ...]:
+        return self.by_method.get(method_id, ())
+
+    def get(self, method_id: str, variant_id: str) -> MethodProfileRecord | None:
+        return self.by_variant.get((method_id, variant_id))
+
+    def default_variant(self, method_id: str) -> str | None:
+        profiles = self.for_method(method_id)
+        if not profiles:
+            return None
+        default = next((p.variant_id for p in profiles if "default" in p.variant_id), None)
+        return default or profiles[0].variant_id
+
+
+def load_method_profile_registry(db: Session) -> MethodProfileRegistry:
+    return MethodProfileRegistry.build(db.scalars(select(MethodProfile)))
+
+
+@dataclass(frozen=True)
+class MethodProfileRegistryStats:
+    profiles: int
+    loads: int
+    invalidations: int
+
+
+class MethodProfileRegistryStore:
+    def __init__(self) -> None:
+        self._registry: MethodProfileRegistry | None = None
+        self._generation = 0
+        self._loaded_generation = -1
+        self._lock = threading.Lock()
+        self._loads = 0
+
+    def load(self, db: Session) -> MethodProfileRegistry:
+        generation = self._generation
+        registry = load_method_profile_registry(db)
+        with self._lock:
+            self._registry = registry
+            self._loaded_generation = generation
+            self._loads += 1
+        logger.info(
+            "method_profiles.registry.loaded",
+            extra={"version": registry.version, "profiles": len(registry.profiles)},
+        )
+        return registry
+
+    def get(self, db: Session | None = None) -> MethodProfileRegistry:
+        registry = self._registry
+        if registry is not None and self._loaded_generation == self._generation:
+            return registry
+        if db is None:
+            raise RuntimeError("Method profile registry is not loaded")
+        return self.load(db)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+
+    def reload_on_signal(self, signum: int | None = RELOAD_SIGNAL) -> Callable[[], None]:
+        if signum is None or threading.current_thread() is not threading.main_thread():
+            return lambda: None
+        previous = signal.signal(signum, lambda *_: self.invalidate())
+
+        def restore() -> None:
+            signal.signal(signum, previous)
+
+        return restore
+
+    def stats(self) -> MethodProfileRegistryStats:
+        with self._lock:
+            return MethodProfileRegistryStats(
+                profiles=len(self._registry.profiles) if self._registry is not None else 0,
+                loads=self._loads,
+                invalidations=self._generation,
+            )
+
+
+@lru_cache(maxsize=1)
+def get_method_profile_registry_store() -> MethodProfileRegistryStore:
+    return MethodProfileRegistryStore()
+
+
+def get_method_profile_registry(db: Session | None = None) -> MethodProfileRegistry:
+    return get_method_profile_registry_store().get(db)
@@ -1,8 +1,15 @@
-from sqlalchemy import Select, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from coffee_backend.core.exceptions import NotFoundError
 from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.compiled_profile import invalidate_compiled_profiles
+from coffee_backend.services.method_profile_registry import (
+    MethodProfileRecord,
+    MethodProfileRegistry,
+    get_method_profile_registry,
+    get_method_profile_registry_store,
+)
 
 MethodProfilePayload = dict[str, object]
 
@@ -252,36 +259,21 @@ INITIAL_METHOD_PROFILES: list[MethodProfilePayload] = [
 
 
 class MethodProfileService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, registry: MethodProfileRegistry | None = None):
         self.db = db
+        self.registry = registry or get_method_profile_registry(db)
 
-    def list_profiles(self) -> list[MethodProfile]:
-        query: Select[tuple[MethodProfile]] = select(MethodProfile).order_by(
-            MethodProfile.method_id,
-            MethodProfile.variant_id,
-            MethodProfile.schema_version.desc(),
-        )
-        return list(self.db.scalars(query))
+    def list_profiles(self) -> list[MethodProfileRecord]:
+        return list(self.registry.profiles)
 
-    def list_profiles_for_method(self, method_id: str) -> list[MethodProfile]:
-        query: Select[tuple[MethodProfile]] = (
-            select(MethodProfile)
-            .where(MethodProfile.method_id == method_id)
-            .order_by(MethodProfile.variant_id, MethodProfile.schema_version.desc())
-        )
-        profiles = list(self.db.scalars(query))
+    def list_profiles_for_method(self, method_id: str) -> list[MethodProfileRecord]:
+        profiles = list(self.registry.for_method(method_id))
         if not profiles:
             raise NotFoundError(f"Method '{method_id}' was not found")
         return profiles
 
-    def get_profile(self, method_id: str, variant_id: str) -> MethodProfile:
-        query: Select[tuple[MethodProfile]] = (
-            select(MethodProfile)
-            .where(MethodProfile.method_id == method_id)
-            .where(MethodProfile.variant_id == variant_id)
-            .order_by(MethodProfile.schema_version.desc())
-        )
-        profile = self.db.scalars(query).first()
+    def get_profile(self, method_id: str, variant_id: str) -> MethodProfileRecord:
+        profile = self.registry.get(method_id, variant_id)
         if profile is None:
             raise NotFoundError(f"Method variant '{method_id}/{variant_id}' was not found")
         return profile
@@ -296,3 +288,5 @@ def seed_method_profiles(db: Session) -> None:
         db.add(MethodProfile(**payload))
 
     db.commit()
+    invalidate_compiled_profiles()
+    get_method_profile_registry_store().invalidate()
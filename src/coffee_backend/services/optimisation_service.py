@@ -2,28 +2,69 @@ import hashlib
 import json
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from math import isclose
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID, uuid4
 
 import optuna
-from optuna.importance import get_param_importances
 from optuna.trial import create_trial
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, delete, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from coffee_backend.core.config import get_settings
-from coffee_backend.core.exceptions import ConflictError, NotFoundError, ValidationError
+from coffee_backend.core.exceptions import (
+    APIError,
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
 from coffee_backend.db.models.brew import Brew
 from coffee_backend.db.models.enums import BrewStatus
-from coffee_backend.db.models.method_profile import MethodProfile
-from coffee_backend.db.models.optuna_study import StudyContext, Suggestion
+from coffee_backend.db.models.optuna_study import StudyContext, Suggestion, WarmStartEntry
+from coffee_backend.db.session import create_optuna_storage
 from coffee_backend.schemas.optimisation import (
+    BulkApplyItem,
+    BulkApplyItemResult,
+    BulkApplyResponse,
     OptimisationInsight,
     StudyRequest,
+    SuggestionRead,
     WarmStartRequest,
     WarmStartResponse,
 )
+from coffee_backend.services.analytics_engine import get_brew_array_cache
+from coffee_backend.services.analytics_rollups import BrewRollupService, RollupKey, rollup_key
+from coffee_backend.services.compiled_profile import (
+    CompiledMethodProfile,
+    compile_method_profile,
+)
+from coffee_backend.services.insights_cache import (
+    InsightsCache,
+    completed_trial_count,
+    get_insights_cache,
+)
+from coffee_backend.services.method_profile_registry import (
+    MethodProfileRecord,
+    get_method_profile_registry,
+)
+from coffee_backend.services.optuna_bulk import bulk_add_trials
+from coffee_backend.services.sampler_registry import (
+    SamplerConfig,
+    build_sampler,
+    merge_sampler_config,
+    sampler_config_from_settings,
+)
+from coffee_backend.services.sampler_state import get_sampler_state_store
+from coffee_backend.services.study_cache import StudyCache, get_study_cache
+from coffee_backend.services.user_service import UserService
+from coffee_backend.services.warm_start_jobs import (
+    ProgressCallback,
+    WarmStartJob,
+    WarmStartJobManager,
+)
 
 
 @dataclass(frozen=True)
@@ -47,50 +88,67 @@ class OptimisationService:
     MIN_SCORE = 0.0
     MAX_SCORE = 10.0
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        storage: optuna.storages.RDBStorage | None = None,
+        study_cache: StudyCache | None = None,
+        insights_cache: InsightsCache | None = None,
+    ):
         self.db = db
         self.settings = get_settings()
-        self.storage = optuna.storages.RDBStorage(
-            url=self.settings.database_url,
-            skip_compatibility_check=self.settings.optuna_skip_compatibility_check,
-        )
+        self.storage = storage or create_optuna_storage(self.settings)
+        self.study_cache = study_cache or get_study_cache()
+        self.insights_cache = insights_cache or get_insights_cache()
+        self.sampler_states = get_sampler_state_store()
         self.logger = logging.getLogger(__name__)
 
+    def _create_study(self, study_key: str) -> None:
+        optuna.create_study(
+            study_name=study_key,
+            storage=self.storage,
+            direction="maximize",
+            load_if_exists=True,
+        )
+
+    def _sampler_config(self, study_context: StudyContext) -> SamplerConfig:
+        if study_context.sampler_config:
+            return merge_sampler_config(SamplerConfig(), study_context.sampler_config)
+        profile = self._get_method_profile(study_context.method_id, study_context.variant_id)
+        config = merge_sampler_config(sampler_config_from_settings(self.settings), profile.sampler)
+        study_context.sampler = config.name
+        study_context.sampler_config = config.to_dict()
+        return config
+
+    def _load_study(
+        self,
+        study_key: str,
+        create_missing: bool = False,
+        sampler: SamplerConfig | None = None,
+    ) -> optuna.Study:
+        factory = (lambda: build_sampler(sampler)) if sampler is not None else None
+        sampler_key = sampler.key if sampler is not None else None
+        try:
+            return self.study_cache.get(study_key, self.storage, factory, sampler_key)
+        except KeyError:
+            if not create_missing:
+                raise
+        self._create_study(study_key)
+        return self.study_cache.get(study_key, self.storage, factory, sampler_key)
+
     def _resolve_variant_id(self, method_id: str, variant_id: str | None) -> str:
         method = method_id.strip().lower()
         if variant_id is not None:
-            profile = self.db.scalar(
-                select(MethodProfile)
-                .where(MethodProfile.method_id == method)
-                .where(MethodProfile.variant_id == variant_id)
-                .order_by(MethodProfile.schema_version.desc())
-            )
-            if profile is None:
-                raise ValidationError(
-                    f"Unsupported method variant '{method}/{variant_id}'",
-                    code="unsupported_method_variant",
-                )
+            self._get_method_profile(method, variant_id)
             return variant_id
 
-        profiles = list(
-            self.db.scalars(
-                select(MethodProfile)
-                .where(MethodProfile.method_id == method)
-                .order_by(MethodProfile.variant_id.asc(), MethodProfile.schema_version.desc())
-            )
-        )
-        if not profiles:
+        default_variant = get_method_profile_registry(self.db).default_variant(method)
+        if default_variant is None:
             raise ValidationError("Unsupported method", code="unsupported_method")
-        default_variant = next((p.variant_id for p in profiles if "default" in p.variant_id), None)
-        return default_variant or profiles[0].variant_id
-
-    def _get_method_profile(self, method_id: str, variant_id: str) -> MethodProfile:
-        profile = self.db.scalar(
-            select(MethodProfile)
-            .where(MethodProfile.method_id == method_id)
-            .where(MethodProfile.variant_id == variant_id)
-            .order_by(MethodProfile.schema_version.desc())
-        )
+        return default_variant
+
+    def _get_method_profile(self, method_id: str, variant_id: str) -> MethodProfileRecord:
+        profile = get_method_profile_registry(self.db).get(method_id, variant_id)
         if profile is None:
             raise ValidationError(
                 f"Unsupported method variant '{method_id}/{variant_id}'",
@@ -98,6 +156,9 @@ class OptimisationService:
             )
         return profile
 
+    def _get_compiled_profile(self, method_id: str, variant_id: str) -> CompiledMethodProfile:
+        return compile_method_profile(self._get_method_profile(method_id, variant_id))
+
     def canonicalise_context(self, user_id: UUID, req: StudyRequest) -> CanonicalStudyContext:
         method_id = req.method_id.strip().lower()
         variant_id = self._resolve_variant_id(method_id, req.variant_id)
@@ -115,241 +176,61 @@ class OptimisationService:
             f"b:{context.bean_id or 'none'}|e:{context.equipment_id or 'none'}"
         )
 
+    def _upsert_study_context(
+        self,
+        context: CanonicalStudyContext,
+        study_key: str,
+        sampler: SamplerConfig | None = None,
+    ) -> None:
+        sampler = sampler or sampler_config_from_settings(self.settings)
+        values = {
+            "user_id": context.user_id,
+            "method_id": context.method_id,
+            "variant_id": context.variant_id,
+            "bean_id": context.bean_id,
+            "equipment_id": context.equipment_id,
+            "study_key": study_key,
+            "sampler": sampler.name,
+            "sampler_config": sampler.to_dict(),
+        }
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            self.db.execute(pg_insert(StudyContext).values(**values).on_conflict_do_nothing())
+            self.db.commit()
+            return
+        if dialect == "sqlite":
+            self.db.execute(sqlite_insert(StudyContext).values(**values).on_conflict_do_nothing())
+            self.db.commit()
+            return
+
+        self.db.add(StudyContext(**values))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+
     def ensure_study_context(self, user_id: UUID, req: StudyRequest) -> StudyContext:
         context = self.canonicalise_context(user_id, req)
         study_key = self.build_study_key(context)
         study_context = self.db.scalar(
             select(StudyContext).where(StudyContext.study_key == study_key)
         )
-        if study_context is None:
-            study_context = StudyContext(
-                user_id=context.user_id,
-                method_id=context.method_id,
-                variant_id=context.variant_id,
-                bean_id=context.bean_id,
-                equipment_id=context.equipment_id,
-                study_key=study_key,
-            )
-            self.db.add(study_context)
-            self.db.commit()
-            self.db.refresh(study_context)
-
-        sampler = optuna.samplers.TPESampler(seed=42, n_startup_trials=5)
-        optuna.create_study(
-            study_name=study_key,
-            storage=self.storage,
-            direction="maximize",
-            load_if_exists=True,
-            sampler=sampler,
+        if study_context is not None:
+            return study_context
+
+        profile = self._get_method_profile(context.method_id, context.variant_id)
+        sampler = merge_sampler_config(sampler_config_from_settings(self.settings), profile.sampler)
+        self._create_study(study_key)
+        self._upsert_study_context(context, study_key, sampler)
+        study_context = self.db.scalars(
+            select(StudyContext).where(StudyContext.study_key == study_key)
+        ).one()
+        self.logger.info(
+            "optimisation.study.ensured",
+            extra={"study_key": study_key, "sampler": study_context.sampler},
         )
-        self.logger.info("optimisation.study.ensured", extra={"study_key": study_key})
         return study_context
 
-    def _suggest_param_from_spec(self, trial: optuna.Trial, spec: dict[str, object]) -> object:
-        name = str(spec["name"])
-        ptype = str(spec["type"])
-        if ptype == "int":
-            step = int(spec.get("step") or 1)
-            return trial.suggest_int(name, int(spec["min"]), int(spec["max"]), step=step)
-        if ptype == "float":
-            step = spec.get("step")
-            if step is not None:
-                return trial.suggest_float(
-                    name,
-                    float(spec["min"]),
-                    float(spec["max"]),
-                    step=float(step),
-                )
-            return trial.suggest_float(name, float(spec["min"]), float(spec["max"]))
-        if ptype == "bool":
-            return trial.suggest_categorical(name, [True, False])
-        if ptype in {"enum", "categorical"}:
-            choices = spec.get("choices")
-            if not isinstance(choices, list) or not choices:
-                raise ValidationError(
-                    f"Parameter '{name}' enum/categorical requires non-empty choices",
-                    code="invalid_method_profile",
-                )
-            return trial.suggest_categorical(name, choices)
-        raise ValidationError(
-            f"Unsupported parameter type '{ptype}' for '{name}'",
-            code="invalid_method_profile",
-        )
-
-    def _validate_param_against_spec(self, spec: dict[str, object], value: object) -> None:
-        name = str(spec["name"])
-        ptype = str(spec["type"])
-
-        if ptype == "int":
-            if not isinstance(value, int) or isinstance(value, bool):
-                raise ValidationError(
-                    f"Invalid value for '{name}': expected int",
-                    code="invalid_suggested_params",
-                    fields={name: "expected int"},
-                )
-            min_v = int(spec["min"])
-            max_v = int(spec["max"])
-            step = int(spec.get("step") or 1)
-            if value < min_v or value > max_v or ((value - min_v) % step != 0):
-                raise ValidationError(
-                    (
-                        f"Invalid value for '{name}': {value} must be between {min_v} and {max_v} "
-                        f"with step {step}"
-                    ),
-                    code="invalid_suggested_params",
-                    fields={name: f"between {min_v}-{max_v} step {step}"},
-                )
-            return
-
-        if ptype == "float":
-            if not isinstance(value, (float, int)) or isinstance(value, bool):
-                raise ValidationError(
-                    f"Invalid value for '{name}': expected number",
-                    code="invalid_suggested_params",
-                    fields={name: "expected number"},
-                )
-            f_value = float(value)
-            min_v = float(spec["min"])
-            max_v = float(spec["max"])
-            if f_value < min_v or f_value > max_v:
-                raise ValidationError(
-                    f"Invalid value for '{name}': {f_value} must be between {min_v} and {max_v}",
-                    code="invalid_suggested_params",
-                    fields={name: f"between {min_v}-{max_v}"},
-                )
-            step = spec.get("step")
-            if step is not None:
-                step_v = float(step)
-                remainder = (f_value - min_v) / step_v
-                if not isclose(remainder, round(remainder), abs_tol=1e-9):
-                    raise ValidationError(
-                        (
-                            f"Invalid value for '{name}': {f_value} must follow step {step_v} "
-                            f"from {min_v}"
-                        ),
-                        code="invalid_suggested_params",
-                        fields={name: f"step {step_v} from {min_v}"},
-                    )
-            return
-
-        if ptype == "bool":
-            if not isinstance(value, bool):
-                raise ValidationError(
-                    f"Invalid value for '{name}': expected bool",
-                    code="invalid_suggested_params",
-                    fields={name: "expected bool"},
-                )
-            return
-
-        if ptype in {"enum", "categorical"}:
-            choices = spec.get("choices")
-            if value not in choices:
-                raise ValidationError(
-                    f"Invalid value for '{name}': choose one of {choices}",
-                    code="invalid_suggested_params",
-                    fields={name: f"one of {choices}"},
-                )
-            return
-
-        raise ValidationError(
-            f"Unsupported parameter type '{ptype}' for '{name}'",
-            code="invalid_method_profile",
-        )
-
-    def _validate_hard_caps(self, method_id: str, params: dict[str, object]) -> None:
-        if method_id == "v60" and "total_time_s" in params:
-            value = params["total_time_s"]
-            if not isinstance(value, int):
-                raise ValidationError(
-                    "Invalid value for 'total_time_s': expected int",
-                    code="invalid_suggested_params",
-                    fields={"total_time_s": "expected int"},
-                )
-            if not (120 <= value <= 300):
-                raise ValidationError(
-                    "Invalid value for 'total_time_s': must be within hard cap 120-300 seconds",
-                    code="invalid_suggested_params",
-                    fields={"total_time_s": "hard cap 120-300"},
-                )
-
-        if method_id == "aeropress" and "plunge_s" in params:
-            value = params["plunge_s"]
-            if not isinstance(value, int):
-                raise ValidationError(
-                    "Invalid value for 'plunge_s': expected int",
-                    code="invalid_suggested_params",
-                    fields={"plunge_s": "expected int"},
-                )
-            if value > 60:
-                raise ValidationError(
-                    "Invalid value for 'plunge_s': must be <= 60 seconds hard cap",
-                    code="invalid_suggested_params",
-                    fields={"plunge_s": "hard cap <= 60"},
-                )
-
-    def _distributions_for_profile(
-        self, profile: MethodProfile
-    ) -> dict[str, optuna.distributions.BaseDistribution]:
-        distributions: dict[str, optuna.distributions.BaseDistribution] = {}
-        for spec in profile.parameters:
-            name = str(spec["name"])
-            ptype = str(spec["type"])
-            if ptype == "int":
-                distributions[name] = optuna.distributions.IntDistribution(
-                    low=int(spec["min"]), high=int(spec["max"]), step=int(spec.get("step") or 1)
-                )
-            elif ptype == "float":
-                step = spec.get("step")
-                distributions[name] = optuna.distributions.FloatDistribution(
-                    low=float(spec["min"]),
-                    high=float(spec["max"]),
-                    step=float(step) if step is not None else None,
-                )
-            elif ptype == "bool":
-                distributions[name] = optuna.distributions.CategoricalDistribution(
-                    choices=[True, False]
-                )
-            elif ptype in {"enum", "categorical"}:
-                choices = spec.get("choices")
-                if not isinstance(choices, list) or not choices:
-                    raise ValidationError(
-                        f"Parameter '{name}' enum/categorical requires non-empty choices",
-                        code="invalid_method_profile",
-                    )
-                distributions[name] = optuna.distributions.CategoricalDistribution(choices=choices)
-            else:
-                raise ValidationError(
-                    f"Unsupported parameter type '{ptype}' for '{name}'",
-                    code="invalid_method_profile",
-                )
-        return distributions
-
-    def _validate_params_for_profile(
-        self,
-        method_id: str,
-        params: dict[str, object],
-        profile: MethodProfile,
-    ) -> None:
-        definitions = {str(spec["name"]): spec for spec in profile.parameters}
-        unknown = sorted(key for key in params if key not in definitions)
-        if unknown:
-            raise ValidationError(
-                "Suggested params contain unknown parameter keys for this method profile",
-                code="invalid_suggested_params",
-                fields=dict.fromkeys(unknown, "unknown parameter for profile"),
-            )
-
-        for key, spec in definitions.items():
-            if key not in params:
-                raise ValidationError(
-                    f"Suggested params missing '{key}'",
-                    code="invalid_suggested_params",
-                    fields={key: "missing parameter"},
-                )
-            self._validate_param_against_spec(spec, params[key])
-
-        self._validate_hard_caps(method_id, params)
-
     def _normalise_param_value(self, value: object) -> object:
         if isinstance(value, dict):
             return {str(k): self._normalise_param_value(v) for k, v in sorted(value.items())}
@@ -368,58 +249,77 @@ class OptimisationService:
         encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
         return f"hash:{hashlib.sha256(encoded).hexdigest()}"
 
-    def _study_existing_warm_start_keys(self, study: optuna.Study) -> set[str]:
-        keys: set[str] = set()
-        for trial in study.get_trials(deepcopy=False):
-            attrs = trial.user_attrs or {}
-            key = attrs.get("warm_start_key")
-            if isinstance(key, str):
-                keys.add(key)
-        return keys
-
-    def warm_start(self, user_id: UUID, req: WarmStartRequest) -> WarmStartResponse:
-        study_context = self.ensure_study_context(user_id, req)
-        study_key = study_context.study_key
-        profile = self._get_method_profile(study_context.method_id, study_context.variant_id)
+    def _record_warm_start_entries(
+        self,
+        study_context: StudyContext,
+        keys: list[str],
+        brew_ids: dict[str, UUID],
+    ) -> None:
+        if not keys:
+            return
+        self.db.execute(
+            insert(WarmStartEntry),
+            [
+                {
+                    "id": uuid4(),
+                    "study_context_id": study_context.id,
+                    "dedupe_key": key,
+                    "brew_id": brew_ids.get(key),
+                }
+                for key in keys
+            ],
+        )
 
+    def _warm_start_query(
+        self,
+        study_context: StudyContext,
+        since: datetime | None,
+        after: tuple[datetime, UUID] | None,
+        limit: int,
+    ) -> Select[Any]:
+        ingested = (
+            select(WarmStartEntry.id)
+            .where(WarmStartEntry.study_context_id == study_context.id)
+            .where(WarmStartEntry.brew_id == Brew.id)
+        )
         query = (
             select(Brew)
-            .where(Brew.user_id == user_id)
+            .where(Brew.user_id == study_context.user_id)
             .where(Brew.method == study_context.method_id)
             .where(Brew.variant_id == study_context.variant_id)
             .where(Brew.bean_id == study_context.bean_id)
             .where(Brew.equipment_id == study_context.equipment_id)
             .where(Brew.status == BrewStatus.OK)
             .where(Brew.score.is_not(None))
-            .order_by(desc(Brew.brewed_at))
+            .where(~ingested.exists())
         )
-        if req.limit is not None:
-            query = query.limit(req.limit)
-
-        brews = list(self.db.scalars(query))
-        candidates: list[WarmStartCandidate] = []
-        for brew in brews:
-            params = dict(brew.parameters)
-            self._validate_params_for_profile(study_context.method_id, params, profile)
-            candidates.append(
-                WarmStartCandidate(
-                    dedupe_key=self._dedupe_key_for_brew(study_key, brew),
-                    brew_id=brew.id,
-                    parameters=params,
-                    score=float(brew.score),
-                )
-            )
-
-        study = optuna.load_study(study_name=study_key, storage=self.storage)
-        known_keys = self._study_existing_warm_start_keys(study)
-        added = 0
+        if after is not None:
+            query = query.where(tuple_(Brew.created_at, Brew.id) > tuple_(*after))
+        elif since is not None:
+            query = query.where(Brew.created_at >= since)
+        return query.order_by(Brew.created_at, Brew.id).limit(limit)
 
-        for candidate in candidates:
-            if candidate.dedupe_key in known_keys:
-                continue
-            trial = create_trial(
+    def _ingest_warm_start_page(
+        self,
+        study: optuna.Study,
+        study_context: StudyContext,
+        profile: CompiledMethodProfile,
+        brews: list[Brew],
+    ) -> int:
+        profile.validate_many([dict(brew.parameters) for brew in brews])
+        candidates = [
+            WarmStartCandidate(
+                dedupe_key=self._dedupe_key_for_brew(study_context.study_key, brew),
+                brew_id=brew.id,
+                parameters=dict(brew.parameters),
+                score=float(brew.score or 0.0),
+            )
+            for brew in brews
+        ]
+        trials = [
+            create_trial(
                 params=candidate.parameters,
-                distributions=self._distributions_for_profile(profile),
+                distributions=profile.distributions,
                 value=candidate.score,
                 user_attrs={
                     "warm_start": True,
@@ -427,16 +327,79 @@ class OptimisationService:
                     "warm_start_brew_id": str(candidate.brew_id),
                 },
             )
-            study.add_trial(trial)
-            known_keys.add(candidate.dedupe_key)
-            added += 1
+            for candidate in candidates
+        ]
+        keys = [candidate.dedupe_key for candidate in candidates]
+        self._record_warm_start_entries(
+            study_context,
+            keys,
+            {candidate.dedupe_key: candidate.brew_id for candidate in candidates},
+        )
+        newest = brews[-1].created_at
+        watermark = study_context.warm_start_created_at
+        if watermark is None or newest > watermark:
+            study_context.warm_start_created_at = newest
+        self.db.commit()
 
-        skipped = len(candidates) - added
+        try:
+            bulk_add_trials(study, self.storage, trials)
+        except Exception:
+            self.db.execute(
+                delete(WarmStartEntry)
+                .where(WarmStartEntry.study_context_id == study_context.id)
+                .where(WarmStartEntry.dedupe_key.in_(keys))
+            )
+            study_context.warm_start_created_at = watermark
+            self.db.commit()
+            raise
+        return len(trials)
+
+    def warm_start(
+        self,
+        user_id: UUID,
+        req: WarmStartRequest,
+        progress: ProgressCallback | None = None,
+    ) -> WarmStartResponse:
+        study_context = self.ensure_study_context(user_id, req)
+        study_key = study_context.study_key
+        profile = self._get_compiled_profile(study_context.method_id, study_context.variant_id)
+        study = self._load_study(study_key, create_missing=True)
+        if req.full:
+            study_context.warm_start_created_at = None
+            self.db.commit()
+
+        since = None
+        if study_context.warm_start_created_at is not None:
+            overlap = timedelta(seconds=self.settings.warm_start_watermark_overlap_seconds)
+            since = study_context.warm_start_created_at - overlap
+        batch_size = max(self.settings.warm_start_batch_size, 1)
+        remaining = req.limit
+        after: tuple[datetime, UUID] | None = None
+        scanned = added = 0
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            brews: list[Brew] = list(
+                self.db.scalars(self._warm_start_query(study_context, since, after, page_size))
+            )
+            if not brews:
+                break
+            after = (brews[-1].created_at, brews[-1].id)
+            added += self._ingest_warm_start_page(study, study_context, profile, brews)
+            scanned += len(brews)
+            if progress is not None:
+                progress(scanned, added, scanned - added)
+            if remaining is not None:
+                remaining -= len(brews)
+            if len(brews) < page_size:
+                break
+
+        skipped = scanned - added
         self.logger.info(
             "optimisation.warm_start.completed",
             extra={
                 "study_key": study_key,
-                "scanned": len(candidates),
+                "rebuild": req.full,
+                "scanned": scanned,
                 "added": added,
                 "skipped": skipped,
             },
@@ -444,45 +407,84 @@ class OptimisationService:
 
         return WarmStartResponse(
             study_key=study_key,
-            scanned=len(candidates),
+            scanned=scanned,
             added=added,
             skipped=skipped,
         )
 
+    def submit_warm_start_job(
+        self,
+        user_id: UUID,
+        req: WarmStartRequest,
+        jobs: WarmStartJobManager,
+        session_factory: sessionmaker[Session],
+    ) -> WarmStartJob:
+        study_context = self.ensure_study_context(user_id, req)
+        storage = self.storage
+        study_cache = self.study_cache
+
+        def run(progress: ProgressCallback) -> WarmStartResponse:
+            with session_factory() as db:
+                service = OptimisationService(db, storage, study_cache)
+                return service.warm_start(user_id, req, progress)
+
+        return jobs.submit(user_id, study_context.study_key, run, full=req.full, limit=req.limit)
+
+    def get_warm_start_job(
+        self, user_id: UUID, job_id: UUID, jobs: WarmStartJobManager
+    ) -> WarmStartJob:
+        job = jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            raise NotFoundError("Warm start job not found", code="warm_start_job_not_found")
+        return job
+
     def suggest(self, user_id: UUID, req: StudyRequest) -> Suggestion:
+        return self.suggest_batch(user_id, req, count=1)[0]
+
+    def suggest_batch(self, user_id: UUID, req: StudyRequest, count: int) -> list[Suggestion]:
         study_context = self.ensure_study_context(user_id, req)
         study_key = study_context.study_key
-        profile = self._get_method_profile(study_context.method_id, study_context.variant_id)
-
-        study = optuna.load_study(study_name=study_key, storage=self.storage)
-        trial = study.ask()
-        params = {
-            str(spec["name"]): self._suggest_param_from_spec(trial, spec)
-            for spec in profile.parameters
-        }
-        self._validate_params_for_profile(study_context.method_id, params, profile)
+        profile = self._get_compiled_profile(study_context.method_id, study_context.variant_id)
+
+        sampler = self._sampler_config(study_context)
+        study = self._load_study(study_key, create_missing=True, sampler=sampler)
+        suggestions: list[Suggestion] = []
+        for _ in range(count):
+            trial = study.ask()
+            params = profile.suggest(trial)
+            profile.validate(params)
+            suggestions.append(
+                Suggestion(
+                    id=uuid4(),
+                    user_id=user_id,
+                    study_context_id=study_context.id,
+                    study_key=study_key,
+                    trial_number=trial.number,
+                    trial_id=self._trial_id(study, trial.number),
+                    suggested_params=params,
+                    actual_params=None,
+                    status="issued",
+                )
+            )
 
-        suggestion = Suggestion(
-            user_id=user_id,
-            study_context_id=study_context.id,
-            study_key=study_key,
-            trial_number=trial.number,
-            suggested_params=params,
-            actual_params=None,
-            status="issued",
-        )
-        self.db.add(suggestion)
+        self.db.add_all(suggestions)
         self.db.commit()
-        self.db.refresh(suggestion)
-        self.logger.info(
-            "optimisation.suggestion.issued",
-            extra={
-                "study_key": study_key,
-                "trial_number": trial.number,
-                "suggestion_id": str(suggestion.id),
-            },
-        )
-        return suggestion
+        ids = [suggestion.id for suggestion in suggestions]
+        by_id = {
+            suggestion.id: suggestion
+            for suggestion in self.db.scalars(select(Suggestion).where(Suggestion.id.in_(ids)))
+        }
+        suggestions = [by_id[suggestion_id] for suggestion_id in ids]
+        for suggestion in suggestions:
+            self.logger.info(
+                "optimisation.suggestion.issued",
+                extra={
+                    "study_key": study_key,
+                    "trial_number": suggestion.trial_number,
+                    "suggestion_id": str(suggestion.id),
+                },
+            )
+        return suggestions
 
     def _validate_score(self, score: float | None) -> float:
         if score is None:
@@ -497,12 +499,7 @@ class OptimisationService:
             )
         return float(score)
 
-    def apply(
-        self, user_id: UUID, suggestion_id: UUID, brew_id: UUID, score: float | None, failed: bool
-    ) -> Suggestion:
-        suggestion = self.db.scalar(
-            select(Suggestion).where(Suggestion.id == suggestion_id, Suggestion.user_id == user_id)
-        )
+    def _check_suggestion_can_apply(self, suggestion: Suggestion | None) -> Suggestion:
         if suggestion is None:
             raise NotFoundError("Suggestion not found", code="suggestion_not_found")
         if suggestion.status == "applied":
@@ -510,8 +507,9 @@ class OptimisationService:
                 "Suggestion was already applied and cannot be applied again",
                 code="suggestion_already_applied",
             )
+        return suggestion
 
-        brew = self.db.scalar(select(Brew).where(Brew.id == brew_id, Brew.user_id == user_id))
+    def _check_brew_matches_suggestion(self, suggestion: Suggestion, brew: Brew | None) -> Brew:
         if brew is None:
             raise NotFoundError("Brew not found", code="brew_not_found")
 
@@ -527,56 +525,218 @@ class OptimisationService:
                 "bean, and equipment are identical.",
                 code="suggestion_context_mismatch",
             )
+        return brew
 
+    def _load_study_for_apply(self, study_key: str) -> optuna.Study:
         try:
-            study = optuna.load_study(study_name=suggestion.study_key, storage=self.storage)
+            return self._load_study(study_key)
         except KeyError as exc:
             raise NotFoundError("Study not found", code="study_not_found") from exc
 
-        known_trial_numbers = {trial.number for trial in study.get_trials(deepcopy=False)}
-        if suggestion.trial_number not in known_trial_numbers:
+    def _trial_id(self, study: optuna.Study, trial_number: int) -> int:
+        return self.storage.get_trial_id_from_study_id_trial_number(study._study_id, trial_number)
+
+    def _get_suggestion_trial(
+        self, study: optuna.Study, suggestion: Suggestion
+    ) -> optuna.trial.FrozenTrial:
+        try:
+            trial_id = suggestion.trial_id
+            if trial_id is None:
+                trial_id = self._trial_id(study, suggestion.trial_number)
+            trial = self.storage.get_trial(trial_id)
+        except KeyError as exc:
             raise NotFoundError(
-                "Suggestion trial not found",
-                code="suggestion_trial_not_found",
+                "Suggestion trial not found", code="suggestion_trial_not_found"
+            ) from exc
+        if trial.number != suggestion.trial_number:
+            raise NotFoundError("Suggestion trial not found", code="suggestion_trial_not_found")
+        if trial.state != optuna.trial.TrialState.RUNNING:
+            raise ConflictError(
+                "Suggestion trial is already finished", code="suggestion_trial_finished"
             )
+        return trial
 
+    def _objective_for_outcome(self, brew: Brew, score: float | None, failed: bool) -> float:
+        if failed:
+            return float(self.settings.failed_brew_score)
+        candidate_value = score if score is not None else brew.score
+        return self._validate_score(candidate_value)
+
+    def _record_outcome(
+        self, suggestion: Suggestion, brew: Brew, objective: float, failed: bool
+    ) -> RollupKey | None:
+        previous_score = brew.score
         if failed:
-            objective = float(self.settings.failed_brew_score)
             brew.status = BrewStatus.FAILED
             brew.score = None
         else:
-            candidate_value = score if score is not None else brew.score
-            objective = self._validate_score(candidate_value)
             brew.status = BrewStatus.OK
             brew.score = objective
 
-        study.tell(suggestion.trial_number, objective)
-
-        suggestion.brew_id = brew_id
+        suggestion.brew_id = brew.id
         suggestion.actual_params = dict(brew.parameters)
         suggestion.status = "applied"
-        self.db.commit()
-        self.db.refresh(suggestion)
+        if brew.score == previous_score:
+            return None
+        return rollup_key(brew)
+
+    def _refresh_rollups(self, keys: list[RollupKey | None]) -> None:
+        changed = [key for key in keys if key is not None]
+        if changed:
+            self.db.flush()
+            BrewRollupService(self.db).refresh(changed)
+
+    def _log_applied(self, suggestion: Suggestion, objective: float, failed: bool) -> None:
         self.logger.info(
             "optimisation.suggestion.applied",
             extra={
                 "study_key": suggestion.study_key,
                 "trial_number": suggestion.trial_number,
                 "suggestion_id": str(suggestion.id),
-                "brew_id": str(brew_id),
+                "brew_id": str(suggestion.brew_id),
                 "objective": objective,
                 "failed": failed,
             },
         )
+
+    def apply(
+        self, user_id: UUID, suggestion_id: UUID, brew_id: UUID, score: float | None, failed: bool
+    ) -> Suggestion:
+        suggestion = self._check_suggestion_can_apply(
+            self.db.scalar(
+                select(Suggestion).where(
+                    Suggestion.id == suggestion_id, Suggestion.user_id == user_id
+                )
+            )
+        )
+        brew = self._check_brew_matches_suggestion(
+            suggestion,
+            self.db.scalar(select(Brew).where(Brew.id == brew_id, Brew.user_id == user_id)),
+        )
+
+        study = self._load_study_for_apply(suggestion.study_key)
+        self._get_suggestion_trial(study, suggestion)
+
+        objective = self._objective_for_outcome(brew, score, failed)
+        study.tell(suggestion.trial_number, objective)
+
+        self._refresh_rollups([self._record_outcome(suggestion, brew, objective, failed)])
+        self.db.commit()
+        UserService(self.db).bump_brew_version(user_id)
+        get_brew_array_cache().invalidate(user_id)
+        self.sampler_states.save(suggestion.study_key)
+        self.db.refresh(suggestion)
+        self._log_applied(suggestion, objective, failed)
         return suggestion
 
+    def apply_many(self, user_id: UUID, items: list[BulkApplyItem]) -> BulkApplyResponse:
+        suggestion_ids = {item.suggestion_id for item in items}
+        brew_ids = {item.brew_id for item in items}
+        suggestions = {
+            suggestion.id: suggestion
+            for suggestion in self.db.scalars(
+                select(Suggestion)
+                .options(selectinload(Suggestion.study_context))
+                .where(Suggestion.id.in_(suggestion_ids), Suggestion.user_id == user_id)
+            )
+        }
+        brews = {
+            brew.id: brew
+            for brew in self.db.scalars(
+                select(Brew).where(Brew.id.in_(brew_ids), Brew.user_id == user_id)
+            )
+        }
+
+        results: list[BulkApplyItemResult | None] = [None] * len(items)
+        pending: dict[str, list[tuple[int, BulkApplyItem, Suggestion, Brew, float]]] = {}
+        claimed: set[UUID] = set()
+
+        def record_error(index: int, item: BulkApplyItem, exc: APIError) -> None:
+            results[index] = BulkApplyItemResult(
+                suggestion_id=item.suggestion_id,
+                status="error",
+                code=exc.code,
+                detail=exc.detail,
+            )
+
+        for index, item in enumerate(items):
+            try:
+                if item.suggestion_id in claimed:
+                    raise ConflictError(
+                        "Suggestion appears more than once in this request",
+                        code="suggestion_duplicated_in_request",
+                    )
+                suggestion = self._check_suggestion_can_apply(suggestions.get(item.suggestion_id))
+                brew = self._check_brew_matches_suggestion(suggestion, brews.get(item.brew_id))
+                objective = self._objective_for_outcome(brew, item.score, item.failed)
+            except APIError as exc:
+                record_error(index, item, exc)
+                continue
+            claimed.add(item.suggestion_id)
+            pending.setdefault(suggestion.study_key, []).append(
+                (index, item, suggestion, brew, objective)
+            )
+
+        applied: list[tuple[int, Suggestion, float, bool]] = []
+        rollup_keys: list[RollupKey | None] = []
+        for study_key, entries in pending.items():
+            try:
+                study = self._load_study_for_apply(study_key)
+            except APIError as exc:
+                for index, item, *_ in entries:
+                    record_error(index, item, exc)
+                continue
+
+            for index, item, suggestion, brew, objective in entries:
+                try:
+                    self._get_suggestion_trial(study, suggestion)
+                except APIError as exc:
+                    record_error(index, item, exc)
+                    continue
+                study.tell(suggestion.trial_number, objective)
+                rollup_keys.append(self._record_outcome(suggestion, brew, objective, item.failed))
+                applied.append((index, suggestion, objective, item.failed))
+
+        if applied:
+            self._refresh_rollups(rollup_keys)
+            self.db.commit()
+            UserService(self.db).bump_brew_version(user_id)
+            get_brew_array_cache().invalidate(user_id)
+            for study_key in {suggestion.study_key for _, suggestion, _, _ in applied}:
+                self.sampler_states.save(study_key)
+            refreshed = {
+                suggestion.id: suggestion
+                for suggestion in self.db.scalars(
+                    select(Suggestion).where(
+                        Suggestion.id.in_([suggestion.id for _, suggestion, _, _ in applied])
+                    )
+                )
+            }
+            for index, suggestion, objective, failed in applied:
+                self._log_applied(suggestion, objective, failed)
+                results[index] = BulkApplyItemResult(
+                    suggestion_id=suggestion.id,
+                    status="applied",
+                    suggestion=SuggestionRead.model_validate(refreshed[suggestion.id]),
+                )
+
+        item_results = [result for result in results if result is not None]
+        return BulkApplyResponse(
+            applied=len(applied),
+            failed=len(item_results) - len(applied),
+            results=item_results,
+        )
+
     def insights(self, study_key: str) -> OptimisationInsight:
-        study = optuna.load_study(study_name=study_key, storage=self.storage)
-        completed = [t for t in study.get_trials(deepcopy=False) if t.value is not None]
-        importance = get_param_importances(study) if len(completed) >= 3 else {}
+        study = self._load_study(study_key)
+        trial_count = completed_trial_count(study)
+        entry = self.insights_cache.get(study_key, study, trial_count)
         return OptimisationInsight(
             study_key=study_key,
-            trial_count=len(completed),
-            parameter_importance=importance,
+            trial_count=trial_count,
+            parameter_importance=entry.parameter_importance,
             generated_at=datetime.now(timezone.utc),
+            computed_at=entry.computed_at,
+            computed_trial_count=entry.trial_count,
+            stale=entry.trial_count != trial_count,
         )
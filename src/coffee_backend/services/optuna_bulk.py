@@ -0,0 +1,136 @@
+import json
+from collections.abc import Sequence
+
+import optuna
+from optuna.distributions import (
+    BaseDistribution,
+    check_distribution_compatibility,
+    distribution_to_json,
+    json_to_distribution,
+)
+from optuna.storages._rdb import models
+from optuna.storages._rdb.storage import _create_scoped_session
+from optuna.trial import FrozenTrial
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+SUPPORTED_SCHEMA_VERSION = "v3.2.0.a"
+
+
+def _check_distributions(session: Session, study_id: int, trials: Sequence[FrozenTrial]) -> None:
+    incoming: dict[str, BaseDistribution] = {}
+    for trial in trials:
+        for name, distribution in trial.distributions.items():
+            previous = incoming.setdefault(name, distribution)
+            check_distribution_compatibility(previous, distribution)
+
+    for name, distribution in incoming.items():
+        stored = session.scalar(
+            select(models.TrialParamModel.distribution_json)
+            .join(models.TrialModel)
+            .where(models.TrialModel.study_id == study_id)
+            .where(models.TrialParamModel.param_name == name)
+            .limit(1)
+        )
+        if stored is not None:
+            check_distribution_compatibility(json_to_distribution(stored), distribution)
+
+
+def _trial_children(row: models.TrialModel, trial: FrozenTrial) -> list[models.BaseModel]:
+    children: list[models.BaseModel] = []
+    for objective, value in enumerate(trial.values or ()):
+        stored_value, value_type = models.TrialValueModel.value_to_stored_repr(value)
+        children.append(
+            models.TrialValueModel(
+                trial_id=row.trial_id,
+                objective=objective,
+                value=stored_value,
+                value_type=value_type,
+            )
+        )
+    for name, value in trial.params.items():
+        distribution = trial.distributions[name]
+        children.append(
+            models.TrialParamModel(
+                trial_id=row.trial_id,
+                param_name=name,
+                param_value=distribution.to_internal_repr(value),
+                distribution_json=distribution_to_json(distribution),
+            )
+        )
+    for key, value in trial.user_attrs.items():
+        children.append(
+            models.TrialUserAttributeModel(
+                trial_id=row.trial_id, key=key, value_json=json.dumps(value)
+            )
+        )
+    for key, value in trial.system_attrs.items():
+        children.append(
+            models.TrialSystemAttributeModel(
+                trial_id=row.trial_id, key=key, value_json=json.dumps(value)
+            )
+        )
+    for step, value in trial.intermediate_values.items():
+        intermediate, intermediate_type = (
+            models.TrialIntermediateValueModel.intermediate_value_to_stored_repr(value)
+        )
+        children.append(
+            models.TrialIntermediateValueModel(
+                trial_id=row.trial_id,
+                step=step,
+                intermediate_value=intermediate,
+                intermediate_value_type=intermediate_type,
+            )
+        )
+    return children
+
+
+def bulk_add_trials(
+    study: optuna.Study,
+    storage: optuna.storages.BaseStorage,
+    trials: Sequence[FrozenTrial],
+) -> list[FrozenTrial]:
+    if not trials:
+        return []
+    if (
+        not isinstance(storage, optuna.storages.RDBStorage)
+        or storage.get_current_version() != SUPPORTED_SCHEMA_VERSION
+    ):
+        study.add_trials(trials)
+        return list(trials)
+
+    for trial in trials:
+        trial._validate()
+        if trial.values is not None and len(trial.values) != len(study.directions):
+            raise ValueError(
+                f"The added trial has {len(trial.values)} values, which is different from the "
+                f"number of objectives {len(study.directions)} in the study."
+            )
+
+    study_id = storage.get_study_id_from_name(study.study_name)
+    with _create_scoped_session(storage.scoped_session) as session:
+        models.StudyModel.find_or_raise_by_id(study_id, session, for_update=True)
+        _check_distributions(session, study_id, trials)
+        first_number = (
+            session.scalar(
+                select(func.count())
+                .select_from(models.TrialModel)
+                .where(models.TrialModel.study_id == study_id)
+            )
+            or 0
+        )
+        rows = [
+            models.TrialModel(
+                study_id=study_id,
+                number=first_number + offset,
+                state=trial.state,
+                datetime_start=trial.datetime_start,
+                datetime_complete=trial.datetime_complete,
+            )
+            for offset, trial in enumerate(trials)
+        ]
+        session.add_all(rows)
+        session.flush()
+        for row, trial in zip(rows, trials, strict=True):
+            session.add_all(_trial_children(row, trial))
+    return list(trials)
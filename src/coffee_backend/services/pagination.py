@@ -0,0 +1,225 @@
+import base64
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from coffee_backend.core.config import get_settings
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.schemas.common import BaseSchema, CursorPage
+
+SchemaT = TypeVar("SchemaT", bound=BaseSchema)
+
+
+@dataclass(frozen=True)
+class KeysetOrder:
+    name: str
+    column: InstrumentedAttribute[Any]
+    id_column: InstrumentedAttribute[Any]
+    descending: bool = False
+    nullable: bool = False
+
+    def order_by(self) -> list[ColumnElement[Any]]:
+        column = self.column.desc() if self.descending else self.column.asc()
+        if self.nullable:
+            column = column.nulls_last()
+        return [column, self.id_column.desc() if self.descending else self.id_column.asc()]
+
+    def after(self, value: object, last_id: uuid.UUID) -> ColumnElement[bool]:
+        def beyond(left: Any, right: Any) -> ColumnElement[bool]:
+            seek: ColumnElement[bool] = left < right if self.descending else left > right
+            return seek
+
+        if value is None:
+            return and_(self.column.is_(None), beyond(self.id_column, last_id))
+        seek = beyond(tuple_(self.column, self.id_column), tuple_(value, last_id))
+        return or_(self.column.is_(None), seek) if self.nullable else seek
+
+
+def created_order(model: type[Any]) -> KeysetOrder:
+    return KeysetOrder(name="created_at", column=model.created_at, id_column=model.id)
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    items: list[Any]
+    next_cursor: str | None
+
+
+def _invalid_cursor() -> ValidationError:
+    return ValidationError("Invalid pagination cursor", code="invalid_cursor")
+
+
+def encode_cursor(order: KeysetOrder, value: object, last_id: uuid.UUID) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([order.name, value, str(last_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(order: KeysetOrder, cursor: str) -> tuple[object, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if name != order.name:
+            raise _invalid_cursor()
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return value, uuid.UUID(last_id)
+    except (ValueError, TypeError) as exc:
+        raise _invalid_cursor() from exc
+
+
+def keyset_paginate(
+    db: Session, query: Select[Any], order: KeysetOrder, cursor: str | None, limit: int
+) -> KeysetPage:
+    if cursor is not None:
+        value, last_id = decode_cursor(order, cursor)
+        query = query.where(order.after(value, last_id))
+    rows = list(db.scalars(query.order_by(*order.order_by()).limit(limit + 1)))
+    if len(rows) <= limit:
+        return KeysetPage(items=rows, next_cursor=None)
+    last = rows[limit - 1]
+    return KeysetPage(
+        items=rows[:limit],
+        next_cursor=encode_cursor(order, getattr(last, order.column.key), last.id),
+    )
+
+
+def cursor_limit(
+    cursor: str | None, limit: int | None, page: int | None, page_size: int | None
+) -> int | None:
+    if cursor is None and limit is None:
+        return None
+    if page is not None or page_size is not None:
+        raise ValidationError("Use either page or cursor pagination", code="invalid_pagination")
+    return limit or 20
+
+
+def owned_cursor_page(
+    db: Session,
+    model: type[Any],
+    schema: type[SchemaT],
+    owner_id: uuid.UUID,
+    cursor: str | None,
+    limit: int,
+    include_total: bool,
+) -> CursorPage[SchemaT]:
+    owned = model.user_id == owner_id
+    page = keyset_paginate(db, select(model).where(owned), created_order(model), cursor, limit)
+    total = get_count_cache().count(db, model, owner_id, [owned]) if include_total else None
+    return CursorPage(
+        items=[schema.model_validate(item) for item in page.items],
+        next_cursor=page.next_cursor,
+        limit=limit,
+        total=total,
+    )
+
+
+@dataclass(frozen=True)
+class CountCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    max_entries: int
+
+
+class CountCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str, Hashable], tuple[int, float]] = OrderedDict()
+        self._scopes: dict[tuple[str, str], set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def count(
+        self,
+        db: Session,
+        model: type[Any],
+        owner_id: object,
+        filters: list[ColumnElement[bool]],
+        filter_key: Hashable = (),
+    ) -> int:
+        if self.max_entries <= 0:
+            return self._count(db, model, filters)
+
+        scope = (model.__tablename__, str(owner_id))
+        key = (*scope, filter_key)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > now:
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+
+        total = self._count(db, model, filters)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (total, now + self.ttl_seconds)
+            self._scopes.setdefault(scope, set()).add(filter_key)
+            self._evict(now)
+        return total
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            key, (_, expires_at) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and expires_at > now:
+                return
+            del self._entries[key]
+            scope = (key[0], key[1])
+            filter_keys = self._scopes.get(scope)
+            if filter_keys is not None:
+                filter_keys.discard(key[2])
+                if not filter_keys:
+                    del self._scopes[scope]
+
+    def _count(self, db: Session, model: type[Any], filters: list[ColumnElement[bool]]) -> int:
+        return db.scalar(select(func.count()).select_from(model).where(*filters)) or 0
+
+    def invalidate(self, model: type[Any], owner_id: object) -> None:
+        scope = (model.__tablename__, str(owner_id))
+        with self._lock:
+            filter_keys = self._scopes.pop(scope, None)
+            if filter_keys is None:
+                return
+            for filter_key in filter_keys:
+                self._entries.pop((*scope, filter_key), None)
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def stats(self) -> CountCacheStats:
+        with self._lock:
+            return CountCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+@lru_cache(maxsize=1)
+def get_count_cache() -> CountCache:
+    settings = get_settings()
+    return CountCache(
+        max_entries=settings.list_count_cache_max_entries,
+        ttl_seconds=settings.list_count_cache_ttl_seconds,
+    )
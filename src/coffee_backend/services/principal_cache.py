@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from coffee_backend.core.config import get_settings
+from coffee_backend.db.models.user import User
+
+_PENDING_KEY = "principal_cache_pending"
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: UUID
+    email: str
+    name: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class PrincipalCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    max_entries: int
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[Principal, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, db: Session, user_id: UUID) -> Principal | None:
+        if self.max_entries <= 0:
+            return self._load(db, user_id)
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is not None and cached[1] > now:
+                self._entries.move_to_end(user_id)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+            generation = self._generation
+
+        principal = self._load(db, user_id)
+        if principal is None:
+            return None
+        with self._lock:
+            if generation == self._generation:
+                self._entries[user_id] = (principal, now + self.ttl_seconds)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def _load(self, db: Session, user_id: UUID) -> Principal | None:
+        row = db.execute(
+            select(User.id, User.email, User.name, User.created_at, User.updated_at).where(
+                User.id == user_id
+            )
+        ).one_or_none()
+        return Principal(**row._mapping) if row is not None else None
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(user_id, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> PrincipalCacheStats:
+        with self._lock:
+            return PrincipalCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+@lru_cache(maxsize=1)
+def get_principal_cache() -> PrincipalCache:
+    settings = get_settings()
+    return PrincipalCache(
+        max_entries=settings.principal_cache_max_entries,
+        ttl_seconds=settings.principal_cache_ttl_seconds,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session: Session, _flush_context: Any) -> None:
+    changed = {
+        instance.id
+        for instance in (*session.dirty, *session.deleted)
+        if isinstance(instance, User) and instance.id is not None
+    }
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+        for user_id in changed:
+            get_principal_cache().invalidate(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        get_principal_cache().invalidate(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_user_changes(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
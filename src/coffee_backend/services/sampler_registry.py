@@ -0,0 +1,150 @@
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, fields, replace
+from http import HTTPStatus
+from importlib.util import find_spec
+from typing import Any, get_type_hints
+
+import optuna
+
+from coffee_backend.core.config import Settings
+from coffee_backend.core.exceptions import APIError, ValidationError
+from coffee_backend.services.sampler_state import StatefulTPESampler, get_sampler_state_store
+
+
+@dataclass(frozen=True)
+class SamplerConfig:
+    name: str = "tpe"
+    seed: int | None = None
+    n_startup_trials: int = 10
+    multivariate: bool = False
+    group: bool = False
+    constant_liar: bool = True
+    prior_weight: float = 1.0
+
+    @property
+    def key(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+
+def _tpe(config: SamplerConfig) -> optuna.samplers.BaseSampler:
+    return StatefulTPESampler(
+        seed=config.seed,
+        n_startup_trials=config.n_startup_trials,
+        multivariate=config.multivariate or config.group,
+        group=config.group,
+        constant_liar=config.constant_liar,
+        prior_weight=config.prior_weight,
+        store=get_sampler_state_store(),
+    )
+
+
+def _random(config: SamplerConfig) -> optuna.samplers.BaseSampler:
+    return optuna.samplers.RandomSampler(seed=config.seed)
+
+
+def _qmc(config: SamplerConfig) -> optuna.samplers.BaseSampler:
+    return optuna.samplers.QMCSampler(seed=config.seed, scramble=True)
+
+
+def _gp(config: SamplerConfig) -> optuna.samplers.BaseSampler:
+    return optuna.samplers.GPSampler(seed=config.seed, n_startup_trials=config.n_startup_trials)
+
+
+SAMPLER_BUILDERS: dict[str, Callable[[SamplerConfig], optuna.samplers.BaseSampler]] = {
+    "tpe": _tpe,
+    "random": _random,
+    "qmc": _qmc,
+    "gp": _gp,
+}
+
+SAMPLER_REQUIREMENTS: dict[str, tuple[str, ...]] = {
+    "qmc": ("scipy",),
+    "gp": ("scipy", "torch"),
+}
+
+_CONFIG_FIELDS = {field.name for field in fields(SamplerConfig)}
+_CONFIG_TYPES = get_type_hints(SamplerConfig)
+
+
+def _option_matches(value: object, expected: Any) -> bool:
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        return isinstance(value, int | float)
+    return isinstance(value, expected)
+
+
+def sampler_config_from_settings(settings: Settings) -> SamplerConfig:
+    return SamplerConfig(
+        name=settings.optuna_sampler,
+        seed=settings.optuna_sampler_seed,
+        n_startup_trials=settings.optuna_sampler_startup_trials,
+        multivariate=settings.optuna_tpe_multivariate,
+        group=settings.optuna_tpe_group,
+        constant_liar=settings.optuna_tpe_constant_liar,
+        prior_weight=settings.optuna_tpe_prior_weight,
+    )
+
+
+def merge_sampler_config(
+    base: SamplerConfig, overrides: Mapping[str, object] | None
+) -> SamplerConfig:
+    if not overrides:
+        return base
+    unknown = sorted(key for key in overrides if key not in _CONFIG_FIELDS)
+    if unknown:
+        raise ValidationError(
+            "Sampler configuration contains unknown options",
+            code="invalid_method_profile",
+            fields=dict.fromkeys(unknown, "unknown sampler option"),
+        )
+    mistyped = sorted(
+        key for key, value in overrides.items() if not _option_matches(value, _CONFIG_TYPES[key])
+    )
+    if mistyped:
+        raise ValidationError(
+            "Sampler configuration options have the wrong type",
+            code="invalid_method_profile",
+            fields=dict.fromkeys(mistyped, "wrong type for sampler option"),
+        )
+    options: dict[str, Any] = dict(overrides)
+    config = replace(base, **options)
+    if config.name not in SAMPLER_BUILDERS:
+        raise ValidationError(
+            f"Unsupported sampler '{config.name}'",
+            code="invalid_method_profile",
+            fields={"name": f"one of {sorted(SAMPLER_BUILDERS)}"},
+        )
+    return config
+
+
+def build_sampler(config: SamplerConfig) -> optuna.samplers.BaseSampler:
+    builder = SAMPLER_BUILDERS.get(config.name)
+    if builder is None:
+        raise ValidationError(
+            f"Unsupported sampler '{config.name}'",
+            code="invalid_sampler",
+            fields={"name": f"one of {sorted(SAMPLER_BUILDERS)}"},
+        )
+    missing = [
+        module for module in SAMPLER_REQUIREMENTS.get(config.name, ()) if find_spec(module) is None
+    ]
+    if missing:
+        raise APIError(
+            f"Sampler '{config.name}' requires optional dependencies: {', '.join(missing)}",
+            code="sampler_unavailable",
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+    return builder(config)
+
+
+def available_samplers() -> list[str]:
+    return [
+        name
+        for name in SAMPLER_BUILDERS
+        if all(find_spec(module) is not None for module in SAMPLER_REQUIREMENTS.get(name, ()))
+    ]
@@ -0,0 +1,568 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import optuna
+from optuna.distributions import BaseDistribution, distribution_to_json, json_to_distribution
+from optuna.samplers._tpe.parzen_estimator import _ParzenEstimator
+from optuna.samplers._tpe.sampler import default_gamma
+from optuna.study import StudyDirection
+from optuna.trial import FrozenTrial, TrialState
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from coffee_backend.core.config import get_settings
+
+SNAPSHOT_VERSION = 1
+
+_FINISHED_STATES = (TrialState.COMPLETE, TrialState.PRUNED)
+_SAMPLED_STATES = (TrialState.COMPLETE, TrialState.PRUNED, TrialState.RUNNING)
+
+_FINISHED_COUNT_QUERY = text("""
+    SELECT COUNT(trial_id) FROM trials
+    WHERE study_id = :study_id AND state IN ('COMPLETE', 'PRUNED')
+    """)
+_RUNNING_NUMBERS_QUERY = text("""
+    SELECT number FROM trials WHERE study_id = :study_id AND state = 'RUNNING'
+    """)
+
+
+@dataclass(frozen=True)
+class SamplerStateStats:
+    hits: int
+    misses: int
+    snapshot_loads: int
+    snapshot_writes: int
+    entries: int
+    max_entries: int
+
+
+@dataclass(frozen=True)
+class SamplerStateArrays:
+    version: int
+    numbers: np.ndarray
+    values: np.ndarray
+    columns: dict[str, np.ndarray]
+
+
+class SamplerState:
+    def __init__(self, study_name: str, study_id: int):
+        self.study_name = study_name
+        self.study_id = study_id
+        self.numbers: list[int] = []
+        self.values: list[float] = []
+        self.columns: dict[str, list[float]] = {}
+        self.distributions: dict[str, BaseDistribution] = {}
+        self.exact = True
+        self.verified = True
+        self.version = 0
+        self.lock = threading.RLock()
+        self.running_params: dict[int, dict[str, Any]] = {}
+        self._seen: set[int] = set()
+        self._arrays: SamplerStateArrays | None = None
+        self._estimators: dict[tuple[Any, ...], _ParzenEstimator] = {}
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    @property
+    def seen(self) -> int:
+        return len(self._seen)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.numbers.clear()
+            self.values.clear()
+            self.columns.clear()
+            self.distributions.clear()
+            self.exact = True
+            self.verified = True
+            self.running_params.clear()
+            self._seen.clear()
+            self._changed()
+
+    def record(
+        self,
+        number: int,
+        value: float,
+        params: dict[str, Any],
+        distributions: dict[str, BaseDistribution],
+    ) -> None:
+        with self.lock:
+            if number in self._seen:
+                return
+            row = len(self.numbers)
+            for name, distribution in distributions.items():
+                if self.distributions.setdefault(name, distribution) != distribution:
+                    self.exact = False
+                column = self.columns.get(name)
+                if column is None:
+                    column = self.columns[name] = [math.nan] * row
+                column.append(distribution.to_internal_repr(params[name]))
+            for column in self.columns.values():
+                if len(column) == row:
+                    column.append(math.nan)
+            self.numbers.append(number)
+            self.values.append(float(value))
+            self._seen.add(number)
+            self.running_params.pop(number, None)
+            self._changed()
+
+    def skip(self, number: int) -> None:
+        with self.lock:
+            self._seen.add(number)
+            self.exact = False
+            self._changed()
+
+    def sync(self, trials: Sequence[FrozenTrial]) -> None:
+        with self.lock:
+            if not self.verified:
+                numbers = {trial.number for trial in trials}
+                if not self._seen <= numbers:
+                    self.reset()
+                self.verified = True
+            if len(trials) < self.seen:
+                self.reset()
+            if len(trials) == self.seen:
+                return
+            for trial in trials:
+                if trial.number in self._seen:
+                    continue
+                if trial.state == TrialState.COMPLETE and len(trial.values) == 1:
+                    self.record(trial.number, trial.values[0], trial.params, trial.distributions)
+                else:
+                    self.skip(trial.number)
+
+    def search_space(self) -> dict[str, BaseDistribution]:
+        with self.lock:
+            if not self.numbers:
+                return {}
+            arrays = self.arrays()
+            return {
+                name: self.distributions[name]
+                for name in sorted(self.columns)
+                if not self.distributions[name].single()
+                and not np.isnan(arrays.columns[name]).any()
+            }
+
+    def arrays(self) -> SamplerStateArrays:
+        with self.lock:
+            if self._arrays is None or self._arrays.version != self.version:
+                self._arrays = SamplerStateArrays(
+                    version=self.version,
+                    numbers=np.asarray(self.numbers, dtype=int),
+                    values=np.asarray(self.values, dtype=float),
+                    columns={
+                        name: np.asarray(column, dtype=float)
+                        for name, column in self.columns.items()
+                    },
+                )
+            return self._arrays
+
+    def estimator(self, key: tuple[Any, ...]) -> _ParzenEstimator | None:
+        with self.lock:
+            return self._estimators.get(key)
+
+    def remember_estimator(self, key: tuple[Any, ...], estimator: _ParzenEstimator) -> None:
+        with self.lock:
+            self._estimators[key] = estimator
+
+    def to_snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "version": SNAPSHOT_VERSION,
+                "study_name": self.study_name,
+                "study_id": self.study_id,
+                "exact": self.exact,
+                "seen": sorted(self._seen),
+                "numbers": list(self.numbers),
+                "values": list(self.values),
+                "columns": {name: list(column) for name, column in self.columns.items()},
+                "distributions": {
+                    name: distribution_to_json(distribution)
+                    for name, distribution in self.distributions.items()
+                },
+            }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "SamplerState":
+        state = cls(str(snapshot["study_name"]), int(snapshot["study_id"]))
+        state.numbers = [int(number) for number in snapshot["numbers"]]
+        state.values = [float(value) for value in snapshot["values"]]
+        state.columns = {
+            name: [float(value) for value in column] for name, column in snapshot["columns"].items()
+        }
+        state.distributions = {
+            name: json_to_distribution(payload)
+            for name, payload in snapshot["distributions"].items()
+        }
+        state.exact = bool(snapshot["exact"])
+        state.verified = False
+        state._seen = {int(number) for number in snapshot["seen"]}
+        if any(len(column) != len(state.numbers) for column in state.columns.values()):
+            raise ValueError("Sampler state snapshot has ragged columns")
+        return state
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._estimators.clear()
+
+
+class SamplerStateStore:
+    def __init__(self, max_entries: int, snapshot_dir: str | None = None):
+        self.max_entries = max_entries
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self._entries: OrderedDict[str, SamplerState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._snapshot_loads = 0
+        self._snapshot_writes = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def peek(self, study_name: str, study_id: int) -> SamplerState | None:
+        with self._lock:
+            state = self._entries.get(study_name)
+        if state is None or state.study_id != study_id:
+            return None
+        return state
+
+    def load(self, study_name: str, study_id: int) -> SamplerState:
+        with self._lock:
+            state = self._entries.get(study_name)
+            if state is not None and state.study_id == study_id:
+                self._entries.move_to_end(study_name)
+                self._hits += 1
+                return state
+            self._misses += 1
+
+        state = self._read_snapshot(study_name, study_id) or SamplerState(study_name, study_id)
+        with self._lock:
+            current = self._entries.get(study_name)
+            if current is not None and current.study_id == study_id:
+                return current
+            self._entries[study_name] = state
+            self._entries.move_to_end(study_name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return state
+
+    def save(self, study_name: str) -> None:
+        if self.snapshot_dir is None:
+            return
+        with self._lock:
+            state = self._entries.get(study_name)
+        if state is None:
+            return
+        path = self._snapshot_path(study_name)
+        temp_path = path.with_suffix(".tmp")
+        try:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(state.to_snapshot()), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            self.logger.exception(
+                "optimisation.sampler_state.snapshot_write_failed",
+                extra={"study_key": study_name},
+            )
+            return
+        with self._lock:
+            self._snapshot_writes += 1
+
+    def invalidate(self, study_name: str) -> None:
+        with self._lock:
+            self._entries.pop(study_name, None)
+        if self.snapshot_dir is not None:
+            self._snapshot_path(study_name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SamplerStateStats:
+        with self._lock:
+            return SamplerStateStats(
+                hits=self._hits,
+                misses=self._misses,
+                snapshot_loads=self._snapshot_loads,
+                snapshot_writes=self._snapshot_writes,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def _snapshot_path(self, study_name: str) -> Path:
+        assert self.snapshot_dir is not None
+        digest = hashlib.sha256(study_name.encode("utf-8")).hexdigest()
+        return self.snapshot_dir / f"{digest}.json"
+
+    def _read_snapshot(self, study_name: str, study_id: int) -> SamplerState | None:
+        if self.snapshot_dir is None:
+            return None
+        path = self._snapshot_path(study_name)
+        if not path.exists():
+            return None
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                return None
+            state = SamplerState.from_snapshot(snapshot)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.logger.warning(
+                "optimisation.sampler_state.snapshot_unreadable", extra={"study_key": study_name}
+            )
+            return None
+        if state.study_name != study_name or state.study_id != study_id:
+            return None
+        with self._lock:
+            self._snapshot_loads += 1
+        self.logger.info(
+            "optimisation.sampler_state.snapshot_loaded",
+            extra={"study_key": study_name, "trial_count": len(state)},
+        )
+        return state
+
+
+class StatefulTPESampler(optuna.samplers.TPESampler):
+    def __init__(self, *args: Any, store: "SamplerStateStore | None" = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._store = store
+        self._estimator_key = repr(self._parzen_estimator_parameters)
+        self._local = threading.local()
+
+    def infer_relative_search_space(
+        self, study: optuna.Study, trial: FrozenTrial
+    ) -> dict[str, BaseDistribution]:
+        if self._group or not self._is_multivariate(study):
+            return super().infer_relative_search_space(study, trial)
+        snapshot = self._snapshot(study, trial)
+        if snapshot is None:
+            return super().infer_relative_search_space(study, trial)
+        state, _ = snapshot
+        return state.search_space()
+
+    def _sample_relative(
+        self, study: optuna.Study, trial: FrozenTrial, search_space: dict[str, BaseDistribution]
+    ) -> dict[str, Any]:
+        if search_space == {}:
+            return {}
+        snapshot = self._snapshot(study, trial)
+        if snapshot is None:
+            return super()._sample_relative(study, trial, search_space)
+        if len(snapshot[0]) < self._n_startup_trials:
+            return {}
+        return self._sample(study, trial, search_space)
+
+    def sample_independent(
+        self,
+        study: optuna.Study,
+        trial: FrozenTrial,
+        param_name: str,
+        param_distribution: BaseDistribution,
+    ) -> Any:
+        snapshot = None if self._is_multivariate(study) else self._snapshot(study, trial)
+        if snapshot is None:
+            return super().sample_independent(study, trial, param_name, param_distribution)
+        if len(snapshot[0]) < self._n_startup_trials:
+            return self._random_sampler.sample_independent(
+                study, trial, param_name, param_distribution
+            )
+        return self._sample(study, trial, {param_name: param_distribution})[param_name]
+
+    def after_trial(
+        self,
+        study: optuna.Study,
+        trial: FrozenTrial,
+        state: TrialState,
+        values: Sequence[float] | None,
+    ) -> None:
+        super().after_trial(study, trial, state, values)
+        if self._store is None:
+            return
+        sampler_state = self._store.peek(study.study_name, study._study_id)
+        if sampler_state is None:
+            return
+        if state == TrialState.COMPLETE and values is not None and len(values) == 1:
+            sampler_state.record(trial.number, values[0], trial.params, trial.distributions)
+        elif state == TrialState.PRUNED:
+            sampler_state.skip(trial.number)
+
+    def _snapshot(
+        self, study: optuna.Study, trial: FrozenTrial
+    ) -> tuple[SamplerState, dict[int, dict[str, Any]]] | None:
+        if (
+            self._store is None
+            or not self._store.enabled
+            or self._constraints_func is not None
+            or study._is_multi_objective()
+        ):
+            return None
+        cache_key = (study.study_name, study._study_id, trial.number)
+        cached = getattr(self._local, "snapshot", None)
+        if cached is not None and cached[0] == cache_key:
+            state, running = cached[1]
+        else:
+            state = self._store.load(study.study_name, study._study_id)
+            running = self._probe(study, state, trial)
+            if running is None:
+                running = self._read(study, state)
+            self._local.snapshot = (cache_key, (state, running))
+        if not state.exact:
+            return None
+        return state, running
+
+    def _probe(
+        self, study: optuna.Study, state: SamplerState, trial: FrozenTrial
+    ) -> dict[int, dict[str, Any]] | None:
+        engine = _rdb_engine(study)
+        if engine is None or not state.verified:
+            return None
+        with engine.connect() as connection:
+            finished = connection.execute(
+                _FINISHED_COUNT_QUERY, {"study_id": study._study_id}
+            ).scalar_one()
+            numbers = connection.execute(
+                _RUNNING_NUMBERS_QUERY, {"study_id": study._study_id}
+            ).scalars()
+            running = [number for number in numbers if number != trial.number]
+        with state.lock:
+            if finished != state.seen or any(
+                number not in state.running_params for number in running
+            ):
+                return None
+            return {number: state.running_params[number] for number in running}
+
+    def _read(self, study: optuna.Study, state: SamplerState) -> dict[int, dict[str, Any]]:
+        trials = study._get_trials(deepcopy=False, states=_SAMPLED_STATES, use_cache=False)
+        state.sync([t for t in trials if t.state in _FINISHED_STATES])
+        running = {
+            t.number: self._get_params(t, study) for t in trials if t.state == TrialState.RUNNING
+        }
+        with state.lock:
+            state.running_params = {
+                number: params
+                for number, params in running.items()
+                if params and params.keys() >= state.distributions.keys()
+            }
+        return running
+
+    def _sample(
+        self, study: optuna.Study, trial: FrozenTrial, search_space: dict[str, BaseDistribution]
+    ) -> dict[str, Any]:
+        snapshot = self._snapshot(study, trial)
+        if snapshot is None or any(
+            snapshot[0].distributions.get(name) != distribution
+            for name, distribution in search_space.items()
+        ):
+            return super()._sample(study, trial, search_space)
+        state, running = snapshot
+        liars = (
+            [
+                (
+                    number,
+                    [search_space[name].to_internal_repr(params[name]) for name in search_space],
+                )
+                for number, params in sorted(running.items())
+                if number != trial.number and search_space.keys() <= params.keys()
+            ]
+            if self._constant_liar
+            else []
+        )
+
+        with state.lock:
+            mpe_below, mpe_above = self._fitted_estimators(study, state, liars, search_space)
+        samples_below = mpe_below.sample(self._rng.rng, self._n_ei_candidates)
+        acq_func_vals = self._compute_acquisition_func(samples_below, mpe_below, mpe_above)
+        ret = optuna.samplers.TPESampler._compare(samples_below, acq_func_vals)
+        for param_name, dist in search_space.items():
+            ret[param_name] = dist.to_external_repr(ret[param_name])
+        return ret
+
+    def _fitted_estimators(
+        self,
+        study: optuna.Study,
+        state: SamplerState,
+        liars: list[tuple[int, list[float]]],
+        search_space: dict[str, BaseDistribution],
+    ) -> tuple[_ParzenEstimator, _ParzenEstimator]:
+        names = tuple(search_space)
+        below_key = ("below", names, self._estimator_key)
+        above_key = ("above", names, tuple(number for number, _ in liars), self._estimator_key)
+        mpe_below = state.estimator(below_key)
+        mpe_above = state.estimator(above_key)
+        if mpe_below is not None and mpe_above is not None:
+            return mpe_below, mpe_above
+
+        arrays = state.arrays()
+        if study.direction == StudyDirection.MINIMIZE:
+            order = np.lexsort((arrays.numbers, arrays.values))
+        else:
+            order = np.lexsort((arrays.numbers, -arrays.values))
+        gamma = self._gamma or default_gamma
+        n_below = min(gamma(len(state)), len(order))
+        complete = np.ones(len(order), dtype=bool)
+        for name in names:
+            complete &= ~np.isnan(arrays.columns[name])
+
+        if mpe_below is None:
+            below = order[:n_below]
+            below = below[complete[below]]
+            below = below[np.argsort(arrays.numbers[below], kind="stable")]
+            mpe_below = self._parzen_estimator_cls(
+                {name: arrays.columns[name][below] for name in names},
+                search_space,
+                self._parzen_estimator_parameters,
+            )
+            state.remember_estimator(below_key, mpe_below)
+
+        if mpe_above is None:
+            above = order[n_below:]
+            above = above[complete[above]]
+            numbers = np.concatenate(
+                [arrays.numbers[above], np.asarray([number for number, _ in liars], dtype=int)]
+            )
+            permutation = np.argsort(numbers, kind="stable")
+            observations = {}
+            for position, name in enumerate(names):
+                column = np.concatenate(
+                    [
+                        arrays.columns[name][above],
+                        np.asarray([row[position] for _, row in liars], dtype=float),
+                    ]
+                )
+                observations[name] = column[permutation]
+            mpe_above = self._parzen_estimator_cls(
+                observations, search_space, self._parzen_estimator_parameters
+            )
+            state.remember_estimator(above_key, mpe_above)
+
+        return mpe_below, mpe_above
+
+
+def _rdb_engine(study: optuna.Study) -> Engine | None:
+    backend = getattr(study._storage, "_backend", study._storage)
+    if isinstance(backend, optuna.storages.RDBStorage):
+        return backend.engine
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_sampler_state_store() -> SamplerStateStore:
+    settings = get_settings()
+    return SamplerStateStore(
+        max_entries=settings.sampler_state_max_entries,
+        snapshot_dir=settings.sampler_state_dir,
+    )
@@ -0,0 +1,148 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+import optuna
+from sqlalchemy import text
+
+from coffee_backend.core.config import get_settings
+
+TRIAL_BYTES_ESTIMATE = 2048
+STUDY_BYTES_OVERHEAD = 16384
+
+_STUDY_VERSION_QUERY = text("""
+    SELECT studies.study_id, COUNT(trials.trial_id)
+    FROM studies
+    LEFT OUTER JOIN trials ON trials.study_id = studies.study_id
+    WHERE studies.study_name = :study_name
+    GROUP BY studies.study_id
+    """)
+
+
+@dataclass
+class StudyCacheEntry:
+    study: optuna.Study
+    storage_url: str
+    study_id: int
+    trial_count: int
+    sampler_key: str | None = None
+
+    @property
+    def estimated_bytes(self) -> int:
+        return STUDY_BYTES_OVERHEAD + self.trial_count * TRIAL_BYTES_ESTIMATE
+
+
+@dataclass(frozen=True)
+class StudyCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    estimated_bytes: int
+    max_bytes: int
+
+
+class StudyCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, StudyCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self.logger = logging.getLogger(__name__)
+
+    def _read_version(self, storage: optuna.storages.RDBStorage, study_key: str) -> tuple[int, int]:
+        with storage.engine.connect() as connection:
+            row = connection.execute(_STUDY_VERSION_QUERY, {"study_name": study_key}).first()
+        if row is None:
+            raise KeyError(f"Record does not exist for study '{study_key}'")
+        return int(row[0]), int(row[1])
+
+    def get(
+        self,
+        study_key: str,
+        storage: optuna.storages.RDBStorage,
+        sampler_factory: Callable[[], optuna.samplers.BaseSampler] | None = None,
+        sampler_key: str | None = None,
+    ) -> optuna.Study:
+        if self.max_bytes <= 0:
+            sampler = sampler_factory() if sampler_factory is not None else None
+            return optuna.load_study(study_name=study_key, storage=storage, sampler=sampler)
+
+        study_id, trial_count = self._read_version(storage, study_key)
+        with self._lock:
+            entry = self._entries.get(study_key)
+            if (
+                entry is not None
+                and entry.storage_url == storage.url
+                and entry.study_id == study_id
+                and entry.trial_count <= trial_count
+            ):
+                entry.trial_count = trial_count
+                if sampler_factory is not None and sampler_key not in {None, entry.sampler_key}:
+                    entry.study.sampler = sampler_factory()
+                    entry.sampler_key = sampler_key
+                self._entries.move_to_end(study_key)
+                self._hits += 1
+                self._evict_over_budget()
+                return entry.study
+
+            if entry is not None:
+                self._entries.pop(study_key)
+                self._invalidations += 1
+            self._misses += 1
+
+        sampler = sampler_factory() if sampler_factory is not None else None
+        study = optuna.load_study(study_name=study_key, storage=storage, sampler=sampler)
+        with self._lock:
+            self._entries[study_key] = StudyCacheEntry(
+                study=study,
+                storage_url=storage.url,
+                study_id=study_id,
+                trial_count=trial_count,
+                sampler_key=sampler_key if sampler_factory is not None else None,
+            )
+            self._entries.move_to_end(study_key)
+            self._evict_over_budget()
+        return study
+
+    def invalidate(self, study_key: str) -> None:
+        with self._lock:
+            if self._entries.pop(study_key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> StudyCacheStats:
+        with self._lock:
+            return StudyCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                estimated_bytes=self._estimated_bytes(),
+                max_bytes=self.max_bytes,
+            )
+
+    def _estimated_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._entries.values())
+
+    def _evict_over_budget(self) -> None:
+        while len(self._entries) > 1 and self._estimated_bytes() > self.max_bytes:
+            study_key, _ = self._entries.popitem(last=False)
+            self._evictions += 1
+            self.logger.info("optimisation.study_cache.evicted", extra={"study_key": study_key})
+
+
+@lru_cache(maxsize=1)
+def get_study_cache() -> StudyCache:
+    return StudyCache(max_bytes=get_settings().study_cache_max_bytes)
@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from uuid import UUID
+
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -39,3 +41,12 @@ class UserService:
 
     def list_users(self) -> list[User]:
         return list(self.db.scalars(select(User).order_by(User.created_at.desc())))
+
+    def get_brew_version(self, user_id: UUID) -> int:
+        return self.db.scalar(select(User.brew_version).where(User.id == user_id)) or 0
+
+    def bump_brew_version(self, user_id: UUID) -> None:
+        self.db.execute(
+            update(User).where(User.id == user_id).values(brew_version=User.brew_version + 1)
+        )
+        self.db.commit()
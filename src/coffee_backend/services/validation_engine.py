@@ -0,0 +1,451 @@
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.schemas.parameter_registry import METHOD_PARAMETER_REGISTRY
+
+Number = int | float
+Choice = bool | int | float | str | None
+ScalarCheck = Callable[[object], str | None]
+
+INT_KIND = "int"
+FLOAT_KIND = "float"
+BOOL_KIND = "bool"
+CATEGORICAL_KIND = "categorical"
+STEP_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class ParameterRule:
+    name: str
+    kind: str
+    low: Number | None = None
+    high: Number | None = None
+    step: Number | None = None
+    choices: tuple[Choice, ...] | None = None
+    required: bool = True
+    check: ScalarCheck = field(default=lambda _: None, compare=False, repr=False)
+
+    @property
+    def bounds(self) -> tuple[Number, Number]:
+        if self.low is None or self.high is None:
+            raise ValueError(f"Rule '{self.name}' has no numeric bounds")
+        return self.low, self.high
+
+
+class ValidationStyle(ABC):
+    @abstractmethod
+    def unknown(self, names: list[str]) -> ValidationError: ...
+
+    @abstractmethod
+    def missing(self, names: list[str]) -> ValidationError: ...
+
+    @abstractmethod
+    def invalid(self, rule: ParameterRule, reason: str, value: object) -> ValidationError: ...
+
+
+def _shown(value: object) -> object:
+    return float(value) if isinstance(value, (int, float)) else value
+
+
+class ProfileValidationStyle(ValidationStyle):
+    code = "invalid_suggested_params"
+
+    def unknown(self, names: list[str]) -> ValidationError:
+        return ValidationError(
+            "Suggested params contain unknown parameter keys for this method profile",
+            code=self.code,
+            fields=dict.fromkeys(names, "unknown parameter for profile"),
+        )
+
+    def missing(self, names: list[str]) -> ValidationError:
+        return ValidationError(
+            f"Suggested params missing '{names[0]}'",
+            code=self.code,
+            fields={names[0]: "missing parameter"},
+        )
+
+    def _error(self, name: str, detail: str, field_detail: str) -> ValidationError:
+        return ValidationError(
+            f"Invalid value for '{name}': {detail}",
+            code=self.code,
+            fields={name: field_detail},
+        )
+
+    def invalid(self, rule: ParameterRule, reason: str, value: object) -> ValidationError:
+        name = rule.name
+        if reason == "type":
+            expected = {INT_KIND: "int", FLOAT_KIND: "number", BOOL_KIND: "bool"}[rule.kind]
+            return self._error(name, f"expected {expected}", f"expected {expected}")
+        if reason == "choice":
+            choices = list(rule.choices or ())
+            return self._error(name, f"choose one of {choices}", f"one of {choices}")
+        if rule.kind == INT_KIND:
+            return self._error(
+                name,
+                f"{value} must be between {rule.low} and {rule.high} with step {rule.step}",
+                f"between {rule.low}-{rule.high} step {rule.step}",
+            )
+        if reason == "step":
+            return self._error(
+                name,
+                f"{_shown(value)} must follow step {rule.step} from {rule.low}",
+                f"step {rule.step} from {rule.low}",
+            )
+        return self._error(
+            name,
+            f"{_shown(value)} must be between {rule.low} and {rule.high}",
+            f"between {rule.low}-{rule.high}",
+        )
+
+
+class RegistryValidationStyle(ValidationStyle):
+    def unknown(self, names: list[str]) -> ValidationError:
+        return ValidationError(
+            "Unknown parameter keys",
+            code="unknown_parameter_keys",
+            fields=dict.fromkeys(names, "unknown parameter"),
+        )
+
+    def missing(self, names: list[str]) -> ValidationError:
+        return ValidationError(
+            "Missing required parameters",
+            code="missing_required_parameters",
+            fields=dict.fromkeys(sorted(names), "required parameter missing"),
+        )
+
+    def invalid(self, rule: ParameterRule, reason: str, value: object) -> ValidationError:
+        name = rule.name
+        if reason == "type":
+            expected = "int" if rule.kind == INT_KIND else "number"
+            return ValidationError(
+                f"{name} must be {expected}",
+                code="invalid_parameter_type",
+                fields={name: f"must be {expected}"},
+            )
+        if reason == "choice":
+            return ValidationError(
+                f"{name} invalid choice",
+                code="invalid_parameter_choice",
+                fields={name: f"must be one of {list(rule.choices or ())}"},
+            )
+        return ValidationError(
+            f"{name} out of range",
+            code="parameter_out_of_range",
+            fields={name: f"must be between {rule.low} and {rule.high}"},
+        )
+
+
+PROFILE_STYLE = ProfileValidationStyle()
+REGISTRY_STYLE = RegistryValidationStyle()
+
+
+def _int_check(low: int, high: int, step: int | None) -> ScalarCheck:
+    def check(value: object) -> str | None:
+        if not isinstance(value, int) or isinstance(value, bool):
+            return "type"
+        if value < low or value > high:
+            return "range"
+        if step is not None and (value - low) % step != 0:
+            return "step"
+        return None
+
+    return check
+
+
+def _float_check(low: float, high: float, step: float | None) -> ScalarCheck:
+    def check(value: object) -> str | None:
+        if not isinstance(value, (float, int)) or isinstance(value, bool):
+            return "type"
+        f_value = float(value)
+        if not math.isfinite(f_value):
+            return "type"
+        if f_value < low or f_value > high:
+            return "range"
+        if step is not None:
+            remainder = (f_value - low) / step
+            if abs(remainder - round(remainder)) > STEP_TOLERANCE * max(1.0, abs(remainder)):
+                return "step"
+        return None
+
+    return check
+
+
+def _bool_check(value: object) -> str | None:
+    return None if isinstance(value, bool) else "type"
+
+
+def _choice_check(choices: tuple[Choice, ...]) -> ScalarCheck:
+    def check(value: object) -> str | None:
+        return None if value in choices else "choice"
+
+    return check
+
+
+def build_rule(
+    name: str,
+    kind: str,
+    *,
+    low: Number | None = None,
+    high: Number | None = None,
+    step: Number | None = None,
+    choices: Sequence[Choice] | None = None,
+    required: bool = True,
+) -> ParameterRule:
+    check: ScalarCheck
+    if kind in {INT_KIND, FLOAT_KIND}:
+        if low is None or high is None:
+            raise ValueError(f"Rule '{name}' requires both low and high bounds")
+        if kind == INT_KIND:
+            low, high = int(low), int(high)
+            step = int(step) if step is not None else None
+            check = _int_check(low, high, step)
+        else:
+            low, high = float(low), float(high)
+            step = float(step) if step is not None else None
+            check = _float_check(low, high, step)
+    elif kind == BOOL_KIND:
+        check = _bool_check
+    elif kind == CATEGORICAL_KIND:
+        check = _choice_check(tuple(choices or ()))
+    else:
+        raise ValueError(f"Unsupported rule kind '{kind}'")
+    return ParameterRule(
+        name=name,
+        kind=kind,
+        low=low,
+        high=high,
+        step=step,
+        choices=tuple(choices) if choices is not None else None,
+        required=required,
+        check=check,
+    )
+
+
+@dataclass(frozen=True)
+class ColumnarValidationResult:
+    n_rows: int
+    masks: dict[str, np.ndarray]
+
+    @property
+    def row_errors(self) -> np.ndarray:
+        errors = np.zeros(self.n_rows, dtype=bool)
+        for mask in self.masks.values():
+            errors |= mask
+        return errors
+
+    @property
+    def valid_rows(self) -> np.ndarray:
+        return ~self.row_errors
+
+
+def _missing_mask(column: np.ndarray) -> np.ndarray:
+    if column.dtype.kind == "f":
+        mask: np.ndarray = np.isnan(column)
+        return mask
+    if column.dtype.kind == "O":
+        return np.fromiter((value is None for value in column), dtype=bool, count=len(column))
+    return np.zeros(len(column), dtype=bool)
+
+
+def _numeric_view(
+    column: np.ndarray, kind: str, present: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    type_errors = np.zeros(len(column), dtype=bool)
+    dtype_kind = column.dtype.kind
+    if dtype_kind in "iu":
+        return column.astype(np.float64, copy=False), type_errors
+    if dtype_kind == "f" and kind == FLOAT_KIND:
+        type_errors |= present & np.isinf(column)
+        return column.astype(np.float64, copy=False), type_errors
+    if dtype_kind != "O":
+        type_errors[present] = True
+        return np.zeros(len(column), dtype=np.float64), type_errors
+
+    accepted = (int,) if kind == INT_KIND else (int, float)
+    values = np.zeros(len(column), dtype=np.float64)
+    for index in np.flatnonzero(present):
+        value = column[index]
+        if isinstance(value, accepted) and not isinstance(value, bool) and math.isfinite(value):
+            values[index] = value
+        else:
+            type_errors[index] = True
+    return values, type_errors
+
+
+def check_rule_column(rule: ParameterRule, column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    missing = _missing_mask(column)
+    present = ~missing
+    if rule.kind == CATEGORICAL_KIND:
+        return present & ~np.isin(column, np.array(rule.choices, dtype=object)), missing
+    if rule.kind == BOOL_KIND:
+        if column.dtype.kind == "b":
+            return np.zeros(len(column), dtype=bool), missing
+        type_errors = np.fromiter(
+            (not isinstance(value, bool) for value in column), dtype=bool, count=len(column)
+        )
+        return present & type_errors, missing
+
+    values, invalid = _numeric_view(column, rule.kind, present)
+    checked = present & ~invalid
+    low, high = rule.bounds
+    invalid |= checked & ((values < float(low)) | (values > float(high)))
+    if rule.step is not None:
+        offsets = (values - float(low)) / float(rule.step)
+        if rule.kind == INT_KIND:
+            off_step = offsets != np.round(offsets)
+        else:
+            off_step = np.abs(offsets - np.round(offsets)) > STEP_TOLERANCE * np.maximum(
+                1.0, np.abs(offsets)
+            )
+        invalid |= checked & off_step
+    return invalid, missing
+
+
+@dataclass(frozen=True)
+class CompiledValidator:
+    rules: tuple[ParameterRule, ...]
+    style: ValidationStyle
+    by_name: dict[str, ParameterRule]
+
+    def validate(self, params: Mapping[str, object], *, allow_unknown: bool = False) -> None:
+        if not allow_unknown:
+            unknown = sorted(key for key in params if key not in self.by_name)
+            if unknown:
+                raise self.style.unknown(unknown)
+
+        missing = [rule.name for rule in self.rules if rule.required and rule.name not in params]
+        if missing:
+            raise self.style.missing(missing)
+
+        for rule in self.rules:
+            if rule.name not in params:
+                continue
+            value = params[rule.name]
+            reason = rule.check(value)
+            if reason is not None:
+                raise self.style.invalid(rule, reason, value)
+
+    def validate_columns(
+        self,
+        columns: Mapping[str, np.ndarray | Sequence[object]],
+        n_rows: int,
+        *,
+        allow_unknown: bool = False,
+    ) -> ColumnarValidationResult:
+        masks: dict[str, np.ndarray] = {}
+        for rule in self.rules:
+            raw = columns.get(rule.name)
+            if raw is None:
+                masks[rule.name] = np.full(n_rows, rule.required, dtype=bool)
+                continue
+            invalid, missing = check_rule_column(rule, np.asarray(raw))
+            masks[rule.name] = invalid | (missing if rule.required else False)
+
+        if not allow_unknown:
+            for name, raw in columns.items():
+                if name not in self.by_name:
+                    masks[name] = ~_missing_mask(np.asarray(raw))
+        return ColumnarValidationResult(n_rows=n_rows, masks=masks)
+
+
+def compile_validator(rules: Sequence[ParameterRule], style: ValidationStyle) -> CompiledValidator:
+    return CompiledValidator(
+        rules=tuple(rules),
+        style=style,
+        by_name={rule.name: rule for rule in rules},
+    )
+
+
+def rows_to_columns(
+    rows: Sequence[Mapping[str, object]], names: Sequence[str]
+) -> dict[str, np.ndarray]:
+    columns: dict[str, np.ndarray] = {}
+    for name in names:
+        column = np.empty(len(rows), dtype=object)
+        column[:] = [row.get(name) for row in rows]
+        columns[name] = column
+    extra = {key for row in rows for key in row} - set(names)
+    for name in sorted(extra):
+        column = np.empty(len(rows), dtype=object)
+        column[:] = [row.get(name) for row in rows]
+        columns[name] = column
+    return columns
+
+
+def _spec_number(spec: Mapping[str, object], key: str, *, required: bool = True) -> Number | None:
+    value = spec.get(key)
+    if value is None and not required:
+        return None
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValidationError(
+            f"Parameter '{spec['name']}' requires a numeric '{key}'",
+            code="invalid_method_profile",
+        )
+    return value
+
+
+def profile_rules(parameters: Sequence[Mapping[str, object]]) -> list[ParameterRule]:
+    rules: list[ParameterRule] = []
+    for spec in parameters:
+        name = str(spec["name"])
+        ptype = str(spec["type"])
+        if ptype in {"int", "float"}:
+            rules.append(
+                build_rule(
+                    name,
+                    INT_KIND if ptype == "int" else FLOAT_KIND,
+                    low=_spec_number(spec, "min"),
+                    high=_spec_number(spec, "max"),
+                    step=_spec_number(spec, "step", required=False)
+                    or (1 if ptype == "int" else None),
+                )
+            )
+        elif ptype == "bool":
+            rules.append(build_rule(name, BOOL_KIND))
+        elif ptype in {"enum", "categorical"}:
+            choices = spec.get("choices")
+            if (
+                not isinstance(choices, list)
+                or not choices
+                or not all(isinstance(choice, (bool, int, float, str)) for choice in choices)
+            ):
+                raise ValidationError(
+                    f"Parameter '{name}' enum/categorical requires non-empty choices",
+                    code="invalid_method_profile",
+                )
+            rules.append(build_rule(name, CATEGORICAL_KIND, choices=choices))
+        else:
+            raise ValidationError(
+                f"Unsupported parameter type '{ptype}' for '{name}'",
+                code="invalid_method_profile",
+            )
+    return rules
+
+
+def compile_profile_validator(parameters: Sequence[Mapping[str, object]]) -> CompiledValidator:
+    return compile_validator(profile_rules(parameters), PROFILE_STYLE)
+
+
+@lru_cache(maxsize=32)
+def get_registry_validator(method: str) -> CompiledValidator | None:
+    schema = METHOD_PARAMETER_REGISTRY.get(method)
+    if schema is None:
+        return None
+    rules = [
+        build_rule(
+            name,
+            spec["type"],
+            low=spec.get("min"),
+            high=spec.get("max"),
+            choices=spec.get("choices"),
+            required=bool(spec.get("required")),
+        )
+        for name, spec in schema.items()
+    ]
+    return compile_validator(rules, REGISTRY_STYLE)
@@ -0,0 +1,171 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from coffee_backend.core.exceptions import APIError
+from coffee_backend.schemas.optimisation import WarmStartResponse
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+ProgressCallback = Callable[[int, int, int], None]
+WarmStartRunner = Callable[[ProgressCallback], WarmStartResponse]
+JobKey = tuple[str, bool, int | None]
+
+
+@dataclass(frozen=True)
+class WarmStartJob:
+    id: UUID
+    user_id: UUID
+    study_key: str
+    full: bool = False
+    limit: int | None = None
+    status: str = JOB_QUEUED
+    scanned: int = 0
+    added: int = 0
+    skipped: int = 0
+    error_code: str | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in {JOB_QUEUED, JOB_RUNNING}
+
+    @property
+    def key(self) -> JobKey:
+        return (self.study_key, self.full, self.limit)
+
+
+class WarmStartJobManager:
+    def __init__(self, max_workers: int, history: int = 1000):
+        self.history = history
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="warm-start"
+        )
+        self._jobs: OrderedDict[UUID, WarmStartJob] = OrderedDict()
+        self._active: dict[JobKey, UUID] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        user_id: UUID,
+        study_key: str,
+        runner: WarmStartRunner,
+        full: bool = False,
+        limit: int | None = None,
+    ) -> WarmStartJob:
+        with self._lock:
+            active_id = self._active.get((study_key, full, limit))
+            if active_id is not None:
+                self.logger.info(
+                    "optimisation.warm_start_job.coalesced",
+                    extra={"study_key": study_key, "job_id": str(active_id)},
+                )
+                return self._jobs[active_id]
+
+            job = WarmStartJob(
+                id=uuid4(), user_id=user_id, study_key=study_key, full=full, limit=limit
+            )
+            self._jobs[job.id] = job
+            self._active[job.key] = job.id
+            self._trim()
+
+        self.logger.info(
+            "optimisation.warm_start_job.queued",
+            extra={"study_key": study_key, "job_id": str(job.id)},
+        )
+        try:
+            self._executor.submit(self._run, job.id, runner)
+        except Exception:
+            self._update(
+                job.id,
+                status=JOB_FAILED,
+                error_code="warm_start_failed",
+                error="Warm start failed",
+                finished_at=datetime.now(timezone.utc),
+            )
+            self.logger.exception(
+                "optimisation.warm_start_job.failed",
+                extra={"study_key": study_key, "job_id": str(job.id)},
+            )
+            raise
+        return job
+
+    def get(self, job_id: UUID) -> WarmStartJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _update(self, job_id: UUID, **changes: Any) -> WarmStartJob:
+        with self._lock:
+            job = replace(self._jobs[job_id], **changes)
+            self._jobs[job_id] = job
+            if not job.active and self._active.get(job.key) == job_id:
+                del self._active[job.key]
+            return job
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[: max(len(self._jobs) - self.history, 0)]:
+            del self._jobs[job_id]
+
+    def _run(self, job_id: UUID, runner: WarmStartRunner) -> None:
+        self._update(job_id, status=JOB_RUNNING)
+
+        def progress(scanned: int, added: int, skipped: int) -> None:
+            self._update(job_id, scanned=scanned, added=added, skipped=skipped)
+
+        try:
+            result = runner(progress)
+        except APIError as exc:
+            job = self._update(
+                job_id,
+                status=JOB_FAILED,
+                error_code=exc.code,
+                error=exc.detail,
+                finished_at=datetime.now(timezone.utc),
+            )
+            self.logger.warning(
+                "optimisation.warm_start_job.failed",
+                extra={"study_key": job.study_key, "job_id": str(job_id), "code": exc.code},
+            )
+            return
+        except Exception:
+            job = self._update(
+                job_id,
+                status=JOB_FAILED,
+                error_code="warm_start_failed",
+                error="Warm start failed",
+                finished_at=datetime.now(timezone.utc),
+            )
+            self.logger.exception(
+                "optimisation.warm_start_job.failed",
+                extra={"study_key": job.study_key, "job_id": str(job_id)},
+            )
+            return
+
+        job = self._update(
+            job_id,
+            status=JOB_COMPLETED,
+            scanned=result.scanned,
+            added=result.added,
+            skipped=result.skipped,
+            finished_at=datetime.now(timezone.utc),
+        )
+        self.logger.info(
+            "optimisation.warm_start_job.completed",
+            extra={"study_key": job.study_key, "job_id": str(job_id), "added": job.added},
+        )
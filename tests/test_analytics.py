@@ -0,0 +1,177 @@
+import numpy as np
+from sqlalchemy import select
+
+from coffee_backend.db.models.brew_rollup import BrewDailyRollup
+from coffee_backend.db.session import create_engine_from_settings, create_sessionmaker
+from coffee_backend.services.analytics_rollups import BrewRollupService
+
+
+def auth_headers(client):
+    client.post("/api/v1/auth/register", json={"email": "stats@example.com", "password": "pass123"})
+    res = client.post(
+        "/api/v1/auth/login", json={"email": "stats@example.com", "password": "pass123"}
+    )
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def _brew(client, headers, brewed_at, score, method="aeropress", grind_size=10, **extra):
+    parameters = (
+        {"grind_size": grind_size, "water_temp": 90.0, "brew_time_sec": 120}
+        if method == "aeropress"
+        else {
+            "grind_size": grind_size,
+            "water_temp": 90.0,
+            "bloom_time_sec": 30,
+            "total_time_sec": 180,
+        }
+    )
+    response = client.post(
+        "/api/v1/brews",
+        headers=headers,
+        json={
+            "method": method,
+            "variant_id": f"{method}_standard",
+            "parameters": parameters,
+            "brewed_at": brewed_at,
+            "score": score,
+            **extra,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _rollups(test_settings):
+    engine = create_engine_from_settings(test_settings)
+    with create_sessionmaker(engine)() as db:
+        rows = {
+            (row.method, str(row.day)): (
+                row.brew_count,
+                row.score_count,
+                row.score_sum,
+                row.score_min,
+                row.score_max,
+            )
+            for row in db.scalars(select(BrewDailyRollup))
+        }
+    engine.dispose()
+    return rows
+
+
+def test_rollups_track_brews_imports_and_applied_scores(client, test_settings, tmp_path):
+    headers = auth_headers(client)
+    _brew(client, headers, "2024-01-01T08:00:00+00:00", 7.0)
+    _brew(client, headers, "2024-01-01T18:00:00+00:00", 9.0)
+    _brew(client, headers, "2024-01-01T19:00:00+00:00", None)
+    _brew(client, headers, "2024-01-01T09:00:00+00:00", 5.0, method="pourover")
+    csv_path = tmp_path / "aeropress.rollup.csv"
+    csv_path.write_text(
+        "date,score,grind_size,water_temp,brew_time_sec\n"
+        "2024-01-01T10:00:00+00:00,6,10,90,120\n"
+        "2024-01-02T10:00:00+00:00,8,10,90,120\n",
+        encoding="utf-8",
+    )
+    client.post(
+        "/api/v1/import/csv",
+        headers=headers,
+        json={
+            "method": "aeropress",
+            "variant_id": "aeropress_standard",
+            "data_path": str(csv_path),
+        },
+    )
+
+    assert _rollups(test_settings) == {
+        ("aeropress", "2024-01-01"): (4, 3, 22.0, 6.0, 9.0),
+        ("aeropress", "2024-01-02"): (1, 1, 8.0, 8.0, 8.0),
+        ("pourover", "2024-01-01"): (1, 1, 5.0, 5.0, 5.0),
+    }
+    assert client.get("/api/v1/analytics/best", headers=headers).json() == {
+        "aeropress": {"best_score": 9.0},
+        "pourover": {"best_score": 5.0},
+    }
+    assert client.get("/api/v1/analytics/trend", headers=headers).json() == [
+        {"date": "2024-01-01", "avg_score": 27.0 / 4},
+        {"date": "2024-01-02", "avg_score": 8.0},
+    ]
+
+    suggestion = client.post(
+        "/api/v1/optimisation/suggest",
+        headers=headers,
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    ).json()
+    brew_id = _brew(client, headers, "2024-01-02T12:00:00+00:00", 4.0)
+    applied = client.post(
+        f"/api/v1/optimisation/suggestions/{suggestion['id']}/apply",
+        headers=headers,
+        json={"brew_id": brew_id, "score": 9.5, "failed": False},
+    )
+    assert applied.status_code == 200
+
+    rollups = _rollups(test_settings)
+    assert rollups[("aeropress", "2024-01-02")] == (2, 2, 17.5, 8.0, 9.5)
+
+    engine = create_engine_from_settings(test_settings)
+    with create_sessionmaker(engine)() as db:
+        assert BrewRollupService(db).rebuild() == 3
+    engine.dispose()
+    assert _rollups(test_settings) == rollups
+
+
+def test_dashboard_computes_breakdowns_and_refreshes_after_new_brews(client):
+    headers = auth_headers(client)
+    bean_id = client.post("/api/v1/beans", headers=headers, json={"name": "Kenya AA"}).json()["id"]
+    scores = [6.0, 8.0, 7.0, 9.0]
+    for day, (score, grind_size) in enumerate(zip(scores, [4, 4, 12, 12], strict=True), start=1):
+        _brew(
+            client,
+            headers,
+            f"2024-01-0{day}T08:00:00+00:00",
+            score,
+            grind_size=grind_size,
+            bean_id=bean_id,
+        )
+    _brew(client, headers, "2024-01-09T08:00:00+00:00", None)
+    _brew(client, headers, "2024-01-09T09:00:00+00:00", 5.0, method="pourover")
+
+    response = client.get("/api/v1/analytics/dashboard?window=2&bins=2", headers=headers)
+    assert response.status_code == 200
+    dashboard = response.json()
+
+    summary = dashboard["summary"]
+    all_scores = [*scores, 5.0]
+    assert summary["brews"] == 6
+    assert summary["scored"] == 5
+    assert summary["best_score"] == 9.0
+    assert summary["avg_score"] == sum(all_scores) / 5
+    assert (
+        list(summary["percentiles"].values())
+        == np.percentile(all_scores, [10, 25, 50, 75, 90]).tolist()
+    )
+    assert dashboard["methods"]["aeropress"]["brews"] == 5
+    assert dashboard["methods"]["aeropress"]["percentiles"]["p50"] == 7.5
+    assert dashboard["methods"]["pourover"]["best_score"] == 5.0
+
+    trend = {point["date"]: point for point in dashboard["trend"]}
+    assert trend["2024-01-02"]["rolling_avg"] == 7.0
+    assert trend["2024-01-04"]["rolling_avg"] == 8.0
+    assert trend["2024-01-09"]["brews"] == 2
+    assert trend["2024-01-09"]["rolling_avg"] == 5.0
+
+    grind_curve = dashboard["parameters"]["aeropress"]["grind_size"]
+    assert [(point["lower"], point["brews"], point["avg_score"]) for point in grind_curve] == [
+        (1.0, 2, 7.0),
+        (8.0, 3, 8.0),
+    ]
+    beans = {bean["name"]: bean for bean in dashboard["beans"]}
+    assert beans["Kenya AA"]["id"] == bean_id
+    assert beans["Kenya AA"]["avg_score"] == 7.5
+    assert beans[None]["brews"] == 2
+    assert dashboard["equipment"] == [
+        {**dashboard["equipment"][0], "id": None, "brews": 6, "scored": 5}
+    ]
+
+    _brew(client, headers, "2024-01-10T08:00:00+00:00", 10.0, grind_size=14)
+    refreshed = client.get("/api/v1/analytics/dashboard", headers=headers).json()
+    assert refreshed["summary"]["best_score"] == 10.0
+    assert refreshed["methods"]["aeropress"]["brews"] == 6
@@ -1,3 +1,8 @@
+from sqlalchemy import event, select
+
+from coffee_backend.db.models.user import User
+
+
 def test_register_and_login(client):
     register = client.post(
         "/api/v1/auth/register",
@@ -36,3 +41,40 @@ def test_register_duplicate_email_returns_409(client):
     assert first.status_code == 201
     assert second.status_code == 409
     assert second.json()["code"] == "email_already_registered"
+
+
+def test_authenticated_requests_reuse_cached_principal(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "cached@example.com", "password": "pass123", "name": "Before"},
+    )
+    token = client.post(
+        "/api/v1/auth/login", json={"email": "cached@example.com", "password": "pass123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/v1/auth/me", headers=headers).json()["name"] == "Before"
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = client.app.state.db_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+        assert client.get("/api/v1/beans", headers=headers).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert not [statement for statement in statements if "FROM users" in statement]
+
+    with client.app.state.db_sessionmaker() as db:
+        user = db.scalars(select(User).where(User.email == "cached@example.com")).one()
+        user.name = "After"
+        db.commit()
+    assert client.get("/api/v1/auth/me", headers=headers).json()["name"] == "After"
+
+    with client.app.state.db_sessionmaker() as db:
+        db.delete(db.scalars(select(User).where(User.email == "cached@example.com")).one())
+        db.commit()
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
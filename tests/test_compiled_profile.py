@@ -0,0 +1,119 @@
+from dataclasses import replace
+
+import numpy as np
+import optuna
+import pytest
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.compiled_profile import (
+    compile_method_profile,
+    invalidate_compiled_profiles,
+)
+from coffee_backend.services.method_profile_service import INITIAL_METHOD_PROFILES
+from coffee_backend.services.validation_engine import ColumnarValidationResult
+
+VALID_PARAMS: dict[str, object] = {
+    "dose_g": 15.5,
+    "water_g": 230,
+    "grind_step": 18,
+    "temp_c": 85,
+    "steep_s": 60,
+    "plunge_s": 25,
+    "stir_count": 5,
+}
+
+
+def _profile(variant_id: str = "aeropress_standard") -> MethodProfile:
+    payload = next(p for p in INITIAL_METHOD_PROFILES if p["variant_id"] == variant_id)
+    return MethodProfile(**payload)
+
+
+def test_compiled_profile_is_reused_for_same_version() -> None:
+    invalidate_compiled_profiles()
+    first = compile_method_profile(_profile())
+    second = compile_method_profile(_profile())
+
+    assert first is second
+    assert first.key == ("aeropress", "aeropress_standard", 1)
+    assert isinstance(first.distributions["water_g"], optuna.distributions.IntDistribution)
+
+
+def test_compiled_profile_recompiles_after_invalidation_or_changed_parameters() -> None:
+    invalidate_compiled_profiles()
+    first = compile_method_profile(_profile())
+    invalidate_compiled_profiles()
+    second = compile_method_profile(_profile())
+    assert first is not second
+
+    changed = _profile()
+    changed.parameters = [dict(spec) for spec in changed.parameters[:-1]]
+    third = compile_method_profile(changed)
+    assert third is not second
+    assert "stir_count" not in third.distributions
+
+
+def test_compiled_profile_validates_params() -> None:
+    compiled = compile_method_profile(_profile())
+    valid = {
+        "dose_g": 15.5,
+        "water_g": 230,
+        "grind_step": 18,
+        "temp_c": 85,
+        "steep_s": 60,
+        "plunge_s": 25,
+        "stir_count": 5,
+    }
+    compiled.validate(valid)
+
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({**valid, "water_g": 232})
+    assert exc.value.fields == {"water_g": "between 150-280 step 5"}
+
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate({**valid, "dose_g": 15.3})
+    assert exc.value.code == "invalid_suggested_params"
+
+
+def test_compiled_profile_suggests_every_parameter() -> None:
+    compiled = compile_method_profile(_profile("aeropress_inverted"))
+    study = optuna.create_study(direction="maximize")
+    params = compiled.suggest(study.ask())
+
+    assert set(params) == set(compiled.distributions)
+    compiled.validate(params)
+
+
+def test_validate_many_checks_hard_caps_on_every_row() -> None:
+    profile = _profile()
+    profile.parameters = [
+        {**spec, "max": 90} if spec["name"] == "plunge_s" else dict(spec)
+        for spec in profile.parameters
+    ]
+    compiled = compile_method_profile(profile)
+    rows = [dict(VALID_PARAMS), dict(VALID_PARAMS), {**VALID_PARAMS, "plunge_s": 65}]
+
+    with pytest.raises(ValidationError) as exc:
+        compiled.validate_many(rows)
+    assert exc.value.fields == {"plunge_s": "hard cap <= 60"}
+
+
+def test_validate_many_rejects_rows_flagged_only_by_columnar_check() -> None:
+    compiled = compile_method_profile(_profile())
+    flagged = np.array([False, True])
+
+    class ColumnarOnlyValidator:
+        def validate(self, params: dict[str, object]) -> None:
+            compiled.validator.validate(params)
+
+        def validate_columns(
+            self, columns: dict[str, np.ndarray], n_rows: int
+        ) -> ColumnarValidationResult:
+            return ColumnarValidationResult(n_rows=n_rows, masks={"dose_g": flagged})
+
+    strict = replace(compiled, validator=ColumnarOnlyValidator())  # type: ignore[arg-type]
+
+    with pytest.raises(ValidationError) as exc:
+        strict.validate_many([dict(VALID_PARAMS), dict(VALID_PARAMS)])
+    assert exc.value.code == "invalid_suggested_params"
+    assert exc.value.fields == {"dose_g": "invalid value"}
@@ -0,0 +1,77 @@
+from coffee_backend.services.method_profile_service import MethodProfileService
+
+
+def auth_headers(client):
+    client.post("/api/v1/auth/register", json={"email": "etag@example.com", "password": "pass123"})
+    res = client.post(
+        "/api/v1/auth/login", json={"email": "etag@example.com", "password": "pass123"}
+    )
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def create_brew(client, headers, brewed_at):
+    response = client.post(
+        "/api/v1/brews",
+        headers=headers,
+        json={
+            "method": "aeropress",
+            "variant_id": "aeropress_standard",
+            "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+            "brewed_at": brewed_at,
+            "score": 8.0,
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_method_profiles_answer_conditional_gets_without_queries(client, monkeypatch):
+    for path in ("/api/v1/methods", "/api/v1/methods/v60", "/api/v1/methods/v60/v60_default"):
+        first = client.get(path)
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "public, max-age=300"
+        etag = first.headers["etag"]
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("profiles were queried")
+
+        with monkeypatch.context() as patch:
+            for name in ("list_profiles", "list_profiles_for_method", "get_profile"):
+                patch.setattr(MethodProfileService, name, fail)
+            cached = client.get(path, headers={"If-None-Match": f"W/{etag}"})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+    etags = {
+        client.get(path).headers["etag"] for path in ("/api/v1/methods/v60", "/api/v1/methods")
+    }
+    assert len(etags) == 2
+    assert client.get("/api/v1/methods/unknown", headers={"If-None-Match": "*"}).status_code == 404
+
+
+def test_brews_and_analytics_etags_change_after_writes(client):
+    headers = auth_headers(client)
+    create_brew(client, headers, "2024-01-01T08:00:00+00:00")
+
+    paths = (
+        "/api/v1/brews",
+        "/api/v1/brews?sort_by=score",
+        "/api/v1/analytics/best",
+        "/api/v1/analytics/trend",
+        "/api/v1/analytics/dashboard",
+    )
+    etags = {}
+    for path in paths:
+        response = client.get(path, headers=headers)
+        assert response.headers["cache-control"] == "private, no-cache"
+        etags[path] = response.headers["etag"]
+        cached = client.get(path, headers={**headers, "If-None-Match": etags[path]})
+        assert cached.status_code == 304
+    assert len(set(etags.values())) == len(paths)
+
+    create_brew(client, headers, "2024-01-02T08:00:00+00:00")
+    for path in paths:
+        response = client.get(path, headers={**headers, "If-None-Match": etags[path]})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etags[path]
+    assert len(client.get("/api/v1/brews", headers=headers).json()) == 2
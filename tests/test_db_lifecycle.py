@@ -41,3 +41,19 @@ def test_create_and_read_brew_in_single_client_session(client: TestClient) -> No
     list_response = client.get("/api/v1/brews", headers={"Authorization": f"Bearer {token}"})
     assert list_response.status_code == 200
     assert len(list_response.json()) == 1
+
+
+def test_app_lifespan_creates_shared_optuna_storage(test_settings: Settings) -> None:
+    app = create_app(test_settings)
+    with TestClient(app) as client:
+        storage = app.state.optuna_storage
+        assert storage.url == test_settings.database_url
+        token = _auth_token(client)
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/optimisation/suggest",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"method_id": "aeropress"},
+            )
+            assert response.status_code == 200
+        assert app.state.optuna_storage is storage
@@ -11,3 +11,10 @@ def test_health_checks_database(test_settings: Settings) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok", "db": "ok"}
+
+
+def test_metrics_reports_study_cache(client: TestClient) -> None:
+    response = client.get("/health/metrics")
+
+    assert response.status_code == 200
+    assert {"hits", "misses", "evictions", "entries"} <= set(response.json()["study_cache"])
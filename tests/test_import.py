@@ -1,8 +1,25 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+from datetime import datetime, timezone
+from importlib.util import find_spec
 from pathlib import Path
+from types import SimpleNamespace
 from uuid import uuid4
 
+import pytest
+
+from coffee_backend.core.config import get_settings
+from coffee_backend.db.models.user import User
 from coffee_backend.schemas.import_export import CSVImportRequest
-from coffee_backend.services.import_export_service import ImportExportService
+from coffee_backend.services.columnar_export import COLUMNAR_MEDIA_TYPES
+from coffee_backend.services.import_export_service import (
+    CSVRowParser,
+    ImportExportService,
+    parse_csv_chunk,
+)
 
 
 def auth_token(client):
@@ -60,39 +77,298 @@ def test_import_csv_batches_commits(client, tmp_path, monkeypatch):
         "date,score,grind_size,water_temp,brew_time_sec\n"
         "2024-01-01T10:00:00+00:00,8,10,90,120\n"
         "2024-01-02T10:00:00+00:00,7,10,90,120\n"
+        "2024-01-03T10:00:00+00:00,9,10,90,120\n"
         "2024-01-03T10:00:00+00:00,9,10,90,120\n",
         encoding="utf-8",
     )
 
     class FakeSession:
         def __init__(self):
-            self.add_count = 0
+            self.probe_count = 0
+            self.insert_batches: list[int] = []
+            self.batch_writes: list[str] = []
             self.commit_count = 0
-            self.flush_count = 0
 
-        def scalar(self, _query):
-            return None
+        def scalars(self, _query):
+            self.probe_count += 1
+            return []
 
-        def add(self, _obj):
-            self.add_count += 1
+        def get_bind(self):
+            return SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
 
-        def flush(self):
-            self.flush_count += 1
+        def execute(self, statement, rows=None):
+            if rows is None:
+                self.batch_writes.append(statement.table.name)
+            else:
+                self.insert_batches.append(len(rows))
 
         def commit(self):
             self.commit_count += 1
+            self.batch_writes.append("commit")
 
     fake_db = FakeSession()
     monkeypatch.setattr(ImportExportService, "BATCH_SIZE", 2)
 
     result = ImportExportService(fake_db).import_csv(
-        uuid4(), CSVImportRequest(method="aeropress", data_path=str(csv_path))
+        uuid4(),
+        CSVImportRequest(
+            method="aeropress", variant_id="aeropress_standard", data_path=str(csv_path)
+        ),
     )
 
-    assert result.processed == 3
+    assert result.processed == 4
     assert result.inserted == 3
     assert result.imported == 3
-    assert result.skipped == 0
-    assert fake_db.add_count == 3
-    assert fake_db.flush_count == 2
-    assert fake_db.commit_count == 2
+    assert result.skipped == 1
+    assert fake_db.probe_count == 2
+    assert fake_db.insert_batches == [2, 1]
+    assert fake_db.batch_writes == ["brew_daily_rollups", "commit", "users", "commit"] * 2
+    assert fake_db.commit_count == 4
+
+
+def test_import_csv_skips_rows_already_imported(client, tmp_path):
+    token = auth_token(client)
+    csv_path = tmp_path / "repeat_aeropress.csv"
+    csv_path.write_text(
+        "date,score,grind_size,water_temp,brew_time_sec\n"
+        "2024-01-01T10:00:00+00:00,8,10,90,120\n"
+        "2024-01-02T10:00:00+00:00,7,10,90,120\n",
+        encoding="utf-8",
+    )
+    body = {
+        "method": "aeropress",
+        "variant_id": "aeropress_standard",
+        "data_path": str(csv_path),
+    }
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.post("/api/v1/import/csv", headers=headers, json=body).json()
+    second = client.post("/api/v1/import/csv", headers=headers, json=body).json()
+
+    assert (first["imported"], first["skipped"]) == (2, 0)
+    assert (second["imported"], second["skipped"]) == (0, 2)
+    brews = client.get("/api/v1/brews", headers=headers).json()
+    assert {brew["variant_id"] for brew in brews} == {"aeropress_standard"}
+
+
+def test_import_csv_directory_reports_each_file(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "import_root", str(tmp_path))
+    token = auth_token(client)
+    header = "date,score,grind_size,water_temp,brew_time_sec\n"
+    (tmp_path / "aeropress.a.csv").write_text(
+        header + "2024-01-01T10:00:00+00:00,8,10,90,120\n2024-01-02T10:00:00+00:00,7,10,90,120\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "aeropress.b.csv").write_text(
+        header + "2024-01-02T10:00:00+00:00,7,10,90,120\n2024-01-03T10:00:00+00:00,9,10,500,120\n",
+        encoding="utf-8",
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.post(
+        "/api/v1/import/csv",
+        headers=headers,
+        json={"variant_id": "aeropress_standard", "data_path": str(tmp_path), "workers": 2},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["processed"], body["imported"], body["skipped"]) == (4, 2, 2)
+    assert body["error_count"] == 1
+    assert body["errors"] == []
+    files = {Path(item["data_path"]).name: item for item in body["files"]}
+    assert (files["aeropress.a.csv"]["inserted"], files["aeropress.a.csv"]["skipped"]) == (2, 0)
+    assert (files["aeropress.b.csv"]["inserted"], files["aeropress.b.csv"]["skipped"]) == (0, 2)
+    assert files["aeropress.b.csv"]["errors"][0]["row"] == 3
+
+    glob_response = client.post(
+        "/api/v1/import/csv",
+        headers=headers,
+        json={"variant_id": "aeropress_standard", "data_path": str(tmp_path / "*.a.csv")},
+    )
+    assert [item["inserted"] for item in glob_response.json()["files"]] == [0]
+
+
+def test_import_csv_api_restricts_paths_to_import_root(client, tmp_path, monkeypatch):
+    token = auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    root = tmp_path / "imports"
+    root.mkdir()
+    (root / "aeropress.a.csv").write_text(
+        "date,score,grind_size,water_temp,brew_time_sec\n2024-01-01T10:00:00+00:00,8,10,90,120\n",
+        encoding="utf-8",
+    )
+    outside = tmp_path / "aeropress.outside.csv"
+    outside.write_text((root / "aeropress.a.csv").read_text(), encoding="utf-8")
+
+    def post(data_path):
+        return client.post(
+            "/api/v1/import/csv",
+            headers=headers,
+            json={"variant_id": "aeropress_standard", "data_path": str(data_path)},
+        )
+
+    monkeypatch.setattr(get_settings(), "import_root", None)
+    for data_path in (root, root / "*.csv"):
+        response = post(data_path)
+        assert response.status_code == 422
+        assert response.json()["code"] == "data_path_not_allowed"
+
+    monkeypatch.setattr(get_settings(), "import_root", str(root))
+    for data_path in (outside, root / ".." / "*.csv", tmp_path / "missing.csv"):
+        response = post(data_path)
+        assert response.status_code == 422
+        assert response.json()["code"] == "data_path_not_allowed"
+    assert post(root).json()["imported"] == 1
+
+
+def test_parse_csv_chunk_resumes_from_offset(tmp_path):
+    csv_path = tmp_path / "aeropress.chunks.csv"
+    rows = [
+        f'2024-01-{day:02d}T10:00:00+00:00,8,10,{90 if day != 4 else 500},120,"day {day}\nnotes"'
+        for day in range(1, 8)
+    ]
+    csv_path.write_text(
+        "date,score,grind_size,water_temp,brew_time_sec,comments\n" + "\n".join(rows) + "\n",
+        encoding="utf-8",
+    )
+    job = (str(csv_path), uuid4(), "aeropress", "aeropress_standard")
+
+    chunks = [parse_csv_chunk(*job, None, 1, 3)]
+    while chunks[-1].next_offset is not None:
+        chunks.append(parse_csv_chunk(*job, chunks[-1].next_offset, chunks[-1].last_row, 3))
+
+    assert [chunk.processed for chunk in chunks] == [3, 3, 1]
+    assert [error.row for chunk in chunks for error in chunk.errors] == [5]
+    parsed = [row["comments"] for chunk in chunks for row in chunk.rows]
+    assert parsed == [f"day {day}\nnotes" for day in range(1, 8) if day != 4]
+
+
+def test_import_csv_pooled_files_stream_in_batches(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(ImportExportService, "BATCH_SIZE", 2)
+    header = "date,score,grind_size,water_temp,brew_time_sec\n"
+    for name, days in (("a", range(1, 6)), ("b", range(4, 9))):
+        (tmp_path / f"aeropress.{name}.csv").write_text(
+            header + "".join(f"2024-02-{day:02d}T10:00:00+00:00,8,10,90,120\n" for day in days),
+            encoding="utf-8",
+        )
+    with client.app.state.db_sessionmaker() as db:
+        user = User(email="pooled@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        result = ImportExportService(db).import_csv(
+            user.id,
+            CSVImportRequest(variant_id="aeropress_standard", data_path=str(tmp_path), workers=2),
+        )
+
+    assert (result.processed, result.inserted, result.skipped) == (10, 8, 2)
+    assert [(file.inserted, file.skipped) for file in result.files] == [(5, 0), (3, 2)]
+
+
+def test_export_csv_streams_rows(client, tmp_path):
+    token = auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    csv_path = tmp_path / "export_aeropress.csv"
+    csv_path.write_text(
+        "date,score,grind_size,water_temp,brew_time_sec,comments\n"
+        '2024-01-02T10:00:00+00:00,7,10,90,120,"second, later"\n'
+        "2024-01-01T10:00:00+00:00,8,11,92,100,first\n",
+        encoding="utf-8",
+    )
+    client.post(
+        "/api/v1/import/csv",
+        headers=headers,
+        json={
+            "method": "aeropress",
+            "variant_id": "aeropress_standard",
+            "data_path": str(csv_path),
+        },
+    )
+
+    response = client.get("/api/v1/export/csv", headers=headers)
+    compressed = client.get("/api/v1/export/csv", headers=headers, params={"gzip": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["comments"] for row in rows] == ["first", "second, later"]
+    assert rows[0]["parameters"] == '{"grind_size": 11, "water_temp": 92, "brew_time_sec": 100}'
+    assert rows[0]["status"] == "ok"
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert gzip.decompress(compressed.content).decode("utf-8") == response.text
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "parquet", "arrow"])
+def test_export_columnar_flattens_typed_parameters(client, tmp_path, export_format):
+    token = auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    csv_path = tmp_path / "columnar_aeropress.csv"
+    csv_path.write_text(
+        "date,score,grind_size,water_temp,brew_time_sec,agitation,brand\n"
+        "2024-01-01T10:00:00+00:00,8,11,92,100,high,Kenya AA\n"
+        "2024-01-02T10:00:00+00:00,,10,90.5,120,,\n",
+        encoding="utf-8",
+    )
+    client.post(
+        "/api/v1/import/csv",
+        headers=headers,
+        json={
+            "method": "aeropress",
+            "variant_id": "aeropress_standard",
+            "data_path": str(csv_path),
+        },
+    )
+
+    response = client.get(
+        "/api/v1/export/columnar",
+        headers=headers,
+        params={"format": export_format, "method": "aeropress"},
+    )
+
+    assert response.status_code == 200
+    if find_spec("pyarrow") is None:
+        export_format = "ndjson"
+    if export_format == "ndjson":
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = (
+            pq.read_table(pa.BufferReader(response.content))
+            if export_format == "parquet"
+            else pa.ipc.open_stream(response.content).read_all()
+        )
+        assert table.schema.field("param_water_temp").type == pa.float64()
+        assert table.schema.field("param_grind_size").type == pa.int64()
+        rows = table.to_pylist()
+    assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPES[export_format]
+    assert [row["param_water_temp"] for row in rows] == [92.0, 90.5]
+    assert isinstance(rows[0]["param_water_temp"], float)
+    assert [row["param_agitation"] for row in rows] == ["high", None]
+    assert [row["score"] for row in rows] == [8.0, None]
+    assert "parameters" not in rows[0]
+
+
+def test_canonical_hash_matches_sorted_json_encoding():
+    user_id = uuid4()
+    parser = CSVRowParser(user_id, "aeropress", "aeropress_standard")
+    brewed_at = datetime(2024, 1, 1, 10, 0, 5, 120000, tzinfo=timezone.utc)
+    cases = [
+        ({"water_temp": 92.5, "grind_size": 11, "agitation": 'héavy "x"'}, 8.25),
+        ({"brew_time_sec": 10**15, "coffee_g": 1e-07}, None),
+        ({}, float("nan")),
+    ]
+
+    for params, score in cases:
+        expected = json.dumps(
+            {
+                "user_id": str(user_id),
+                "brewed_at": brewed_at.isoformat(),
+                "parameters": params,
+                "score": score,
+            },
+            sort_keys=True,
+        ).encode()
+        assert parser.canonical_hash_payload(brewed_at, params, score) == expected
+        assert parser.hash_brew(brewed_at, params, score) == hashlib.sha256(expected).hexdigest()
@@ -0,0 +1,69 @@
+import optuna
+
+from coffee_backend.services.insights_cache import (
+    InsightsCache,
+    completed_trial_count,
+    compute_insights,
+)
+
+
+def _study(trials: int) -> optuna.Study:
+    study = optuna.create_study(direction="maximize")
+    for i in range(trials):
+        trial = study.ask()
+        x = trial.suggest_float("x", 0.0, 10.0)
+        trial.suggest_int("n", 1, 5)
+        study.tell(trial, x + i)
+    return study
+
+
+def _counting(calls: list[int]):
+    def compute(study_key: str, study: optuna.Study, trial_count: int):
+        entry = compute_insights(study_key, study, trial_count)
+        calls.append(entry.trial_count)
+        return entry
+
+    return compute
+
+
+def test_insights_are_reused_until_new_trials_complete() -> None:
+    cache = InsightsCache(max_entries=8, background=False)
+    study = _study(4)
+    calls: list[int] = []
+
+    first = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+    second = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+    assert second is first
+    assert set(first.parameter_importance) == {"x", "n"}
+
+    study.tell(study.ask({"x": optuna.distributions.FloatDistribution(0.0, 10.0)}), 3.0)
+    third = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+
+    assert calls == [4, 5]
+    assert third.trial_count == 5
+    assert cache.stats().hits == 1
+
+
+def test_stale_insights_are_served_while_refreshing_in_background() -> None:
+    cache = InsightsCache(max_entries=8, background=True)
+    study = _study(3)
+    calls: list[int] = []
+    first = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+
+    study.tell(study.ask({"x": optuna.distributions.FloatDistribution(0.0, 10.0)}), 1.0)
+    stale = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+    cache.wait()
+    fresh = cache.get("s1", study, completed_trial_count(study), _counting(calls))
+
+    assert stale is first
+    assert fresh.trial_count == 4
+    assert calls == [3, 4]
+    assert cache.stats().stale_hits == 1
+
+
+def test_insights_below_minimum_trials_are_empty() -> None:
+    study = _study(2)
+    entry = InsightsCache(max_entries=8).get("s1", study, completed_trial_count(study))
+
+    assert entry.parameter_importance == {}
+    assert entry.trial_count == 2
@@ -1,3 +1,15 @@
+import os
+
+import pytest
+from sqlalchemy import event, select
+
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.services.method_profile_registry import (
+    RELOAD_SIGNAL,
+    get_method_profile_registry_store,
+)
+
+
 def test_list_methods_returns_seeded_variants(client) -> None:
     response = client.get("/api/v1/methods")
 
@@ -56,3 +68,75 @@ def test_get_method_profiles_returns_not_found_for_unknown_method(client) -> Non
 
     assert response.status_code == 404
     assert response.json()["code"] == "not_found"
+
+
+def test_profile_reads_do_not_query_method_profiles(client) -> None:
+    client.post("/api/v1/auth/register", json={"email": "reg@example.com", "password": "pass123"})
+    token = client.post(
+        "/api/v1/auth/login", json={"email": "reg@example.com", "password": "pass123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = client.app.state.db_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/api/v1/methods").status_code == 200
+        assert client.get("/api/v1/methods/v60").status_code == 200
+        assert client.get("/api/v1/methods/aeropress/aeropress_standard").status_code == 200
+        created = client.post(
+            "/api/v1/brews",
+            headers=headers,
+            json={
+                "method": "aeropress",
+                "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+                "brewed_at": "2024-01-01T08:00:00+00:00",
+            },
+        )
+        assert created.status_code == 201
+        assert created.json()["variant_id"] == "aeropress_inverted"
+        suggested = client.post(
+            "/api/v1/optimisation/suggest", headers=headers, json={"method_id": "aeropress"}
+        )
+        assert suggested.status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert statements
+    assert not [statement for statement in statements if "method_profiles" in statement]
+
+
+@pytest.mark.skipif(RELOAD_SIGNAL is None, reason="platform has no reload signal")
+def test_registry_reloads_after_signal(client) -> None:
+    with client.app.state.db_sessionmaker() as db:
+        profile = db.scalars(
+            select(MethodProfile).where(MethodProfile.variant_id == "v60_default")
+        ).one()
+        db.add(
+            MethodProfile(
+                method_id="v60",
+                variant_id="v60_default",
+                schema_version=2,
+                parameters=profile.parameters,
+            )
+        )
+        db.commit()
+
+    before = client.get("/api/v1/methods/v60/v60_default")
+    assert before.json()["schema_version"] == 1
+
+    store = get_method_profile_registry_store()
+    restore = store.reload_on_signal()
+    try:
+        os.kill(os.getpid(), RELOAD_SIGNAL)
+    finally:
+        restore()
+
+    after = client.get(
+        "/api/v1/methods/v60/v60_default", headers={"If-None-Match": before.headers["etag"]}
+    )
+    assert after.status_code == 200
+    assert after.json()["schema_version"] == 2
@@ -1,9 +1,33 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
+import optuna
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
 
 from coffee_backend.core.config import Settings
+from coffee_backend.db.models.brew import Brew
+from coffee_backend.db.models.enums import BrewStatus
+from coffee_backend.db.models.method_profile import MethodProfile
+from coffee_backend.db.models.optuna_study import StudyContext, Suggestion, WarmStartEntry
 from coffee_backend.main import create_app
+from coffee_backend.schemas.optimisation import WarmStartRequest
+from coffee_backend.services.method_profile_registry import get_method_profile_registry_store
+from coffee_backend.services.optimisation_service import (
+    CanonicalStudyContext,
+    OptimisationService,
+)
+
+AEROPRESS_STANDARD_PARAMS = {
+    "dose_g": 15.0,
+    "water_g": 230,
+    "grind_step": 18,
+    "temp_c": 85,
+    "steep_s": 60,
+    "plunge_s": 25,
+    "stir_count": 5,
+}
 
 
 def auth_token(client: TestClient, email: str = "opt@example.com") -> str:
@@ -40,6 +64,28 @@ def create_brew(
     return response.json()["id"]
 
 
+def insert_scored_brew(
+    db, user_id: UUID, *, brewed_at: datetime | None = None, score: float = 7.5
+) -> None:
+    db.add(
+        Brew(
+            user_id=user_id,
+            method="aeropress",
+            variant_id="aeropress_standard",
+            parameters=AEROPRESS_STANDARD_PARAMS,
+            brewed_at=brewed_at or datetime.now(timezone.utc),
+            score=score,
+            status=BrewStatus.OK,
+        )
+    )
+    db.commit()
+
+
+def current_user_id(client: TestClient, token: str) -> UUID:
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    return UUID(me.json()["id"])
+
+
 def test_suggest_uses_correct_schema_for_v60_vs_aeropress(client: TestClient):
     token = auth_token(client)
 
@@ -204,9 +250,10 @@ def test_optimisation_study_persists_across_app_sessions(test_settings: Settings
 
 def test_warm_start_is_idempotent(client: TestClient):
     token = auth_token(client, email="warmstart@example.com")
-
-    create_brew(client, token, score=7.1)
-    create_brew(client, token, score=8.4)
+    user_id = current_user_id(client, token)
+    with client.app.state.db_sessionmaker() as db:
+        insert_scored_brew(db, user_id, score=7.1)
+        insert_scored_brew(db, user_id, score=8.4)
 
     payload = {"method_id": "aeropress", "variant_id": "aeropress_standard", "limit": 10}
     first = client.post(
@@ -220,11 +267,11 @@ def test_warm_start_is_idempotent(client: TestClient):
     second = client.post(
         "/api/v1/optimisation/warm_start",
         headers={"Authorization": f"Bearer {token}"},
-        json=payload,
+        json={**payload, "full": True},
     )
     assert second.status_code == 200
+    assert second.json()["scanned"] == 0
     assert second.json()["added"] == 0
-    assert second.json()["skipped"] == 2
 
     suggest_response = client.post(
         "/api/v1/optimisation/suggest",
@@ -241,3 +288,395 @@ def test_warm_start_is_idempotent(client: TestClient):
     )
     assert insights.status_code == 200
     assert insights.json()["trial_count"] == 2
+
+
+def test_existing_study_context_skips_optuna_create_study(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    token = auth_token(client, email="fastpath@example.com")
+    payload = {"method_id": "aeropress", "variant_id": "aeropress_standard"}
+    first = client.post(
+        "/api/v1/optimisation/studies",
+        headers={"Authorization": f"Bearer {token}"},
+        json=payload,
+    )
+    assert first.status_code == 200
+
+    calls: list[str] = []
+    monkeypatch.setattr(optuna, "create_study", lambda **kwargs: calls.append(kwargs["study_name"]))
+    second = client.post(
+        "/api/v1/optimisation/studies",
+        headers={"Authorization": f"Bearer {token}"},
+        json=payload,
+    )
+    assert second.status_code == 200
+    assert second.json()["study_key"] == first.json()["study_key"]
+    assert calls == []
+
+
+def test_study_context_upsert_tolerates_concurrent_insert(client: TestClient):
+    token = auth_token(client, email="upsert@example.com")
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"}).json()
+    context = CanonicalStudyContext(
+        user_id=UUID(me["id"]),
+        method_id="aeropress",
+        variant_id="aeropress_standard",
+        bean_id=None,
+        equipment_id=None,
+    )
+
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        study_key = service.build_study_key(context)
+        service._upsert_study_context(context, study_key)
+        service._upsert_study_context(context, study_key)
+        count = db.scalar(
+            select(func.count())
+            .select_from(StudyContext)
+            .where(StudyContext.study_key == study_key)
+        )
+
+    assert count == 1
+
+
+def test_suggest_batch_issues_distinct_trials_in_one_request(client: TestClient):
+    token = auth_token(client, email="batch@example.com")
+    response = client.post(
+        "/api/v1/optimisation/suggest/batch",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard", "count": 4},
+    )
+    assert response.status_code == 200
+    suggestions = response.json()
+    assert len(suggestions) == 4
+    assert len({s["study_key"] for s in suggestions}) == 1
+    assert sorted(s["trial_number"] for s in suggestions) == [0, 1, 2, 3]
+    assert all(s["status"] == "issued" for s in suggestions)
+
+    follow_up = client.post(
+        "/api/v1/optimisation/suggest",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    )
+    assert follow_up.json()["trial_number"] == 4
+
+
+def test_suggest_batch_rejects_count_out_of_range(client: TestClient):
+    token = auth_token(client, email="batchlimit@example.com")
+    response = client.post(
+        "/api/v1/optimisation/suggest/batch",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"method_id": "aeropress", "count": 0},
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_apply_reports_results_per_item(client: TestClient):
+    token = auth_token(client, email="bulkapply@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    suggestions = client.post(
+        "/api/v1/optimisation/suggest/batch",
+        headers=headers,
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard", "count": 2},
+    ).json()
+    brew_ids = [create_brew(client, token), create_brew(client, token)]
+    mismatched_brew_id = create_brew(client, token, variant_id="aeropress_inverted")
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    response = client.post(
+        "/api/v1/optimisation/suggestions/apply",
+        headers=headers,
+        json={
+            "items": [
+                {"suggestion_id": suggestions[0]["id"], "brew_id": brew_ids[0], "score": 7.5},
+                {"suggestion_id": missing_id, "brew_id": brew_ids[1], "score": 6.0},
+                {"suggestion_id": suggestions[1]["id"], "brew_id": mismatched_brew_id},
+                {"suggestion_id": suggestions[1]["id"], "brew_id": brew_ids[1], "failed": True},
+                {"suggestion_id": suggestions[0]["id"], "brew_id": brew_ids[0], "score": 9.0},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["applied"] == 2
+    assert body["failed"] == 3
+    assert [(r["status"], r["code"]) for r in body["results"]] == [
+        ("applied", None),
+        ("error", "suggestion_not_found"),
+        ("error", "suggestion_context_mismatch"),
+        ("applied", None),
+        ("error", "suggestion_duplicated_in_request"),
+    ]
+    assert body["results"][0]["suggestion"]["status"] == "applied"
+
+    insights = client.get(
+        "/api/v1/optimisation/insights",
+        headers=headers,
+        params={"study_key": suggestions[0]["study_key"]},
+    )
+    assert insights.json()["trial_count"] == 2
+
+
+def test_warm_start_only_ingests_brews_after_watermark(client: TestClient):
+    user_id = current_user_id(client, auth_token(client, email="watermark@example.com"))
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard")
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        insert_scored_brew(db, user_id, brewed_at=started, score=7.0)
+        insert_scored_brew(db, user_id, brewed_at=started + timedelta(minutes=1), score=7.1)
+
+        first = service.warm_start(user_id, req)
+        assert (first.scanned, first.added) == (2, 2)
+
+        second = service.warm_start(user_id, req)
+        assert (second.scanned, second.added) == (0, 0)
+
+        insert_scored_brew(db, user_id, brewed_at=started + timedelta(minutes=2), score=7.2)
+        third = service.warm_start(user_id, req)
+        assert (third.scanned, third.added) == (1, 1)
+
+        db.add(
+            Brew(
+                user_id=user_id,
+                method="aeropress",
+                variant_id="aeropress_standard",
+                parameters=AEROPRESS_STANDARD_PARAMS,
+                brewed_at=started,
+                created_at=started,
+                score=6.5,
+                status=BrewStatus.OK,
+            )
+        )
+        db.commit()
+        assert service.warm_start(user_id, req).scanned == 0
+
+        rebuild = service.warm_start(user_id, req.model_copy(update={"full": True}))
+        assert (rebuild.scanned, rebuild.added, rebuild.skipped) == (1, 1, 0)
+
+        entries = db.scalar(select(func.count()).select_from(WarmStartEntry))
+        assert entries == 4
+        study = optuna.load_study(
+            study_name=first.study_key, storage=client.app.state.optuna_storage
+        )
+        assert len(study.trials) == 4
+
+
+def test_warm_start_picks_up_backdated_and_imported_brews(client: TestClient):
+    user_id = current_user_id(client, auth_token(client, email="backdated@example.com"))
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard")
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        insert_scored_brew(db, user_id)
+        assert service.warm_start(user_id, req).added == 1
+
+        insert_scored_brew(db, user_id, brewed_at=datetime(2020, 1, 1, tzinfo=timezone.utc))
+        db.execute(
+            insert(Brew),
+            [
+                {
+                    "user_id": user_id,
+                    "method": "aeropress",
+                    "variant_id": "aeropress_standard",
+                    "parameters": AEROPRESS_STANDARD_PARAMS,
+                    "brewed_at": datetime(2019, 6, day, tzinfo=timezone.utc),
+                    "score": 6.0 + day / 10,
+                    "status": BrewStatus.OK,
+                }
+                for day in range(1, 4)
+            ],
+        )
+        db.commit()
+
+        later = service.warm_start(user_id, req)
+        assert (later.scanned, later.added, later.skipped) == (4, 4, 0)
+        assert service.warm_start(user_id, req).scanned == 0
+
+
+def test_warm_start_walks_history_longer_than_limit(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    user_id = current_user_id(client, auth_token(client, email="history@example.com"))
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard", limit=2)
+    with client.app.state.db_sessionmaker() as db:
+        for minutes in range(5):
+            insert_scored_brew(db, user_id, brewed_at=started - timedelta(minutes=minutes))
+        service = OptimisationService(db, client.app.state.optuna_storage)
+
+        results = [service.warm_start(user_id, req) for _ in range(3)]
+        assert [(result.scanned, result.added) for result in results] == [(2, 2), (2, 2), (1, 1)]
+        assert service.warm_start(user_id, req).scanned == 0
+
+        monkeypatch.setattr(service.settings, "warm_start_batch_size", 2)
+        rebuild = service.warm_start(user_id, req.model_copy(update={"full": True, "limit": None}))
+        assert (rebuild.scanned, rebuild.added, rebuild.skipped) == (0, 0, 0)
+
+    study = optuna.load_study(study_name=rebuild.study_key, storage=client.app.state.optuna_storage)
+    assert len(study.trials) == 5
+
+
+def test_warm_start_reports_progress_per_page(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    user_id = current_user_id(client, auth_token(client, email="progress@example.com"))
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard")
+    calls: list[tuple[int, int, int]] = []
+    with client.app.state.db_sessionmaker() as db:
+        for _ in range(5):
+            insert_scored_brew(db, user_id)
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        monkeypatch.setattr(service.settings, "warm_start_batch_size", 2)
+
+        result = service.warm_start(user_id, req, lambda *counts: calls.append(counts))
+
+    assert calls == [(2, 2, 0), (4, 4, 0), (5, 5, 0)]
+    assert (result.scanned, result.added) == (5, 5)
+
+
+def test_warm_start_retry_after_failed_bookkeeping_adds_no_duplicates(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    user_id = current_user_id(client, auth_token(client, email="retry@example.com"))
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard")
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        insert_scored_brew(db, user_id)
+        assert service.warm_start(user_id, req).added == 1
+        insert_scored_brew(db, user_id)
+        insert_scored_brew(db, user_id)
+        study_key = service.ensure_study_context(user_id, req).study_key
+
+        def fail(*_args: object) -> None:
+            raise RuntimeError("bookkeeping failed")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(service, "_record_warm_start_entries", fail)
+            with pytest.raises(RuntimeError):
+                service.warm_start(user_id, req)
+        db.rollback()
+        study = optuna.load_study(study_name=study_key, storage=client.app.state.optuna_storage)
+        assert len(study.trials) == 1
+
+        retry = service.warm_start(user_id, req)
+        assert (retry.scanned, retry.added, retry.skipped) == (2, 2, 0)
+        assert len(study.trials) == 3
+        assert service.warm_start(user_id, req).scanned == 0
+
+
+def test_warm_start_releases_entries_when_storage_write_fails(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+):
+    user_id = current_user_id(client, auth_token(client, email="storage-fail@example.com"))
+    req = WarmStartRequest(method_id="aeropress", variant_id="aeropress_standard")
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        insert_scored_brew(db, user_id)
+        insert_scored_brew(db, user_id)
+
+        def fail(*_args: object) -> None:
+            raise RuntimeError("storage unavailable")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("coffee_backend.services.optimisation_service.bulk_add_trials", fail)
+            with pytest.raises(RuntimeError):
+                service.warm_start(user_id, req)
+        assert db.scalar(select(func.count()).select_from(WarmStartEntry)) == 0
+        assert service.ensure_study_context(user_id, req).warm_start_created_at is None
+
+        retry = service.warm_start(user_id, req)
+        assert (retry.scanned, retry.added, retry.skipped) == (2, 2, 0)
+        assert db.scalar(select(func.count()).select_from(WarmStartEntry)) == 2
+
+
+def test_study_context_records_profile_sampler(client: TestClient):
+    token = auth_token(client, email="sampler@example.com")
+    with client.app.state.db_sessionmaker() as db:
+        profile = db.scalars(
+            select(MethodProfile).where(MethodProfile.variant_id == "aeropress_standard")
+        ).one()
+        profile.sampler = {"name": "random", "seed": 3}
+        db.commit()
+    get_method_profile_registry_store().invalidate()
+
+    created = client.post(
+        "/api/v1/optimisation/studies",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    )
+    assert created.status_code == 200
+    assert created.json()["sampler"] == "random"
+
+    suggested = client.post(
+        "/api/v1/optimisation/suggest",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    )
+    assert suggested.status_code == 200
+    with client.app.state.db_sessionmaker() as db:
+        service = OptimisationService(db, client.app.state.optuna_storage)
+        study = service._load_study(created.json()["study_key"])
+    assert isinstance(study.sampler, optuna.samplers.RandomSampler)
+
+
+def test_apply_looks_up_trial_by_stored_trial_id(client: TestClient):
+    token = auth_token(client, email="trialid@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    body = {"method_id": "aeropress", "variant_id": "aeropress_standard"}
+    first, second = (
+        client.post("/api/v1/optimisation/suggest", headers=headers, json=body).json()
+        for _ in range(2)
+    )
+
+    storage = client.app.state.optuna_storage
+    with client.app.state.db_sessionmaker() as db:
+        issued = db.get(Suggestion, UUID(first["id"]))
+        study_id = storage.get_study_id_from_name(first["study_key"])
+        assert issued.trial_id == storage.get_trial_id_from_study_id_trial_number(
+            study_id, first["trial_number"]
+        )
+        db.get(Suggestion, UUID(second["id"])).trial_id = issued.trial_id
+        issued.trial_id = None
+        db.commit()
+
+    legacy = client.post(
+        f"/api/v1/optimisation/suggestions/{first['id']}/apply",
+        headers=headers,
+        json={"brew_id": create_brew(client, token), "score": 8.0, "failed": False},
+    )
+    assert legacy.status_code == 200
+
+    missing = client.post(
+        f"/api/v1/optimisation/suggestions/{second['id']}/apply",
+        headers=headers,
+        json={"brew_id": create_brew(client, token), "score": 8.0, "failed": False},
+    )
+    assert missing.status_code == 404
+    assert missing.json()["code"] == "suggestion_trial_not_found"
+
+
+def test_apply_to_finished_trial_returns_conflict(client: TestClient):
+    token = auth_token(client, email="finished@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    suggestion = client.post(
+        "/api/v1/optimisation/suggest",
+        headers=headers,
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    ).json()
+    body = {"brew_id": create_brew(client, token), "score": 8.0, "failed": False}
+    url = f"/api/v1/optimisation/suggestions/{suggestion['id']}/apply"
+    assert client.post(url, headers=headers, json=body).status_code == 200
+
+    with client.app.state.db_sessionmaker() as db:
+        db.get(Suggestion, UUID(suggestion["id"])).status = "issued"
+        db.commit()
+
+    single = client.post(url, headers=headers, json=body)
+    assert single.status_code == 409
+    assert single.json()["code"] == "suggestion_trial_finished"
+
+    bulk = client.post(
+        "/api/v1/optimisation/suggestions/apply",
+        headers=headers,
+        json={"items": [{"suggestion_id": suggestion["id"], **body}]},
+    )
+    assert bulk.json()["results"][0]["code"] == "suggestion_trial_finished"
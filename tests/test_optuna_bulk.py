@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import optuna
+import pytest
+from optuna.distributions import FloatDistribution, IntDistribution
+from optuna.storages._rdb import models
+from optuna.trial import TrialState, create_trial
+
+from coffee_backend.services.optuna_bulk import SUPPORTED_SCHEMA_VERSION, bulk_add_trials
+
+DISTRIBUTIONS = {"x": FloatDistribution(0.0, 10.0), "n": IntDistribution(1, 5)}
+
+
+def _trials(count: int) -> list[optuna.trial.FrozenTrial]:
+    return [
+        create_trial(
+            params={"x": float(i), "n": 1 + i % 5},
+            distributions=DISTRIBUTIONS,
+            value=float(i) / 2,
+            user_attrs={"warm_start_key": f"k{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def test_bulk_add_trials_matches_add_trial(tmp_path: Path) -> None:
+    storage = optuna.storages.RDBStorage(url=f"sqlite:///{tmp_path / 'optuna.db'}")
+    expected = optuna.create_study(study_name="single", storage=storage, direction="maximize")
+    expected.add_trials(_trials(3))
+    study = optuna.create_study(study_name="bulk", storage=storage, direction="maximize")
+    study.ask()
+
+    bulk_add_trials(study, storage, _trials(3))
+
+    loaded = optuna.load_study(study_name="bulk", storage=storage).get_trials(deepcopy=False)
+    assert [trial.number for trial in loaded] == [0, 1, 2, 3]
+    for got, want in zip(loaded[1:], expected.get_trials(deepcopy=False), strict=True):
+        assert got.state == TrialState.COMPLETE
+        assert got.params == want.params
+        assert got.distributions == want.distributions
+        assert got.value == want.value
+        assert got.user_attrs == want.user_attrs
+    assert study.best_value == 1.0
+
+
+def test_bulk_add_trials_rejects_incompatible_distribution(tmp_path: Path) -> None:
+    storage = optuna.storages.RDBStorage(url=f"sqlite:///{tmp_path / 'optuna.db'}")
+    study = optuna.create_study(study_name="bulk", storage=storage, direction="maximize")
+    bulk_add_trials(study, storage, _trials(1))
+    clash = create_trial(
+        params={"x": "a"},
+        distributions={"x": optuna.distributions.CategoricalDistribution(["a", "b"])},
+        value=1.0,
+    )
+
+    with pytest.raises(ValueError):
+        bulk_add_trials(study, storage, [clash])
+    assert len(study.get_trials(deepcopy=False)) == 1
+
+
+def test_bulk_insert_targets_current_optuna_schema(tmp_path: Path) -> None:
+    storage = optuna.storages.RDBStorage(url=f"sqlite:///{tmp_path / 'optuna.db'}")
+
+    assert storage.get_current_version() == SUPPORTED_SCHEMA_VERSION
+    assert storage.get_head_version() == SUPPORTED_SCHEMA_VERSION
+    written = {
+        models.TrialModel: {"study_id", "number", "state", "datetime_start", "datetime_complete"},
+        models.TrialValueModel: {"trial_id", "objective", "value", "value_type"},
+        models.TrialParamModel: {"trial_id", "param_name", "param_value", "distribution_json"},
+        models.TrialUserAttributeModel: {"trial_id", "key", "value_json"},
+        models.TrialSystemAttributeModel: {"trial_id", "key", "value_json"},
+        models.TrialIntermediateValueModel: {
+            "trial_id",
+            "step",
+            "intermediate_value",
+            "intermediate_value_type",
+        },
+    }
+    for model, columns in written.items():
+        assert columns <= set(model.__table__.columns.keys())
+
+
+@pytest.mark.parametrize("schema_version", [SUPPORTED_SCHEMA_VERSION, "unknown"])
+def test_bulk_add_trials_falls_back_for_unknown_schema(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_version: str
+) -> None:
+    storage = optuna.storages.RDBStorage(url=f"sqlite:///{tmp_path / 'optuna.db'}")
+    monkeypatch.setattr(storage, "get_current_version", lambda: schema_version)
+    study = optuna.create_study(study_name="bulk", storage=storage, direction="maximize")
+
+    added = bulk_add_trials(study, storage, _trials(3))
+
+    assert len(added) == 3
+    keys = [trial.user_attrs["warm_start_key"] for trial in study.get_trials(deepcopy=False)]
+    assert keys == ["k0", "k1", "k2"]
@@ -0,0 +1,143 @@
+from uuid import uuid4
+
+import pytest
+
+from coffee_backend.db.models.bean import Bean
+from coffee_backend.db.models.recipe import Recipe
+from coffee_backend.services import pagination
+from coffee_backend.services.pagination import CountCache
+
+
+def auth_headers(client):
+    client.post("/api/v1/auth/register", json={"email": "page@example.com", "password": "pass123"})
+    res = client.post(
+        "/api/v1/auth/login", json={"email": "page@example.com", "password": "pass123"}
+    )
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def _walk(client, headers, path, **params):
+    items, cursor, pages = [], None, 0
+    while True:
+        query = params | ({"cursor": cursor} if cursor else {})
+        response = client.get(path, headers=headers, params=query)
+        assert response.status_code == 200
+        body = response.json()
+        items.extend(body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items, pages
+
+
+@pytest.mark.parametrize(
+    ("sort_by", "sort_order"),
+    [("date", "desc"), ("date", "asc"), ("score", "desc"), ("score", "asc")],
+)
+def test_brew_cursor_pages_cover_every_brew_once(client, sort_by, sort_order):
+    headers = auth_headers(client)
+    scores = [8.0, None, 6.5, 8.0, None, 9.0, 6.5]
+    for day, score in enumerate(scores, start=1):
+        response = client.post(
+            "/api/v1/brews",
+            headers=headers,
+            json={
+                "method": "aeropress",
+                "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+                "brewed_at": f"2024-01-0{day % 3 + 1}T10:00:00+00:00",
+                "score": score,
+            },
+        )
+        assert response.status_code == 201
+
+    items, pages = _walk(
+        client, headers, "/api/v1/brews", limit=2, sort_by=sort_by, sort_order=sort_order
+    )
+
+    assert pages == 4
+    assert len({item["id"] for item in items}) == len(scores)
+    if sort_by == "score":
+        ranked = [item["score"] for item in items]
+        present = [score for score in ranked if score is not None]
+        assert ranked[len(present) :] == [None, None]
+        assert present == sorted(present, reverse=sort_order == "desc")
+    else:
+        dates = [item["brewed_at"] for item in items]
+        assert dates == sorted(dates, reverse=sort_order == "desc")
+
+    first = client.get(
+        "/api/v1/brews", headers=headers, params={"limit": 3, "include_total": True}
+    ).json()
+    assert first["total"] == len(scores)
+    assert first["limit"] == 3
+
+
+def test_bean_cursor_pagination_and_cached_total(client):
+    headers = auth_headers(client)
+    for index in range(5):
+        client.post("/api/v1/beans", headers=headers, json={"name": f"Bean {index}"})
+
+    items, pages = _walk(client, headers, "/api/v1/beans", limit=2, include_total=True)
+    assert sorted(item["name"] for item in items) == [f"Bean {index}" for index in range(5)]
+    assert pages == 3
+
+    client.post("/api/v1/beans", headers=headers, json={"name": "Bean 5"})
+    body = client.get("/api/v1/beans", headers=headers, params={"limit": 10, "include_total": True})
+    assert body.json()["total"] == 6
+
+
+def test_invalid_cursor_is_rejected(client):
+    headers = auth_headers(client)
+    date_cursor = None
+    for day in (1, 2):
+        client.post(
+            "/api/v1/brews",
+            headers=headers,
+            json={
+                "method": "aeropress",
+                "parameters": {"grind_size": 10, "water_temp": 90.0, "brew_time_sec": 120},
+                "brewed_at": f"2024-01-0{day}T10:00:00+00:00",
+            },
+        )
+    date_cursor = client.get("/api/v1/brews", headers=headers, params={"limit": 1}).json()[
+        "next_cursor"
+    ]
+
+    for params in (
+        {"cursor": "not-a-cursor"},
+        {"cursor": date_cursor, "sort_by": "score"},
+        {"limit": 1, "page": 1},
+    ):
+        response = client.get("/api/v1/brews", headers=headers, params=params)
+        assert response.status_code == 422
+        assert response.json()["code"] in {"invalid_cursor", "invalid_pagination"}
+
+
+def test_count_cache_bounds_entries_across_scopes_and_drops_expired(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(pagination.time, "monotonic", lambda: clock[0])
+
+    class FakeSession:
+        queries = 0
+
+        def scalar(self, _query):
+            self.queries += 1
+            return self.queries
+
+    db = FakeSession()
+    cache = CountCache(max_entries=3, ttl_seconds=10)
+    owner = uuid4()
+    for filter_key in range(5):
+        cache.count(db, Bean, owner, [], filter_key)
+    assert cache.stats().entries == 3
+    assert cache.count(db, Bean, owner, [], 4) == 5
+    assert cache.count(db, Bean, owner, [], 0) == 6
+
+    clock[0] = 11.0
+    cache.count(db, Recipe, uuid4(), [])
+    assert cache.stats().entries == 1
+
+    cache.count(db, Bean, owner, [], "a")
+    cache.invalidate(Bean, owner)
+    assert cache.stats().entries == 1
+    assert cache.stats().invalidations == 1
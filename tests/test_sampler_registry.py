@@ -0,0 +1,45 @@
+import optuna
+import pytest
+
+from coffee_backend.core.config import Settings
+from coffee_backend.core.exceptions import APIError, ValidationError
+from coffee_backend.services import sampler_registry
+from coffee_backend.services.sampler_registry import (
+    SamplerConfig,
+    build_sampler,
+    merge_sampler_config,
+    sampler_config_from_settings,
+)
+
+
+def test_profile_overrides_settings_defaults() -> None:
+    settings = Settings(optuna_sampler="tpe", optuna_tpe_prior_weight=0.5, jwt_secret="x")
+    base = sampler_config_from_settings(settings)
+
+    config = merge_sampler_config(base, {"group": True, "seed": 7})
+
+    assert config == SamplerConfig(name="tpe", seed=7, group=True, prior_weight=0.5)
+    sampler = build_sampler(config)
+    assert isinstance(sampler, optuna.samplers.TPESampler)
+
+
+def test_invalid_profile_sampler_options_are_rejected() -> None:
+    with pytest.raises(ValidationError) as exc:
+        merge_sampler_config(SamplerConfig(), {"temperature": 1})
+    assert exc.value.fields == {"temperature": "unknown sampler option"}
+
+    with pytest.raises(ValidationError):
+        merge_sampler_config(SamplerConfig(), {"name": "cmaes"})
+
+    with pytest.raises(ValidationError) as exc:
+        merge_sampler_config(SamplerConfig(), {"seed": "7", "group": 1, "prior_weight": 2})
+    assert set(exc.value.fields) == {"seed", "group"}
+
+
+def test_sampler_with_missing_dependencies_is_unavailable(monkeypatch) -> None:
+    monkeypatch.setitem(sampler_registry.SAMPLER_REQUIREMENTS, "random", ("not_a_module",))
+
+    with pytest.raises(APIError) as exc:
+        build_sampler(SamplerConfig(name="random"))
+    assert exc.value.code == "sampler_unavailable"
+    assert "random" not in sampler_registry.available_samplers()
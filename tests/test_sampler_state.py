@@ -0,0 +1,84 @@
+import random
+
+import optuna
+import pytest
+
+from coffee_backend.services.sampler_state import SamplerStateStore, StatefulTPESampler
+
+
+def _run(sampler: optuna.samplers.BaseSampler, storage: str | None, trials: int = 40):
+    study = optuna.create_study(direction="maximize", sampler=sampler, storage=storage)
+    rng = random.Random(0)
+    suggested = []
+    for number in range(trials):
+        trial = study.ask()
+        suggested.append(
+            {
+                "x": trial.suggest_float("x", 0.0, 10.0),
+                "n": trial.suggest_int("n", 1, 9),
+                "c": trial.suggest_categorical("c", ["a", "b", "c"]),
+            }
+        )
+        if number % 7 != 3:
+            study.tell(trial, round(rng.random() * 3, 1))
+    return study, suggested
+
+
+@pytest.mark.parametrize("multivariate", [False, True])
+def test_cached_state_matches_full_refit(tmp_path, multivariate: bool) -> None:
+    options = {"seed": 3, "multivariate": multivariate, "n_startup_trials": 5}
+    _, expected = _run(optuna.samplers.TPESampler(**options), None)
+
+    for storage in (None, f"sqlite:///{tmp_path / 'optuna.db'}"):
+        sampler = StatefulTPESampler(**options, store=SamplerStateStore(max_entries=4))
+        _, suggested = _run(sampler, storage)
+        assert suggested == expected
+
+
+def test_tell_updates_state_incrementally() -> None:
+    store = SamplerStateStore(max_entries=4)
+    study, _ = _run(StatefulTPESampler(seed=1, n_startup_trials=5, store=store), None, trials=12)
+    state = store.peek(study.study_name, study._study_id)
+    assert state is not None
+    completed = len(study.get_trials(states=(optuna.trial.TrialState.COMPLETE,)))
+    assert len(state) == completed
+
+    trial = study.ask()
+    trial.suggest_float("x", 0.0, 10.0)
+    trial.suggest_int("n", 1, 9)
+    trial.suggest_categorical("c", ["a", "b", "c"])
+    study.tell(trial, 2.5)
+
+    assert len(state) == completed + 1
+    assert state.numbers[-1] == trial.number
+    assert store.stats().misses == 1
+
+
+def test_snapshot_restores_state_after_restart(tmp_path) -> None:
+    storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+    snapshots = tmp_path / "snapshots"
+    store = SamplerStateStore(max_entries=4, snapshot_dir=str(snapshots))
+    study, _ = _run(StatefulTPESampler(seed=1, n_startup_trials=5, store=store), storage, 15)
+    store.save(study.study_name)
+    saved = store.peek(study.study_name, study._study_id)
+
+    restarted = SamplerStateStore(max_entries=4, snapshot_dir=str(snapshots))
+    state = restarted.load(study.study_name, study._study_id)
+    assert restarted.stats().snapshot_loads == 1
+    assert state.numbers == saved.numbers
+    assert state.values == saved.values
+
+    other = SamplerStateStore(max_entries=4, snapshot_dir=str(snapshots))
+    assert len(other.load(study.study_name, study._study_id + 1)) == 0
+    assert other.stats().snapshot_loads == 0
+
+
+def test_disabled_store_falls_back_to_full_refit() -> None:
+    options = {"seed": 5, "n_startup_trials": 5}
+    _, expected = _run(optuna.samplers.TPESampler(**options), None, trials=20)
+    store = SamplerStateStore(max_entries=0)
+
+    _, suggested = _run(StatefulTPESampler(**options, store=store), None, trials=20)
+
+    assert suggested == expected
+    assert store.stats().entries == 0
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import optuna
+
+from coffee_backend.services.study_cache import STUDY_BYTES_OVERHEAD, StudyCache
+
+
+def _storage(tmp_path: Path) -> optuna.storages.RDBStorage:
+    return optuna.storages.RDBStorage(url=f"sqlite:///{tmp_path / 'optuna.db'}")
+
+
+def test_study_cache_hits_after_first_load(tmp_path: Path) -> None:
+    storage = _storage(tmp_path)
+    optuna.create_study(study_name="s1", storage=storage, direction="maximize")
+    cache = StudyCache(max_bytes=1024 * 1024)
+
+    first = cache.get("s1", storage)
+    second = cache.get("s1", storage)
+
+    assert first is second
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_study_cache_sees_trials_written_by_another_loader(tmp_path: Path) -> None:
+    storage = _storage(tmp_path)
+    optuna.create_study(study_name="s1", storage=storage, direction="maximize")
+    cache = StudyCache(max_bytes=1024 * 1024)
+    cached = cache.get("s1", storage)
+
+    other = optuna.load_study(study_name="s1", storage=storage)
+    trial = other.ask()
+    other.tell(trial, 1.0)
+
+    assert cache.get("s1", storage) is cached
+    assert len(cached.get_trials(deepcopy=False)) == 1
+
+
+def test_study_cache_reloads_recreated_study(tmp_path: Path) -> None:
+    storage = _storage(tmp_path)
+    optuna.create_study(study_name="s1", storage=storage, direction="maximize")
+    cache = StudyCache(max_bytes=1024 * 1024)
+    stale = cache.get("s1", storage)
+    stale.tell(stale.ask(), 1.0)
+    cache.get("s1", storage)
+
+    optuna.delete_study(study_name="s1", storage=storage)
+    optuna.create_study(study_name="s1", storage=storage, direction="maximize")
+
+    assert cache.get("s1", storage) is not stale
+    assert cache.stats().invalidations == 1
+
+
+def test_study_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    storage = _storage(tmp_path)
+    for name in ("a", "b", "c"):
+        optuna.create_study(study_name=name, storage=storage, direction="maximize")
+    cache = StudyCache(max_bytes=STUDY_BYTES_OVERHEAD * 2)
+
+    cache.get("a", storage)
+    cache.get("b", storage)
+    cache.get("a", storage)
+    cache.get("c", storage)
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    cache.get("a", storage)
+    assert cache.stats().hits == 2
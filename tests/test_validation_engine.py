@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.services.parameter_validation import validate_method_parameters
+from coffee_backend.services.validation_engine import (
+    compile_profile_validator,
+    get_registry_validator,
+    rows_to_columns,
+)
+
+PROFILE_SPECS = [
+    {"name": "water_g", "type": "int", "min": 150, "max": 280, "step": 5},
+    {"name": "dose_g", "type": "float", "min": 12.0, "max": 20.0, "step": 0.5},
+    {"name": "filter", "type": "categorical", "choices": ["paper", "metal"]},
+]
+
+
+def test_registry_validator_keeps_error_codes() -> None:
+    base = {"grind_size": 5, "water_temp": 92.0, "brew_time_sec": 120}
+    validate_method_parameters("aeropress", base)
+
+    cases = [
+        ({**base, "grind_size": 5.0}, "invalid_parameter_type"),
+        ({**base, "water_temp": 120.0}, "parameter_out_of_range"),
+        ({**base, "agitation": "wild"}, "invalid_parameter_choice"),
+        ({**base, "extra": 1}, "unknown_parameter_keys"),
+        ({"grind_size": 5}, "missing_required_parameters"),
+        ({**base, "water_temp": True}, "invalid_parameter_type"),
+    ]
+    for params, code in cases:
+        with pytest.raises(ValidationError) as exc:
+            validate_method_parameters("aeropress", params)
+        assert exc.value.code == code
+
+    validate_method_parameters("aeropress", {**base, "extra": 1}, allow_unknown=True)
+
+
+def test_columnar_masks_match_scalar_validation() -> None:
+    validator = compile_profile_validator(PROFILE_SPECS)
+    rows = [
+        {"water_g": 200, "dose_g": 15.5, "filter": "paper"},
+        {"water_g": 202, "dose_g": 15.5, "filter": "paper"},
+        {"water_g": 200, "dose_g": 15.3, "filter": "metal"},
+        {"water_g": 200, "dose_g": 15.0, "filter": "cloth"},
+        {"water_g": 200.0, "dose_g": 15.0, "filter": "paper"},
+        {"dose_g": 15.0, "filter": "paper"},
+        {"water_g": 200, "dose_g": 15.0, "filter": "paper", "extra": 1},
+    ]
+
+    result = validator.validate_columns(rows_to_columns(rows, ["water_g", "dose_g"]), len(rows))
+
+    expected = []
+    for params in rows:
+        try:
+            validator.validate(params)
+            expected.append(False)
+        except ValidationError:
+            expected.append(True)
+    assert result.row_errors.tolist() == expected
+    assert result.masks["water_g"].tolist() == [False, True, False, False, True, True, False]
+
+
+def test_columnar_accepts_typed_arrays() -> None:
+    validator = get_registry_validator("pourover")
+    columns = {
+        "grind_size": np.array([10, 40, 12]),
+        "water_temp": np.array([92.0, 93.0, np.nan]),
+        "bloom_time_sec": np.array([30, 30, 30]),
+        "total_time_sec": np.array([200, 200, 200]),
+    }
+
+    result = validator.validate_columns(columns, 3)
+
+    assert result.valid_rows.tolist() == [True, False, False]
+
+
+def test_columnar_step_check_matches_scalar_for_large_values() -> None:
+    validator = compile_profile_validator(
+        [{"name": "water_mg", "type": "float", "min": 0.0, "max": 1e13, "step": 1.0}]
+    )
+    rng = np.random.default_rng(7)
+    base = np.round(10 ** rng.uniform(0, 12, 500))
+    boundary = [1000.0000010005, 1e6 + 1.0000005e-3, 12345.000012346]
+    values = np.concatenate([base, base + 0.3, base + 1e-7]).tolist() + boundary
+    rows = [{"water_mg": value} for value in values]
+
+    result = validator.validate_columns(rows_to_columns(rows, ["water_mg"]), len(rows))
+
+    expected = []
+    for params in rows:
+        try:
+            validator.validate(params)
+            expected.append(False)
+        except ValidationError:
+            expected.append(True)
+    assert result.row_errors.tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_profile_numeric_parameter_requires_bounds() -> None:
+    with pytest.raises(ValidationError) as exc:
+        compile_profile_validator([{"name": "water_g", "type": "int", "max": 280}])
+    assert exc.value.code == "invalid_method_profile"
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_numbers_are_type_errors_in_both_paths(value: float) -> None:
+    validator = compile_profile_validator(PROFILE_SPECS)
+    params = {"water_g": 200, "dose_g": value, "filter": "paper"}
+
+    with pytest.raises(ValidationError) as exc:
+        validator.validate(params)
+    assert exc.value.code == "invalid_suggested_params"
+
+    rows = [{**params, "dose_g": 15.0}, params]
+    result = validator.validate_columns(rows_to_columns(rows, ["water_g", "dose_g"]), 2)
+    assert result.row_errors.tolist() == [False, True]
+
+
+def test_typed_float_column_rejects_infinity() -> None:
+    validator = compile_profile_validator(PROFILE_SPECS)
+    columns = {
+        "water_g": np.array([200, 200]),
+        "dose_g": np.array([15.0, np.inf]),
+        "filter": np.array(["paper", "paper"], dtype=object),
+    }
+
+    assert validator.validate_columns(columns, 2).row_errors.tolist() == [False, True]
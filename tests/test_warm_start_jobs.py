@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from coffee_backend.core.exceptions import ValidationError
+from coffee_backend.schemas.optimisation import WarmStartResponse
+from coffee_backend.services.warm_start_jobs import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    WarmStartJobManager,
+)
+
+
+def auth_token(client: TestClient, email: str) -> str:
+    client.post("/api/v1/auth/register", json={"email": email, "password": "pass123"})
+    res = client.post("/api/v1/auth/login", json={"email": email, "password": "pass123"})
+    return res.json()["access_token"]
+
+
+def _wait(manager: WarmStartJobManager, job_id, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if not job.active:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_jobs_for_same_study_key_are_coalesced() -> None:
+    manager = WarmStartJobManager(max_workers=2)
+    release = threading.Event()
+    calls: list[str] = []
+
+    def runner(progress):
+        calls.append("run")
+        progress(5, 0, 2)
+        release.wait(5)
+        return WarmStartResponse(study_key="s1", scanned=5, added=3, skipped=2)
+
+    user_id = uuid4()
+    first = manager.submit(user_id, "s1", runner)
+    second = manager.submit(user_id, "s1", runner)
+    other = manager.submit(user_id, "s2", runner)
+    full = manager.submit(user_id, "s1", runner, full=True)
+    limited = manager.submit(user_id, "s1", runner, limit=10)
+    assert second.id == first.id
+    assert len({first.id, other.id, full.id, limited.id}) == 4
+
+    release.set()
+    done = _wait(manager, first.id)
+    assert (done.status, done.scanned, done.added, done.skipped) == (JOB_COMPLETED, 5, 3, 2)
+    for job in (other, full, limited):
+        _wait(manager, job.id)
+    assert calls == ["run"] * 4
+
+    third = manager.submit(user_id, "s1", runner)
+    assert third.id != first.id
+    _wait(manager, third.id)
+    manager.shutdown()
+
+
+def test_failed_job_reports_error_code() -> None:
+    manager = WarmStartJobManager(max_workers=1)
+
+    def runner(progress):
+        raise ValidationError("bad params", code="invalid_suggested_params")
+
+    job = _wait(manager, manager.submit(uuid4(), "s1", runner).id)
+    assert job.status == JOB_FAILED
+    assert job.error_code == "invalid_suggested_params"
+    manager.shutdown()
+
+
+def test_job_is_failed_when_executor_rejects_it() -> None:
+    manager = WarmStartJobManager(max_workers=1)
+    manager.shutdown()
+    user_id = uuid4()
+
+    with pytest.raises(RuntimeError):
+        manager.submit(user_id, "s1", lambda progress: None)
+
+    manager._executor = ThreadPoolExecutor(max_workers=1)
+    job = _wait(
+        manager,
+        manager.submit(
+            user_id,
+            "s1",
+            lambda progress: WarmStartResponse(study_key="s1", scanned=0, added=0, skipped=0),
+        ).id,
+    )
+    assert job.status == JOB_COMPLETED
+    failed = [entry for entry in manager._jobs.values() if entry.status == JOB_FAILED]
+    assert [entry.error_code for entry in failed] == ["warm_start_failed"]
+    manager.shutdown()
+
+
+def test_warm_start_job_endpoints(client: TestClient) -> None:
+    token = auth_token(client, "jobs@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    submitted = client.post(
+        "/api/v1/optimisation/warm_start/jobs",
+        headers=headers,
+        json={"method_id": "aeropress", "variant_id": "aeropress_standard"},
+    )
+    assert submitted.status_code == 202
+    job_id = submitted.json()["id"]
+
+    job = _wait(client.app.state.warm_start_jobs, UUID(job_id))
+    assert job.status == JOB_COMPLETED
+
+    status = client.get(f"/api/v1/optimisation/warm_start/jobs/{job_id}", headers=headers)
+    assert status.status_code == 200
+    assert status.json()["status"] == "completed"
+    assert status.json()["scanned"] == 0
+
+    other = auth_token(client, "jobs-other@example.com")
+    hidden = client.get(
+        f"/api/v1/optimisation/warm_start/jobs/{job_id}",
+        headers={"Authorization": f"Bearer {other}"},
+    )
+    assert hidden.status_code == 404
+    assert hidden.json()["code"] == "warm_start_job_not_found"